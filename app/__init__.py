@@ -1,20 +1,35 @@
 import logging
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
 
+from app.config.database import dispose_async_engine, dispose_engine
 from app.ioc.container import Container
 from app.utils.exceptions_handlers.exceptions_handlers import (
     custom_app_exception_handler,
     global_exception_handler,
     validation_exception_handler,
 )
+from app.utils.enviroment import settings
 from app.utils.exceptions_handlers.models.error_response import AppException
+from app.utils.middlewares.medicion_sql import MedicionSqlMiddleware
 from app.routers.persona_router import persona_router
 from app.routers.familia_router import familia_router
 from app.routers.parcialidad_router import parcialidad_router
+from app.routers.import_job_router import import_job_router
+from app.routers.metricas_router import metricas_router
+from app.routers.health_router import health_router
+
+async def configurar_threadpool():
+    # Las rutas síncronas (y los managers con SQLAlchemy síncrono) se ejecutan
+    # en el threadpool de anyio; se acota a THREADPOOL_SIZE hilos concurrentes
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+
 
 def create_app() -> FastAPI:
-    app = FastAPI()
+    # orjson serializa las respuestas que se arman a partir de dicts
+    app = FastAPI(default_response_class=ORJSONResponse)
 
     # Crear el container
     container = Container()
@@ -23,6 +38,10 @@ def create_app() -> FastAPI:
         modules=["app.ioc.container"]
     )
     app.container = container
+    app.add_event_handler("startup", configurar_threadpool)
+    app.add_event_handler("shutdown", container.shutdown_resources)
+    app.add_event_handler("shutdown", dispose_async_engine)
+    app.add_event_handler("shutdown", dispose_engine)
 
     # Registrar excepciones
     app.add_exception_handler(AppException, custom_app_exception_handler)
@@ -30,11 +49,18 @@ def create_app() -> FastAPI:
                               validation_exception_handler)
     app.add_exception_handler(Exception, global_exception_handler)
 
+    # Conteo y tiempo de SQL por request
+    if settings.sql_metrics_enabled:
+        app.add_middleware(MedicionSqlMiddleware)
+
     # Registrar router
     routers = [
         persona_router,
         familia_router,
-        parcialidad_router
+        parcialidad_router,
+        import_job_router,
+        metricas_router,
+        health_router
     ]
     for router in routers:
         app.include_router(router, prefix="/ms-gestion-usuarios")
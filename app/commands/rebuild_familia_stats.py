@@ -0,0 +1,28 @@
+"""
+Recalcula desde cero la proyección FamiliaStats (crea la tabla si no existe).
+
+    python -m app.commands.rebuild_familia_stats
+"""
+import logging
+
+from app.config.database import SessionLocal, engine
+from app.persistence.model.familia_stats import FamiliaStats
+from app.persistence.repository.familia_stats_repository.impl.familia_stats_repository import FamiliaStatsRepository
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_familia_stats() -> int:
+    FamiliaStats.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        return FamiliaStatsRepository(db).rebuild()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    total = rebuild_familia_stats()
+    logger.info(f"[FamiliaStats] ✅ Proyección reconstruida | Familias: {total}")
@@ -0,0 +1,28 @@
+"""
+Llena desde cero el índice de búsqueda PersonaToken (crea la tabla si no existe).
+
+    python -m app.commands.rebuild_persona_tokens
+"""
+import logging
+
+from app.config.database import SessionLocal, engine
+from app.persistence.model.persona_token import PersonaToken
+from app.persistence.repository.persona_token_repository.impl.persona_token_repository import PersonaTokenRepository
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_persona_tokens() -> int:
+    PersonaToken.__table__.create(bind=engine, checkfirst=True)
+
+    db = SessionLocal()
+    try:
+        return PersonaTokenRepository(db).rebuild()
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    total = rebuild_persona_tokens()
+    logger.info(f"[PersonaToken] ✅ Índice de búsqueda reconstruido | Tokens: {total}")
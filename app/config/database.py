@@ -1,14 +1,33 @@
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from app.config.pool_metrics import AsyncQueuePoolMedido, QueuePoolMedido, instrumentar_pool
+from app.config.server import limites_pool
+from app.config.sql_metrics import instrumentar_sql
 from app.utils.enviroment import settings
 from sqlalchemy.orm import sessionmaker, declarative_base
+from starlette.concurrency import run_in_threadpool
+
+
+def opciones_pool() -> dict:
+    pool_size, max_overflow = limites_pool(settings)
+    return dict(
+        pool_pre_ping=settings.db_pool_pre_ping == "always",  # ✔️ SELECT 1 en cada checkout
+        pool_recycle=settings.db_pool_recycle,  # ✔️ Recrea conexiones con más de N segundos
+        pool_size=pool_size,                    # Tamaño del pool (por worker)
+        max_overflow=max_overflow,
+        pool_timeout=settings.db_pool_timeout,  # Espera máxima por una conexión libre
+    )
+
 
 # Configuración síncrona
 engine = create_engine(settings.database_url,
-                       pool_pre_ping=True,     # ✔️ Verifica que la conexión está viva antes de usarla
-                       pool_recycle=280,       # ✔️ Cierra y recrea conexiones inactivas después de N segundos
-                       pool_size=10,           # Tamaño del pool
-                       max_overflow=20,)
+                       poolclass=QueuePoolMedido,
+                       **opciones_pool())
+metricas_pool = instrumentar_pool(
+    engine, settings.db_pool_pre_ping, settings.db_pool_pre_ping_idle)
+if settings.sql_metrics_enabled:
+    instrumentar_sql(engine)
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
@@ -19,6 +38,43 @@ SessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+def async_database_url(url: str) -> str:
+    """Traduce la URL síncrona al driver async equivalente."""
+    drivers = {
+        "mysql+pymysql://": "mysql+asyncmy://",
+        "mysql://": "mysql+asyncmy://",
+        "sqlite://": "sqlite+aiosqlite://",
+    }
+    for sync_prefix, async_prefix in drivers.items():
+        if url.startswith(sync_prefix):
+            return async_prefix + url[len(sync_prefix):]
+    return url
+
+
+# Configuración asíncrona (solo se crea con DB_MODE=async)
+async_engine = None
+AsyncSessionLocal = None
+metricas_pool_async = None
+
+if settings.db_mode == "async":
+    async_engine = create_async_engine(
+        settings.database_async_url or async_database_url(settings.database_url),
+        poolclass=AsyncQueuePoolMedido,
+        **opciones_pool()
+    )
+    metricas_pool_async = instrumentar_pool(
+        async_engine.sync_engine, settings.db_pool_pre_ping, settings.db_pool_pre_ping_idle)
+    if settings.sql_metrics_enabled:
+        instrumentar_sql(async_engine.sync_engine)
+    # Sin expirar al hacer commit: los objetos se serializan fuera del greenlet
+    # de la sesión y un atributo expirado no se puede recargar ahí
+    AsyncSessionLocal = async_sessionmaker(
+        autoflush=False,
+        expire_on_commit=False,
+        bind=async_engine
+    )
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -28,3 +84,53 @@ def get_db():
         raise
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
+
+
+async def dispose_async_engine():
+    # Cierra las conexiones async; sin esto los hilos de aiosqlite/asyncmy
+    # mantienen vivo el proceso al apagar
+    if async_engine is not None:
+        await async_engine.dispose()
+
+
+def dispose_engine():
+    # Devuelve las conexiones del pool síncrono al apagar el worker, en lugar
+    # de dejarlas abiertas hasta que la base las cierre por timeout
+    engine.dispose()
+
+
+def resumen_pool(asincrono: bool = False) -> dict:
+    """Métricas y configuración efectiva del pool síncrono o del async"""
+    motor, metricas = ((async_engine.sync_engine, metricas_pool_async)
+                       if asincrono else (engine, metricas_pool))
+    pool_size, max_overflow = limites_pool(settings)
+    return {
+        **metricas.resumen(motor.pool),
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pre_ping": settings.db_pool_pre_ping,
+    }
+
+
+async def verificar_conexion() -> None:
+    """SELECT 1 con el engine que usan las rutas; lanza si la base no responde"""
+    if async_engine is not None:
+        async with async_engine.connect() as conexion:
+            await conexion.execute(text("SELECT 1"))
+        return
+
+    def ping():
+        with engine.connect() as conexion:
+            conexion.execute(text("SELECT 1"))
+
+    await run_in_threadpool(ping)
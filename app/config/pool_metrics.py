@@ -0,0 +1,132 @@
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+# Límites superiores (ms) de los buckets del histograma de checkout
+BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class MetricasPool:
+    """
+    Métricas de un pool de conexiones: cuánto tarda obtener una conexión
+    (espera en la cola + pre-ping), cuántas veces se agotó el timeout y
+    cuántas conexiones se abrieron o invalidaron.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets = [0] * (len(BUCKETS_MS) + 1)
+        self._checkouts = 0
+        self._espera_total = 0.0
+        self._espera_max = 0.0
+        self._contadores = {
+            "timeouts": 0,
+            "conexiones_abiertas": 0,
+            "conexiones_invalidadas": 0,
+            "pings_fallidos": 0,
+        }
+
+    def registrar_checkout(self, segundos: float) -> None:
+        ms = segundos * 1000
+        indice = next(
+            (i for i, limite in enumerate(BUCKETS_MS) if ms <= limite), len(BUCKETS_MS))
+        with self._lock:
+            self._buckets[indice] += 1
+            self._checkouts += 1
+            self._espera_total += segundos
+            self._espera_max = max(self._espera_max, segundos)
+
+    def sumar(self, contador: str) -> None:
+        with self._lock:
+            self._contadores[contador] += 1
+
+    def resumen(self, pool: Optional[Pool]) -> Dict[str, Any]:
+        with self._lock:
+            acumulado, histograma = 0, {}
+            for limite, cantidad in zip(BUCKETS_MS + ("+Inf",), self._buckets):
+                acumulado += cantidad
+                histograma[str(limite)] = acumulado
+            datos = {
+                "checkouts": self._checkouts,
+                "espera_total_ms": round(self._espera_total * 1000, 3),
+                "espera_promedio_ms": round(self._espera_total * 1000 / self._checkouts, 3)
+                if self._checkouts else 0.0,
+                "espera_max_ms": round(self._espera_max * 1000, 3),
+                **self._contadores,
+                "histograma_checkout_ms": histograma,
+            }
+        if isinstance(pool, QueuePool):
+            datos.update(
+                tamano=pool.size(),
+                en_uso=pool.checkedout(),
+                disponibles=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return datos
+
+
+class _PoolMedido:
+    """Mide Pool.connect(): espera por una conexión libre más el pre-ping."""
+    metricas: MetricasPool
+
+    def connect(self):
+        inicio = time.perf_counter()
+        try:
+            conexion = super().connect()
+        except exc.TimeoutError:
+            self.metricas.sumar("timeouts")
+            raise
+        self.metricas.registrar_checkout(time.perf_counter() - inicio)
+        return conexion
+
+    def recreate(self):
+        # engine.dispose() recrea el pool; las métricas se conservan
+        nuevo = super().recreate()
+        nuevo.metricas = self.metricas
+        return nuevo
+
+
+class QueuePoolMedido(_PoolMedido, QueuePool):
+    pass
+
+
+class AsyncQueuePoolMedido(_PoolMedido, AsyncAdaptedQueuePool):
+    pass
+
+
+def instrumentar_pool(engine, pre_ping: str, pre_ping_idle: float) -> MetricasPool:
+    """
+    Asocia MetricasPool al pool del engine y aplica la estrategia de pre-ping
+    "idle": solo se verifica la conexión si estuvo ociosa más de
+    pre_ping_idle segundos, en lugar de un SELECT 1 en cada checkout.
+    """
+    pool = engine.pool
+    metricas = MetricasPool()
+    pool.metricas = metricas
+
+    event.listen(pool, "connect", lambda *_: metricas.sumar("conexiones_abiertas"))
+    event.listen(pool, "invalidate", lambda *_: metricas.sumar("conexiones_invalidadas"))
+
+    if pre_ping == "idle":
+        @event.listens_for(pool, "checkin")
+        def _marcar_uso(dbapi_connection, registro):
+            registro.info["ultimo_uso"] = time.monotonic()
+
+        @event.listens_for(pool, "checkout")
+        def _ping_si_ociosa(dbapi_connection, registro, proxy):
+            ultimo_uso = registro.info.get("ultimo_uso")
+            if ultimo_uso is None or time.monotonic() - ultimo_uso < pre_ping_idle:
+                return
+            try:
+                cursor = dbapi_connection.cursor()
+                cursor.execute("SELECT 1")
+                cursor.close()
+            except Exception as e:
+                # El pool descarta esta conexión y reintenta con una nueva
+                metricas.sumar("pings_fallidos")
+                raise exc.DisconnectionError() from e
+
+    return metricas
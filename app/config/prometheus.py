@@ -0,0 +1,109 @@
+"""
+Formato de exposición de texto de Prometheus para las métricas que ya
+resume /metricas (SQL por ruta, pools, identity map y caché de lecturas).
+Los valores salen de los mismos resumen(); aquí solo se traducen a
+muestras con etiquetas, con los tiempos en segundos como pide la convención.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+PREFIJO = "gestion_usuarios_"
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+Muestra = Tuple[Dict[str, Any], float]
+
+
+def _escapar(valor: Any) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _numero(valor: float) -> str:
+    return format(valor, ".9g") if isinstance(valor, float) else str(valor)
+
+
+class Exposicion:
+    def __init__(self):
+        self._lineas: List[str] = []
+
+    def metrica(self, nombre: str, tipo: str, ayuda: str, muestras: Iterable[Muestra]) -> None:
+        nombre = PREFIJO + nombre
+        self._lineas.append(f"# HELP {nombre} {ayuda}")
+        self._lineas.append(f"# TYPE {nombre} {tipo}")
+        for etiquetas, valor in muestras:
+            self._muestra(nombre, etiquetas, valor)
+
+    def histograma(self, nombre: str, ayuda: str,
+                   series: Iterable[Tuple[Dict[str, Any], Dict[str, int], float, int]]) -> None:
+        """series: (etiquetas, conteo acumulado por límite en ms, suma en s, total)"""
+        nombre = PREFIJO + nombre
+        self._lineas.append(f"# HELP {nombre} {ayuda}")
+        self._lineas.append(f"# TYPE {nombre} histogram")
+        for etiquetas, acumulado_ms, suma, total in series:
+            for limite, cantidad in acumulado_ms.items():
+                le = limite if limite == "+Inf" else _numero(float(limite) / 1000)
+                self._muestra(f"{nombre}_bucket", {**etiquetas, "le": le}, cantidad)
+            self._muestra(f"{nombre}_sum", etiquetas, suma)
+            self._muestra(f"{nombre}_count", etiquetas, total)
+
+    def _muestra(self, nombre: str, etiquetas: Dict[str, Any], valor: float) -> None:
+        if etiquetas:
+            texto = ",".join(f'{clave}="{_escapar(v)}"' for clave, v in etiquetas.items())
+            nombre = f"{nombre}{{{texto}}}"
+        self._lineas.append(f"{nombre} {_numero(valor)}")
+
+    def texto(self) -> str:
+        return "\n".join(self._lineas) + "\n"
+
+
+def exposicion_prometheus(sql: Dict[str, Any],
+                          repositorio_get: Dict[str, Any],
+                          lecturas_cache: Dict[str, Any],
+                          pool: Dict[str, Any],
+                          pool_async: Optional[Dict[str, Any]] = None) -> str:
+    exposicion = Exposicion()
+
+    rutas = [({"method": r["metodo"], "route": r["ruta"]}, r) for r in sql["rutas"]]
+    exposicion.metrica("http_requests_total", "counter",
+                       "Requests HTTP medidos por ruta",
+                       ((e, r["requests"]) for e, r in rutas))
+    exposicion.metrica("sql_statements_total", "counter",
+                       "Sentencias SQL ejecutadas por ruta",
+                       ((e, r["sentencias"]) for e, r in rutas))
+    exposicion.metrica("sql_db_time_seconds_total", "counter",
+                       "Tiempo acumulado en la base por ruta",
+                       ((e, r["tiempo_db_ms"] / 1000) for e, r in rutas))
+    exposicion.metrica("sql_slowest_statement_seconds", "gauge",
+                       "Sentencia más lenta vista por ruta",
+                       ((e, r["sentencia_mas_lenta_ms"] / 1000) for e, r in rutas))
+    exposicion.metrica("sql_slow_queries_total", "counter",
+                       f"Sentencias sobre el umbral de {sql['umbral_consulta_lenta_ms']} ms",
+                       [({}, sql["consultas_lentas"])])
+
+    exposicion.metrica("repositorio_get_total", "counter",
+                       "Búsquedas por id del repositorio según cómo se resolvieron",
+                       [({"resultado": "identity_map"}, repositorio_get["aciertos_identity_map"]),
+                        ({"resultado": "negativo"}, repositorio_get["aciertos_negativos"]),
+                        ({"resultado": "base"}, repositorio_get["fallos"])])
+    exposicion.metrica("lecturas_cache_total", "counter",
+                       "Lecturas por id contra la caché entre requests",
+                       [({"backend": lecturas_cache["backend"], "resultado": resultado},
+                         lecturas_cache[resultado])
+                        for resultado in ("aciertos", "fallos", "errores")])
+
+    pools = [({"engine": "sync"}, pool)]
+    if pool_async is not None:
+        pools.append(({"engine": "async"}, pool_async))
+    exposicion.histograma(
+        "db_pool_checkout_seconds", "Espera por una conexión del pool (cola + pre-ping)",
+        ((e, p["histograma_checkout_ms"], p["espera_total_ms"] / 1000, p["checkouts"])
+         for e, p in pools))
+    for contador, ayuda in (("timeouts", "Checkouts que agotaron DB_POOL_TIMEOUT"),
+                            ("conexiones_abiertas", "Conexiones nuevas abiertas"),
+                            ("conexiones_invalidadas", "Conexiones descartadas por error"),
+                            ("pings_fallidos", "Pre-pings fallidos")):
+        exposicion.metrica(f"db_pool_{contador}_total", "counter", ayuda,
+                           ((e, p[contador]) for e, p in pools))
+    exposicion.metrica("db_pool_en_uso", "gauge", "Conexiones prestadas en este momento",
+                       ((e, p["en_uso"]) for e, p in pools if p.get("en_uso") is not None))
+    exposicion.metrica("db_pool_size", "gauge", "Tamaño configurado del pool",
+                       ((e, p["pool_size"]) for e, p in pools))
+    return exposicion.texto()
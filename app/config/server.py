@@ -0,0 +1,69 @@
+import importlib.util
+import os
+from typing import Any, Dict, Tuple
+
+from app.config.settings import Settings
+
+
+def workers_efectivos(settings: Settings) -> int:
+    if settings.server_mode != "prod":
+        return 1
+    return settings.web_workers or os.cpu_count() or 1
+
+
+def limites_pool(settings: Settings) -> Tuple[int, int]:
+    """
+    (pool_size, max_overflow) de cada engine en este worker. Sin
+    DB_CONNECTION_BUDGET se usan los valores configurados tal cual; con él,
+    el presupuesto se reparte entre los workers y, con DB_MODE=async, entre
+    los dos engines del worker (el async de las rutas y el síncrono de las
+    importaciones). Dentro de la cuota se respetan DB_POOL_SIZE y
+    DB_MAX_OVERFLOW como máximos.
+    """
+    if settings.db_connection_budget is None:
+        return settings.db_pool_size, settings.db_max_overflow
+
+    engines = 2 if settings.db_mode == "async" else 1
+    cuota = max(1, settings.db_connection_budget // (workers_efectivos(settings) * engines))
+    pool_size = min(settings.db_pool_size, cuota)
+    return pool_size, min(settings.db_max_overflow, cuota - pool_size)
+
+
+def validar_workers(settings: Settings) -> None:
+    """
+    Con varios workers cada proceso tiene su propia memoria: un job de
+    importación guardado en memoria solo lo conoce el worker que lo creó y
+    GET /import-jobs/{id} responde 404 desde los demás, así que se exige un
+    store compartido. El resolver de parcialidades y las cachés de
+    estadísticas y de lecturas (backend memory) también son por worker: las
+    escrituras solo las invalidan en el worker que las hizo y en los demás
+    quedan hasta su TTL (PARCIALIDAD_RESOLVER_TTL, ESTADISTICAS_TTL,
+    LECTURAS_CACHE_TTL, o LECTURAS_CACHE_BACKEND=redis para compartirla).
+    """
+    workers = workers_efectivos(settings)
+    if workers > 1 and settings.import_job_store == "memory":
+        raise ValueError(
+            f"IMPORT_JOB_STORE=memory no funciona con {workers} workers: "
+            "usar IMPORT_JOB_STORE=sqlite o WEB_WORKERS=1")
+
+
+def opciones_uvicorn(settings: Settings) -> Dict[str, Any]:
+    opciones: Dict[str, Any] = dict(
+        host="0.0.0.0",
+        port=int(settings.port),
+        factory=True,
+    )
+    if settings.server_mode != "prod":
+        return {**opciones, "reload": True}
+
+    validar_workers(settings)
+    # uvloop no existe en Windows (ver requirements.txt)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    return {
+        **opciones,
+        "reload": False,
+        "workers": workers_efectivos(settings),
+        "loop": loop,
+        "http": "httptools",
+        "timeout_graceful_shutdown": settings.graceful_shutdown_timeout,
+    }
@@ -1,3 +1,4 @@
+from typing import Optional
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -12,4 +13,58 @@ class Settings(BaseSettings):
     )
 
     port: int
-    database_url: str = Field(..., alias="DATABASE_URL")
\ No newline at end of file
+    database_url: str = Field(..., alias="DATABASE_URL")
+    db_mode: str = Field("sync", alias="DB_MODE")  # sync | async
+    # Si no se define se deriva de DATABASE_URL (pymysql → asyncmy)
+    database_async_url: Optional[str] = Field(None, alias="DATABASE_ASYNC_URL")
+    bulk_insert_chunk_size: int = Field(1000, alias="BULK_INSERT_CHUNK_SIZE")
+    upload_batch_size: int = Field(1000, alias="UPLOAD_BATCH_SIZE")
+    import_workers: int = Field(2, alias="IMPORT_WORKERS")
+    import_job_store: str = Field("memory", alias="IMPORT_JOB_STORE")  # memory | sqlite
+    import_job_sqlite_path: str = Field(
+        "import_jobs.db", alias="IMPORT_JOB_SQLITE_PATH")
+    # Trabajos terminados que conserva IMPORT_JOB_STORE=memory
+    import_job_ttl: int = Field(3600, alias="IMPORT_JOB_TTL")
+    import_job_max_terminados: int = Field(1000, alias="IMPORT_JOB_MAX_TERMINADOS")
+    threadpool_size: int = Field(40, alias="THREADPOOL_SIZE")
+    # exact | cached | estimate | none (estimate solo en listados sin filtros
+    # ni joins; las demás consultas usan cached)
+    pagination_count_strategy: str = Field(
+        "exact", alias="PAGINATION_COUNT_STRATEGY")
+    pagination_count_ttl: int = Field(30, alias="PAGINATION_COUNT_TTL")
+    estadisticas_ttl: int = Field(300, alias="ESTADISTICAS_TTL")
+    parcialidad_resolver_ttl: int = Field(
+        300, alias="PARCIALIDAD_RESOLVER_TTL")
+    # Caché de lecturas por id (persona, familia, resumen, parcialidad)
+    lecturas_cache_backend: str = Field(
+        "memory", alias="LECTURAS_CACHE_BACKEND")  # memory | redis | none
+    lecturas_cache_ttl: int = Field(60, alias="LECTURAS_CACHE_TTL")
+    lecturas_cache_maxsize: int = Field(10000, alias="LECTURAS_CACHE_MAXSIZE")
+    lecturas_cache_redis_url: Optional[str] = Field(
+        None, alias="LECTURAS_CACHE_REDIS_URL")
+    # Pool de conexiones (por worker de uvicorn)
+    db_pool_size: int = Field(10, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(20, alias="DB_MAX_OVERFLOW")
+    db_pool_recycle: int = Field(280, alias="DB_POOL_RECYCLE")
+    db_pool_timeout: float = Field(30, alias="DB_POOL_TIMEOUT")
+    # always: SELECT 1 en cada checkout | idle: solo si la conexión estuvo
+    # ociosa más de DB_POOL_PRE_PING_IDLE segundos | never
+    db_pool_pre_ping: str = Field("idle", alias="DB_POOL_PRE_PING")
+    db_pool_pre_ping_idle: float = Field(30, alias="DB_POOL_PRE_PING_IDLE")
+    # Servidor: dev = un proceso con recarga | prod = varios workers
+    server_mode: str = Field("dev", alias="SERVER_MODE")
+    # Workers de uvicorn en modo prod; si no se define, uno por CPU
+    web_workers: Optional[int] = Field(None, alias="WEB_WORKERS")
+    graceful_shutdown_timeout: int = Field(30, alias="GRACEFUL_SHUTDOWN_TIMEOUT")
+    # Conexiones totales a la base que puede abrir el servicio entre todos
+    # los workers; si se define, reparte DB_POOL_SIZE/DB_MAX_OVERFLOW
+    db_connection_budget: Optional[int] = Field(None, alias="DB_CONNECTION_BUDGET")
+    # Instrumentación SQL por request: sentencias, tiempo en base y la más lenta
+    sql_metrics_enabled: bool = Field(True, alias="SQL_METRICS_ENABLED")
+    # Cabeceras X-DB-* en las respuestas; si no se define, solo con SERVER_MODE=dev
+    sql_debug_headers: Optional[bool] = Field(None, alias="SQL_DEBUG_HEADERS")
+    # Una línea de log por request con sus contadores SQL
+    sql_log_requests: bool = Field(True, alias="SQL_LOG_REQUESTS")
+    # Sentencias que tardan al menos esto (ms) se registran con SQL y
+    # parámetros como consulta lenta; 0 lo desactiva
+    sql_slow_query_ms: float = Field(200, alias="SQL_SLOW_QUERY_MS")
@@ -0,0 +1,113 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import event
+
+from app.utils.enviroment import settings
+
+logger = logging.getLogger(__name__)
+
+# Largo máximo de los parámetros en el log de consultas lentas (executemany)
+_MAX_PARAMETROS_LOG = 2000
+
+
+class MedicionSql:
+    """Sentencias SQL y tiempo en base de un request"""
+
+    def __init__(self):
+        self.sentencias = 0
+        self.tiempo = 0.0
+        self.mas_lenta = 0.0
+
+    def registrar(self, segundos: float) -> None:
+        self.sentencias += 1
+        self.tiempo += segundos
+        self.mas_lenta = max(self.mas_lenta, segundos)
+
+
+# La fija el middleware por request; los hilos del threadpool y run_sync
+# heredan el contexto, así que las sentencias del manager caen en la misma
+medicion_actual: ContextVar[Optional[MedicionSql]] = ContextVar("medicion_sql", default=None)
+ruta_actual: ContextVar[Optional[str]] = ContextVar("ruta_sql", default=None)
+
+
+class MetricasSql:
+    """
+    Acumulado por ruta (método + plantilla de path) de los requests de este
+    worker: cuántos hubo, cuántas sentencias y cuánto tiempo en base sumaron
+    y la sentencia más lenta. Más el total de consultas lentas.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._rutas: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._consultas_lentas = 0
+
+    def registrar_request(self, metodo: str, ruta: str, medicion: MedicionSql) -> None:
+        with self._lock:
+            datos = self._rutas.setdefault((metodo, ruta), {
+                "requests": 0, "sentencias": 0, "tiempo_db": 0.0, "mas_lenta": 0.0})
+            datos["requests"] += 1
+            datos["sentencias"] += medicion.sentencias
+            datos["tiempo_db"] += medicion.tiempo
+            datos["mas_lenta"] = max(datos["mas_lenta"], medicion.mas_lenta)
+
+    def sumar_consulta_lenta(self) -> None:
+        with self._lock:
+            self._consultas_lentas += 1
+
+    def resumen(self) -> Dict[str, Any]:
+        with self._lock:
+            rutas = [
+                {
+                    "metodo": metodo,
+                    "ruta": ruta,
+                    "requests": int(datos["requests"]),
+                    "sentencias": int(datos["sentencias"]),
+                    "sentencias_promedio": round(datos["sentencias"] / datos["requests"], 2),
+                    "tiempo_db_ms": round(datos["tiempo_db"] * 1000, 3),
+                    "tiempo_db_promedio_ms": round(datos["tiempo_db"] * 1000 / datos["requests"], 3),
+                    "sentencia_mas_lenta_ms": round(datos["mas_lenta"] * 1000, 3),
+                }
+                for (metodo, ruta), datos in sorted(self._rutas.items())
+            ]
+            return {
+                "consultas_lentas": self._consultas_lentas,
+                "umbral_consulta_lenta_ms": settings.sql_slow_query_ms,
+                "rutas": rutas,
+            }
+
+
+metricas_sql = MetricasSql()
+
+
+def _antes(conn, cursor, sql, parametros, contexto, executemany):
+    contexto._inicio_medicion_sql = time.perf_counter()
+
+
+def _despues(conn, cursor, sql, parametros, contexto, executemany):
+    inicio = getattr(contexto, "_inicio_medicion_sql", None)
+    if inicio is None:
+        return
+    segundos = time.perf_counter() - inicio
+
+    medicion = medicion_actual.get()
+    if medicion is not None:
+        medicion.registrar(segundos)
+
+    umbral = settings.sql_slow_query_ms
+    if umbral and segundos * 1000 >= umbral:
+        metricas_sql.sumar_consulta_lenta()
+        logger.warning(
+            f"[SQL] 🐢 Consulta lenta | ms={segundos * 1000:.1f} "
+            f"ruta={ruta_actual.get() or '-'} | {' '.join(sql.split())} | "
+            f"parametros={repr(parametros)[:_MAX_PARAMETROS_LOG]}")
+
+
+def instrumentar_sql(engine) -> None:
+    """Mide cada sentencia del engine (sync, o el sync_engine de uno async)"""
+    event.listen(engine, "before_cursor_execute", _antes)
+    event.listen(engine, "after_cursor_execute", _despues)
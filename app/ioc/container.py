@@ -1,18 +1,81 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dependency_injector import containers, providers
 from dependency_injector.wiring import Provide, inject
 from fastapi import Depends
 from sqlalchemy.orm import Session
-from app.config.database import get_db
+from app.config.database import SessionLocal, get_async_db, get_db
+from app.persistence.job_store.impl.memory_job_store import MemoryJobStore
+from app.persistence.job_store.impl.sqlite_job_store import SqliteJobStore
+from app.persistence.model.enum import EnumTipoImportacion
 from app.persistence.repository.familia_repository.interface.interface_familia_repository import IFamiliaRepository
+from app.persistence.repository.familia_stats_repository.interface.interface_familia_stats_repository import IFamiliaStatsRepository
 from app.persistence.repository.miembro_familia_repository.interface.inteface_miembro_familia import IMiembroRepository
 from app.persistence.repository.parcialidad_repository.interface.interface_parcialidad_repository import IParcialiadRepository
+from app.persistence.repository.persona_token_repository.interface.interface_persona_token_repository import IPersonaTokenRepository
 from app.persistence.repository.persona_repository.interface.interface_persona_repository import IPersonaRepository
 from app.persistence.repository.repository_factory import RepositoryFactory
 from app.persistence.repository.user_repository.interface.interface_user_repository import IUsuarioRepository
+from app.persistence.unit_of_work import InvalidarAlConfirmar
+from app.services.estadisticas_cache import estadisticas_cache
 from app.services.familia_manager import FamiliaManager
+from app.services.import_job_manager import ImportJobManager
+from app.services.lecturas_cache import lecturas_cache
+from app.services.manager_runner import ManagerRunner
 from app.services.parcialidad_manager import ParcialidadManager
+from app.services.parcialidad_resolver import parcialidad_resolver
 from app.services.persona_manager import PersonaManager
+from app.utils.enviroment import settings
+
+
+# Las cachés de proceso se invalidan después del commit de la operación
+def build_persona_manager(db: Session, logger: logging.Logger) -> PersonaManager:
+    factory = RepositoryFactory(db=db)
+
+    return PersonaManager(
+        logger=logger,
+        usuario_repository=factory.get_repository(IUsuarioRepository),
+        persona_repository=factory.get_repository(IPersonaRepository),
+        familia_repository=factory.get_repository(IFamiliaRepository),
+        parcialidad_repository=factory.get_repository(IParcialiadRepository),
+        miembro_repository=factory.get_repository(IMiembroRepository),
+        familia_stats_repository=factory.get_repository(IFamiliaStatsRepository),
+        persona_token_repository=factory.get_repository(IPersonaTokenRepository),
+        estadisticas_cache=InvalidarAlConfirmar(estadisticas_cache, db),
+        parcialidad_resolver=InvalidarAlConfirmar(parcialidad_resolver, db),
+        lecturas_cache=InvalidarAlConfirmar(lecturas_cache, db)
+    )
+
+
+def build_familia_manager(db: Session, logger: logging.Logger) -> FamiliaManager:
+    factory = RepositoryFactory(db=db)
+    return FamiliaManager(
+        logger=logger,
+        familia_repository=factory.get_repository(IFamiliaRepository),
+        persona_repository=factory.get_repository(IPersonaRepository),
+        miembro_repository=factory.get_repository(IMiembroRepository),
+        familia_stats_repository=factory.get_repository(IFamiliaStatsRepository),
+        estadisticas_cache=InvalidarAlConfirmar(estadisticas_cache, db),
+        lecturas_cache=InvalidarAlConfirmar(lecturas_cache, db)
+    )
+
+
+def build_parcialidad_manager(db: Session, logger: logging.Logger) -> ParcialidadManager:
+    factory = RepositoryFactory(db=db)
+    return ParcialidadManager(
+        parcialidad_repository=factory.get_repository(IParcialiadRepository),
+        estadisticas_cache=InvalidarAlConfirmar(estadisticas_cache, db),
+        parcialidad_resolver=InvalidarAlConfirmar(parcialidad_resolver, db),
+        lecturas_cache=InvalidarAlConfirmar(lecturas_cache, db),
+        logger=logger
+    )
+
+
+def init_import_executor(max_workers: int):
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="import-job")
+    yield executor
+    executor.shutdown(wait=False, cancel_futures=True)
 
 
 class Container(containers.DeclarativeContainer):
@@ -21,22 +84,38 @@ class Container(containers.DeclarativeContainer):
 
     logger = providers.Singleton(logging.getLogger, __name__)
 
+    job_store = providers.Selector(
+        providers.Object(settings.import_job_store),
+        memory=providers.Singleton(
+            MemoryJobStore, ttl=settings.import_job_ttl,
+            maxsize=settings.import_job_max_terminados),
+        sqlite=providers.Singleton(
+            SqliteJobStore, path=settings.import_job_sqlite_path)
+    )
+
+    import_executor = providers.Resource(
+        init_import_executor, max_workers=settings.import_workers)
+
+    import_job_manager = providers.Singleton(
+        ImportJobManager,
+        job_store=job_store,
+        executor=import_executor,
+        session_factory=providers.Object(SessionLocal),
+        constructores=providers.Object({
+            EnumTipoImportacion.PERSONAS: build_persona_manager,
+            EnumTipoImportacion.FAMILIAS: build_familia_manager,
+            EnumTipoImportacion.PARCIALIDADES: build_parcialidad_manager,
+        }),
+        logger=logger
+    )
+
 
 @inject
 def get_persona_manager(
     db: Session = Depends(get_db),
     logger: logging.Logger = Depends(Provide[Container.logger]),
 ) -> PersonaManager:
-    factory = RepositoryFactory(db=db)
-
-    return PersonaManager(
-        logger=logger,
-        usuario_repository=factory.get_repository(IUsuarioRepository),
-        persona_repository=factory.get_repository(IPersonaRepository),
-        familia_repository=factory.get_repository(IFamiliaRepository),
-        parcialidad_repository=factory.get_repository(IParcialiadRepository),
-        miembro_repository=factory.get_repository(IMiembroRepository)
-    )
+    return build_persona_manager(db, logger)
 
 
 @inject
@@ -44,13 +123,7 @@ def get_familia_manager(
     db: Session = Depends(get_db),
     logger: logging.Logger = Depends(Provide[Container.logger])
 ) -> FamiliaManager:
-    factory = RepositoryFactory(db=db)
-    return FamiliaManager(
-        logger=logger,
-        familia_repository=factory.get_repository(IFamiliaRepository),
-        persona_repository=factory.get_repository(IPersonaRepository),
-        miembro_repository=factory.get_repository(IMiembroRepository)
-    )
+    return build_familia_manager(db, logger)
 
 
 @inject
@@ -58,8 +131,39 @@ def get_parcialidad_manager(
     db: Session = Depends(get_db),
     logger: logging.Logger = Depends(Provide[Container.logger])
 ) -> ParcialidadManager:
-    factory = RepositoryFactory(db=db)
-    return ParcialidadManager(
-        parcialidad_repository=factory.get_repository(IParcialiadRepository),
-        logger=logger
-    )
+    return build_parcialidad_manager(db, logger)
+
+
+# Sesión con la que se ejecutan los managers de las rutas async, según DB_MODE
+get_session = get_async_db if settings.db_mode == "async" else get_db
+
+
+@inject
+def get_persona_runner(
+    db=Depends(get_session),
+    logger: logging.Logger = Depends(Provide[Container.logger])
+) -> ManagerRunner[PersonaManager]:
+    return ManagerRunner(build_persona_manager, db, logger)
+
+
+@inject
+def get_familia_runner(
+    db=Depends(get_session),
+    logger: logging.Logger = Depends(Provide[Container.logger])
+) -> ManagerRunner[FamiliaManager]:
+    return ManagerRunner(build_familia_manager, db, logger)
+
+
+@inject
+def get_parcialidad_runner(
+    db=Depends(get_session),
+    logger: logging.Logger = Depends(Provide[Container.logger])
+) -> ManagerRunner[ParcialidadManager]:
+    return ManagerRunner(build_parcialidad_manager, db, logger)
+
+
+@inject
+def get_import_job_manager(
+    manager: ImportJobManager = Depends(Provide[Container.import_job_manager])
+) -> ImportJobManager:
+    return manager
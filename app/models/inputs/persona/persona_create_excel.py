@@ -16,6 +16,7 @@ class PersonaCreateExcel(BaseModel):
     direccion: str = Field(max_length=200)
     telefono: str = Field(max_length=20)
     parcialidad: str
+    idFamilia: Optional[int] = None  # Columna opcional del Excel
 
     class Config:
         from_attributes = True  # Para convertir entre SQLAlchemy y Pydantic fácilmente
@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel
+
+from app.models.inputs.persona.persona_carga_masiva import CargaMasivaResponse
+from app.persistence.model.enum import EnumEstadoImportacion, EnumTipoImportacion
+
+
+class ImportJobOut(BaseModel):
+    job_id: str
+    tipo: EnumTipoImportacion
+    estado: EnumEstadoImportacion
+    archivo: Optional[str] = None
+    filas_procesadas: int = 0
+    insertados: int = 0
+    errores: int = 0
+    mensaje: Optional[str] = None
+    resultado: Optional[CargaMasivaResponse] = None
+    fechaCreacion: datetime
+    fechaFin: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
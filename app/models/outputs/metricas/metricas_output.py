@@ -0,0 +1,74 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+class MetricasGetOut(BaseModel):
+    aciertos_identity_map: int
+    aciertos_negativos: int
+    fallos: int
+    consultas_evitadas: int
+    tasa_aciertos: float
+
+
+class MetricasLecturasCacheOut(BaseModel):
+    backend: str
+    aciertos: int
+    fallos: int
+    errores: int
+    tasa_aciertos: float
+
+
+class MetricasPoolOut(BaseModel):
+    checkouts: int
+    espera_total_ms: float
+    espera_promedio_ms: float
+    espera_max_ms: float
+    timeouts: int
+    conexiones_abiertas: int
+    conexiones_invalidadas: int
+    pings_fallidos: int
+    # Conteo acumulado por límite superior en ms ("+Inf" = total)
+    histograma_checkout_ms: Dict[str, int]
+    tamano: Optional[int] = None
+    en_uso: Optional[int] = None
+    disponibles: Optional[int] = None
+    overflow: Optional[int] = None
+    # Configuración efectiva, para dimensionar contra los workers
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    pre_ping: str
+
+
+class MetricasRutaSqlOut(BaseModel):
+    metodo: str
+    # Plantilla de la ruta (/personas/{persona_id})
+    ruta: str
+    requests: int
+    sentencias: int
+    sentencias_promedio: float
+    tiempo_db_ms: float
+    tiempo_db_promedio_ms: float
+    sentencia_mas_lenta_ms: float
+
+
+class MetricasSqlOut(BaseModel):
+    consultas_lentas: int
+    umbral_consulta_lenta_ms: float
+    rutas: List[MetricasRutaSqlOut]
+
+
+class MetricasOut(BaseModel):
+    repositorio_get: MetricasGetOut
+    lecturas_cache: MetricasLecturasCacheOut
+    pool: MetricasPoolOut
+    # Solo con DB_MODE=async: pool del engine async que usan las rutas
+    pool_async: Optional[MetricasPoolOut] = None
+    sql: MetricasSqlOut
+
+
+class HealthOut(BaseModel):
+    estado: str
+    base_datos: bool
+    mensaje: Optional[str] = None
+    pool: MetricasPoolOut
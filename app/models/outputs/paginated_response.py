@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 
 from app.models.outputs.familia.familia_output import FamiliaDataLeader, FamiliaOut
@@ -7,32 +7,43 @@ from app.models.outputs.persona.persona_output import PersonaFamiliaOut, Persona
 
 class PaginatedPersonas(BaseModel):
     total_items: int
+    # False si total_items es estimado o una cota inferior (PAGINATION_COUNT_STRATEGY)
+    total_items_exact: bool = True
     current_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     items: List[PersonaOut]
 
 class PaginatedFamilias(BaseModel):
     total_items: int
+    total_items_exact: bool = True
     current_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     items: List[FamiliaOut]
 
 class PaginatedDataLeader(BaseModel):
     total_items: int
+    total_items_exact: bool = True
     current_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     items: List[FamiliaDataLeader]
 
 class PaginatedParcialidad(BaseModel):
     total_items: int
+    total_items_exact: bool = True
     current_page: int
     total_pages: int
+    next_cursor: Optional[str] = None
     items: List[ParcialidadOut]
 
 class PaginatedPersonasFamilia(BaseModel):
     total_items: int
+    total_items_exact: bool = True
     total_pages: int
     current_page: int
+    next_cursor: Optional[str] = None
     items: List[PersonaFamiliaOut]
 
     class Config:
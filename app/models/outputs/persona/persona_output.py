@@ -1,5 +1,5 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, Optional
 from datetime import date
 from app.models.outputs.parcialidad.parcialidad_output import ParcialidadOut
 from app.persistence.model.enum import EnumDocumento, EnumEscolaridad, EnumParentesco, EnumSexo
@@ -44,6 +44,10 @@ class PersonaFamiliaOut(BaseModel):
 class EstadisticaGeneralOut(BaseModel):
     total_familias: int
     total_personas: int
+    personas_por_sexo: Dict[str, int] = {}
+    personas_por_escolaridad: Dict[str, int] = {}
+    personas_por_parcialidad: Dict[str, int] = {}
+    familias_por_estado: Dict[str, int] = {}
 
     class Config:
         from_attributes = True
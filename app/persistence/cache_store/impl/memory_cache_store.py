@@ -0,0 +1,24 @@
+from typing import Iterable, Optional
+from app.persistence.cache_store.interface.interface_cache_store import ICacheStore
+from app.utils.ttl_cache import TTLCache
+
+
+class MemoryCacheStore(ICacheStore):
+    """LRU con TTL en memoria del proceso; cada worker tiene la suya."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    def get(self, clave: str) -> Optional[str]:
+        return self._cache.get(clave)
+
+    def set(self, clave: str, valor: str) -> None:
+        self._cache.set(clave, valor)
+
+    def delete(self, claves: Iterable[str]) -> None:
+        for clave in claves:
+            self._cache.delete(clave)
+
+    def delete_prefix(self, prefijo: str) -> None:
+        self._cache.delete_where(
+            lambda clave: isinstance(clave, str) and clave.startswith(prefijo))
@@ -0,0 +1,41 @@
+from typing import Iterable, Optional
+from app.persistence.cache_store.interface.interface_cache_store import ICacheStore
+
+
+class RedisCacheStore(ICacheStore):
+    """
+    Caché compartida entre workers e instancias del servicio. El paquete redis
+    es opcional: solo se importa cuando se elige este backend.
+    """
+
+    def __init__(self, url: str, ttl: int, prefijo: str = "cmi-usuarios:"):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "LECTURAS_CACHE_BACKEND=redis requiere instalar el paquete 'redis'") from e
+        self._redis = redis.Redis.from_url(url, decode_responses=True)
+        self._ttl = ttl
+        self._prefijo = prefijo
+
+    def get(self, clave: str) -> Optional[str]:
+        return self._redis.get(self._prefijo + clave)
+
+    def set(self, clave: str, valor: str) -> None:
+        self._redis.set(self._prefijo + clave, valor, ex=self._ttl)
+
+    def delete(self, claves: Iterable[str]) -> None:
+        claves = [self._prefijo + clave for clave in claves]
+        if claves:
+            self._redis.delete(*claves)
+
+    def delete_prefix(self, prefijo: str) -> None:
+        patron = self._prefijo + prefijo + "*"
+        lote = []
+        for clave in self._redis.scan_iter(match=patron, count=500):
+            lote.append(clave)
+            if len(lote) >= 500:
+                self._redis.delete(*lote)
+                lote = []
+        if lote:
+            self._redis.delete(*lote)
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+
+class ICacheStore(ABC):
+    """Almacén clave → JSON de la caché de lecturas, con expiración por TTL."""
+
+    @abstractmethod
+    def get(self, clave: str) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def set(self, clave: str, valor: str) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, claves: Iterable[str]) -> None:
+        pass
+
+    @abstractmethod
+    def delete_prefix(self, prefijo: str) -> None:
+        """Elimina todas las claves que empiezan por el prefijo"""
@@ -0,0 +1,48 @@
+from threading import Lock
+from typing import Any, Dict, Optional
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.persistence.job_store.interface.interface_job_store import IJobStore
+from app.utils.ttl_cache import TTLCache
+
+
+class MemoryJobStore(IJobStore):
+    """
+    Estado de los trabajos en memoria del proceso (se pierde al reiniciar).
+    Los trabajos en curso se conservan siempre; los terminados (con fechaFin)
+    se consultan durante ttl segundos y se guardan como máximo maxsize, para
+    que el proceso no acumule todos los que corrió.
+    """
+
+    def __init__(self, ttl: float = 3600, maxsize: int = 1000):
+        self._jobs: Dict[str, ImportJobOut] = {}
+        self._terminados = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = Lock()
+
+    def create(self, job: ImportJobOut) -> ImportJobOut:
+        with self._lock:
+            self._guardar(job)
+        return job.model_copy()
+
+    def get(self, job_id: str) -> Optional[ImportJobOut]:
+        with self._lock:
+            job = self._buscar(job_id)
+            return job.model_copy() if job else None
+
+    def update(self, job_id: str, **cambios: Any) -> Optional[ImportJobOut]:
+        with self._lock:
+            job = self._buscar(job_id)
+            if job is None:
+                return None
+            job = job.model_copy(update=cambios)
+            self._guardar(job)
+            return job.model_copy()
+
+    def _buscar(self, job_id: str) -> Optional[ImportJobOut]:
+        return self._jobs.get(job_id) or self._terminados.get(job_id)
+
+    def _guardar(self, job: ImportJobOut) -> None:
+        if job.fechaFin is None:
+            self._jobs[job.job_id] = job
+        else:
+            self._jobs.pop(job.job_id, None)
+            self._terminados.set(job.job_id, job)
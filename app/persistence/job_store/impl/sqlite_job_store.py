@@ -0,0 +1,48 @@
+import sqlite3
+from threading import Lock
+from typing import Any, Optional
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.persistence.job_store.interface.interface_job_store import IJobStore
+
+
+class SqliteJobStore(IJobStore):
+    """Estado de los trabajos en un archivo SQLite, sobrevive a reinicios."""
+
+    def __init__(self, path: str):
+        self._lock = Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS import_job ("
+                "job_id TEXT PRIMARY KEY, data TEXT NOT NULL)"
+            )
+
+    def create(self, job: ImportJobOut) -> ImportJobOut:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO import_job (job_id, data) VALUES (?, ?)",
+                (job.job_id, job.model_dump_json())
+            )
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJobOut]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM import_job WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return ImportJobOut.model_validate_json(row[0]) if row else None
+
+    def update(self, job_id: str, **cambios: Any) -> Optional[ImportJobOut]:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT data FROM import_job WHERE job_id = ?", (job_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            job = ImportJobOut.model_validate_json(
+                row[0]).model_copy(update=cambios)
+            self._conn.execute(
+                "UPDATE import_job SET data = ? WHERE job_id = ?",
+                (job.model_dump_json(), job_id)
+            )
+        return job
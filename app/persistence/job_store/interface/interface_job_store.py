@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from typing import Any, Optional
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+
+
+class IJobStore(ABC):
+    """Almacén del estado de los trabajos de importación en segundo plano."""
+
+    @abstractmethod
+    def create(self, job: ImportJobOut) -> ImportJobOut:
+        pass
+
+    @abstractmethod
+    def get(self, job_id: str) -> Optional[ImportJobOut]:
+        pass
+
+    @abstractmethod
+    def update(self, job_id: str, **cambios: Any) -> Optional[ImportJobOut]:
+        pass
@@ -38,3 +38,16 @@ class EnumEscolaridad(Enum):
 class EnumEstadoFamilia(str, Enum):
     ACTIVA = "ACTIVA"
     INACTIVA = "INACTIVA"
+
+
+class EnumTipoImportacion(str, Enum):
+    PERSONAS = "PERSONAS"
+    FAMILIAS = "FAMILIAS"
+    PARCIALIDADES = "PARCIALIDADES"
+
+
+class EnumEstadoImportacion(str, Enum):
+    PENDIENTE = "PENDIENTE"
+    EN_PROCESO = "EN_PROCESO"
+    COMPLETADO = "COMPLETADO"
+    FALLIDO = "FALLIDO"
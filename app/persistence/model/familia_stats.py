@@ -0,0 +1,41 @@
+from sqlalchemy import TIMESTAMP, Column, ForeignKey, Integer, String, func
+from sqlalchemy.orm import synonym
+from app.config.database import Base
+
+
+class FamiliaStats(Base):
+    """
+    Proyección de los conteos de cada familia (miembros activos, vivos,
+    defunciones y líder actual). La mantienen los managers en cada escritura
+    y se reconstruye con app.commands.rebuild_familia_stats.
+    """
+    __tablename__ = 'FamiliaStats'
+
+    familiaId = Column(
+        Integer,
+        ForeignKey('Familia.id', ondelete="CASCADE"),
+        primary_key=True
+    )
+    # BaseRepository consulta por model.id
+    id = synonym("familiaId")
+
+    totalMiembros = Column(Integer, nullable=False, default=0, index=True)
+    miembrosActivos = Column(Integer, nullable=False, default=0)
+    defunciones = Column(Integer, nullable=False, default=0)
+
+    liderId = Column(String(255), nullable=True)
+    liderParcialidadId = Column(Integer, nullable=True, index=True)
+
+    fechaActualizacion = Column(
+        TIMESTAMP,
+        nullable=False,
+        server_default=func.now()
+    )
+
+    def __repr__(self):
+        return (
+            f"<FamiliaStats("
+            f"familiaId={self.familiaId}, "
+            f"totalMiembros={self.totalMiembros}, "
+            f"liderId={self.liderId})>"
+        )
@@ -1,10 +1,19 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, BigInteger
+from sqlalchemy import Column, Computed, Index, Integer, String, Boolean, ForeignKey, BigInteger
 from sqlalchemy.orm import relationship
 from app.config.database import Base
 
 
 class MiembroFamilia(Base):
     __tablename__ = 'MiembroFamilia'
+    __table_args__ = (
+        # Líder y miembros activos de una familia (get_lider_familia, resúmenes)
+        Index("ix_miembrofamilia_familia_activo_rep",
+              "familiaId", "activo", "esRepresentante"),
+        # Membresía actual de una persona (listados, get_familias_actuales)
+        Index("ix_miembrofamilia_persona_activo", "personaId", "activo"),
+        # Único sobre personaId solo entre membresías activas
+        Index("ux_miembrofamilia_persona_activa", "personaActivaId", unique=True),
+    )
 
     id = Column(BigInteger, primary_key=True, autoincrement=True)
 
@@ -24,6 +33,14 @@ class MiembroFamilia(Base):
 
     esRepresentante = Column(Boolean, nullable=False, default=False)
 
+    # personaId mientras la membresía está activa, NULL si no. MySQL no tiene
+    # índices parciales: el único sobre esta columna generada permite una sola
+    # familia activa por persona y cualquier cantidad de inactivas
+    personaActivaId = Column(
+        String(255),
+        Computed("CASE WHEN activo THEN personaId END", persisted=False)
+    )
+
     # Relaciones
     persona = relationship(
         "Persona",
@@ -1,9 +1,13 @@
-from sqlalchemy import  Column, String, Integer
+from sqlalchemy import  Column, Index, String, Integer
 from app.config.database import Base
 from sqlalchemy.orm import relationship
 
 class Parcialidad(Base):
     __tablename__ = 'Parcialidad'
+    __table_args__ = (
+        # find_by_names y filtros por nombre exacto
+        Index("ix_parcialidad_nombre", "nombre"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     nombre = Column(String(100))  # Puedes ajustar el tamaño si lo sabes
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, String, Integer, Date, ForeignKey
+from sqlalchemy import Column, Enum, Index, String, Integer, Date, ForeignKey
 from sqlalchemy.orm import relationship
 from app.config.database import Base
 from app.persistence.model.enum import (
@@ -8,6 +8,10 @@ from app.persistence.model.enum import (
 
 class Persona(Base):
     __tablename__ = 'Persona'
+    __table_args__ = (
+        # Filtro por parcialidad en listados y búsquedas de familias
+        Index("ix_persona_parcialidad", "idParcialidad"),
+    )
 
     id = Column(String(255), primary_key=True)
     tipoDocumento = Column(Enum(EnumDocumento))
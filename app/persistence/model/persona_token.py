@@ -0,0 +1,23 @@
+from sqlalchemy import Column, ForeignKey, String
+from app.config.database import Base
+
+
+class PersonaToken(Base):
+    """
+    Índice de búsqueda de personas: una fila por palabra normalizada (sin
+    tildes, en minúsculas) de nombre, apellido y cédula. La llave primaria
+    empieza por token, así las búsquedas token LIKE 'abc%' usan el índice.
+    """
+    __tablename__ = 'PersonaToken'
+
+    token = Column(String(100), primary_key=True)
+
+    personaId = Column(
+        String(255),
+        ForeignKey('Persona.id', ondelete="CASCADE"),
+        primary_key=True,
+        index=True
+    )
+
+    def __repr__(self):
+        return f"<PersonaToken(token={self.token}, personaId={self.personaId})>"
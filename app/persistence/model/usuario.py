@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Enum, String, ForeignKey
+from sqlalchemy import Column, Enum, Index, String, ForeignKey
 from sqlalchemy.orm import relationship
 from app.config.database import Base
 from app.persistence.model.codigo_recuperacion import CodigoRecuperacion
@@ -7,6 +7,9 @@ from app.persistence.model.persona import Persona
 
 class Usuario(Base):
     __tablename__ = 'Usuario'
+    __table_args__ = (
+        Index("ix_usuario_persona", "personaId"),
+    )
     
     email = Column(String(100), primary_key=True)
     password = Column(String(200))
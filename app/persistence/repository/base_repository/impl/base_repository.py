@@ -1,16 +1,70 @@
 import math
-from typing import Generic, TypeVar, Optional, List, Type, Union
+from typing import Callable, Generic, Iterable, Set, TypeVar, Optional, List, Type, Union
 from pydantic import BaseModel
 from typing import Dict, Any, Type
+from sqlalchemy import Table, event
 from sqlalchemy.orm import Session
 from sqlalchemy.orm.decl_api import DeclarativeMeta  # tipo de modelos Base
 
+from app.persistence.repository.base_repository.impl.identity_cache import buscar_por_id
 from app.persistence.repository.base_repository.interface.ibase_repository import IBaseRepository
+from app.persistence.unit_of_work import transaccion
+from app.utils.enviroment import settings
+from app.utils.exceptions_handlers.models.error_response import AppException
+from app.utils.ttl_cache import TTLCache
+from app.utils.util_functions import decode_cursor, encode_cursor
 
 T = TypeVar('T', bound=BaseModel)
 M = TypeVar('M')  # Tipo para el modelo SQLAlchemy
 ID = TypeVar('ID')
 
+# Conteos de paginación por firma de consulta (estrategia "cached")
+cache_conteos = TTLCache(maxsize=512, ttl=settings.pagination_count_ttl)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidar_conteos(session: Session) -> None:
+    # Cualquier escritura confirmada puede cambiar los totales
+    cache_conteos.clear()
+
+
+def clave_conteo(stmt) -> tuple:
+    """Firma de una consulta (SQL + parámetros) para cachear su conteo."""
+    compilado = stmt.order_by(None).compile()
+    return (str(compilado), repr(sorted(compilado.params.items())))
+
+
+def estimable(stmt) -> bool:
+    """
+    El EXPLAIN solo sirve como total de un listado de una tabla sin filtros:
+    con joins, WHERE, GROUP BY o DISTINCT las filas estimadas de la tabla que
+    guía el plan no dicen cuántas coinciden.
+    """
+    froms = stmt.get_final_froms()
+    return (len(froms) == 1 and isinstance(froms[0], Table)
+            and stmt.whereclause is None
+            and not stmt._group_by_clauses and not stmt._distinct)
+
+
+def estimar_filas(session: Session, stmt) -> Optional[int]:
+    """
+    Filas estimadas por el optimizador (EXPLAIN) para la tabla que guía la
+    consulta; no recorre los datos. Solo disponible en MySQL y solo es un
+    total válido para consultas estimable().
+    """
+    dialecto = session.get_bind().dialect
+    if dialecto.name != "mysql":
+        return None
+    compilado = stmt.order_by(None).compile(
+        dialect=dialecto, compile_kwargs={"render_postcompile": True})
+    plan = (
+        session.connection()
+        .exec_driver_sql(f"EXPLAIN {compilado.string}", compilado.params)
+        .mappings()
+        .first()
+    )
+    return int(plan["rows"]) if plan and plan["rows"] is not None else None
+
 
 class BaseRepository(IBaseRepository[T, ID], Generic[T, M, ID]):
     def __init__(self, model: Type[M], db: Session):
@@ -18,29 +72,44 @@ class BaseRepository(IBaseRepository[T, ID], Generic[T, M, ID]):
         self.db = db
 
     def _commit_with_handling(self):
-        try:
-            self.db.flush()
-            self.db.commit()
-        except:
-            self.db.rollback()
-            raise
+        # Dentro de una UnitOfWork solo hace flush; fuera confirma en el acto
+        with transaccion(self.db):
+            pass
 
-    def _commit_and_refresh(self, db_obj: M):
-        try:
-            self.db.flush()
-            self.db.commit()
+    def _commit_and_refresh(self, db_obj: M, refrescar: bool = False):
+        # El flush ya asigna la llave autoincremental y los atributos expirados
+        # se recargan al leerlos; el SELECT inmediato queda para quien lo pida
+        self._commit_with_handling()
+        if refrescar:
             self.db.refresh(db_obj)
-        except:
-            self.db.rollback()
-            raise
 
     def get(self, id: ID) -> Optional[M]:
-        return self.db.query(self.model).filter(self.model.id == id).first()
+        # Identity map de la sesión y caché negativa antes de ir a SQL
+        return buscar_por_id(self.db, self.model, id)
+
+    def get_existing_ids(self, ids: Iterable[ID], chunk_size: int = 1000) -> Set[ID]:
+        """
+        Resuelve en lote qué ids existen, con consultas IN (...) por bloques
+        en lugar de un get() por registro.
+        """
+        ids = list({id for id in ids if id is not None})
+        existentes: Set[ID] = set()
+
+        for inicio in range(0, len(ids), chunk_size):
+            bloque = ids[inicio:inicio + chunk_size]
+            rows = (
+                self.db.query(self.model.id)
+                .filter(self.model.id.in_(bloque))
+                .all()
+            )
+            existentes.update(row[0] for row in rows)
+
+        return existentes
 
     def get_all(self, skip: int = 0, limit: int = 100) -> List[M]:
         return self.db.query(self.model).offset(skip).limit(limit).all()
 
-    def create(self, obj_in: Union[T, M]) -> M:
+    def create(self, obj_in: Union[T, M], refrescar: bool = False) -> M:
         if isinstance(obj_in, self.model):
             db_obj = obj_in  # Ya es una instancia SQLAlchemy
         else:
@@ -53,10 +122,10 @@ class BaseRepository(IBaseRepository[T, ID], Generic[T, M, ID]):
                     "El objeto no es ni instancia del modelo ni un esquema Pydantic.")
 
         self.db.add(db_obj)
-        self._commit_and_refresh(db_obj)
+        self._commit_and_refresh(db_obj, refrescar)
         return db_obj
 
-    def update(self, id: ID, obj_in: Union[BaseModel, M]) -> Optional[M]:
+    def update(self, id: ID, obj_in: Union[BaseModel, M], refrescar: bool = False) -> Optional[M]:
         db_obj = self.get(id)
         if db_obj is None:
             return None
@@ -74,7 +143,7 @@ class BaseRepository(IBaseRepository[T, ID], Generic[T, M, ID]):
         for key, value in obj_data.items():
             setattr(db_obj, key, value)
 
-        self._commit_and_refresh(db_obj)
+        self._commit_and_refresh(db_obj, refrescar)
         return db_obj
 
     def delete(self, id: ID) -> bool:
@@ -85,23 +154,78 @@ class BaseRepository(IBaseRepository[T, ID], Generic[T, M, ID]):
         self._commit_with_handling()
         return True
 
-    def paginate(self, page: int = 1, page_size: int = 10, query=None) -> dict:
-
+    def paginate(self, page: int = 1, page_size: int = 10, query=None,
+                 cursor: Optional[str] = None, key_column=None,
+                 key_of: Optional[Callable[[Any], Any]] = None,
+                 conteo: Optional[str] = None) -> dict:
+        """
+        Pagina por page/page_size (OFFSET) o, si se envía cursor, por llave:
+        WHERE key_column > última llave vista, sin recorrer las filas saltadas.
+        La query debe venir ordenada por key_column. En ambos modos se devuelve
+        next_cursor para continuar desde el último elemento de la página.
+
+        conteo define cómo se obtiene total_items (por defecto
+        PAGINATION_COUNT_STRATEGY): exact, cached, estimate o none. estimate
+        solo aplica a listados de una tabla sin filtros; las demás consultas
+        usan cached.
+        """
         # Usa la query personalizada o la query base
         query = query or self.db.query(self.model)
+        key_column = key_column if key_column is not None else self.model.id
+        key_of = key_of or (lambda item: item.id)
+        conteo = conteo or settings.pagination_count_strategy
+        if conteo == "estimate" and not estimable(query.statement):
+            conteo = "cached"
+        skip = (page - 1) * page_size
 
-        total_items = query.order_by(None).count()
+        if cursor:
+            pagina = query.filter(key_column > self._decode_cursor(cursor))
+        else:
+            pagina = query.offset(skip)
+
+        # Se pide un elemento extra para saber si hay página siguiente
+        items = pagina.limit(page_size + 1).all()
+        hay_siguiente = len(items) > page_size
+        items = items[:page_size]
+        next_cursor = encode_cursor(key_of(items[-1])) if hay_siguiente else None
+
+        total_items = self._contar(query, conteo)
+        exacto = total_items is not None and conteo != "estimate"
+        if total_items is None:
+            # Sin conteo: cota inferior a partir de la página actual
+            total_items = skip + len(items) + (1 if hay_siguiente else 0)
         total_pages = math.ceil(total_items / page_size) if page_size else 1
-        skip = (page - 1) * page_size
-        items = query.offset(skip).limit(page_size).all()
 
         return {
             "total_items": total_items,
+            "total_items_exact": exacto,
             "total_pages": total_pages,
             "current_page": page,
+            "next_cursor": next_cursor,
             "items": items
         }
 
+    def _contar(self, query, conteo: str) -> Optional[int]:
+        if conteo == "none":
+            return None
+        if conteo == "estimate":
+            return estimar_filas(self.db, query.statement)
+        if conteo == "cached":
+            clave = clave_conteo(query.statement)
+            total = cache_conteos.get(clave)
+            if total is None:
+                total = query.order_by(None).count()
+                cache_conteos.set(clave, total)
+            return total
+        return query.order_by(None).count()
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> Any:
+        try:
+            return decode_cursor(cursor)
+        except Exception:
+            raise AppException("Cursor de paginación inválido", 400)
+
     def apply_filters(self,
                       session: Session,
                       model: Type[DeclarativeMeta],
@@ -0,0 +1,15 @@
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.util import AliasedClass
+
+from app.persistence.model.persona import Persona
+
+
+def con_parcialidad(query, *personas: type[Persona] | AliasedClass):
+    """
+    Carga la parcialidad de cada entidad Persona (o alias) de la consulta en el
+    mismo SELECT. Evita el lazy load por fila al construir PersonaOut, de modo
+    que los listados hacen un número constante de consultas.
+    """
+    for persona in personas or (Persona,):
+        query = query.options(joinedload(persona.parcialidad))
+    return query
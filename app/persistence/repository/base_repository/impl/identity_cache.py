@@ -0,0 +1,97 @@
+import threading
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import ORMExecuteState, Session
+
+_NO_ENCONTRADOS = "get_no_encontrados"
+
+
+class ContadoresGet:
+    """
+    Contadores de BaseRepository.get para todo el proceso: cuántas búsquedas
+    se resolvieron desde el identity map de la sesión, cuántas desde la caché
+    negativa (ids que ya se sabe que no existen) y cuántas fueron a SQL.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._valores = {"identity_map": 0, "negativos": 0, "sql": 0}
+
+    def sumar(self, origen: str) -> None:
+        with self._lock:
+            self._valores[origen] += 1
+
+    def resumen(self) -> Dict[str, Any]:
+        with self._lock:
+            valores = dict(self._valores)
+        aciertos = valores["identity_map"] + valores["negativos"]
+        total = aciertos + valores["sql"]
+        return {
+            "aciertos_identity_map": valores["identity_map"],
+            "aciertos_negativos": valores["negativos"],
+            "fallos": valores["sql"],
+            "consultas_evitadas": aciertos,
+            "tasa_aciertos": round(aciertos / total, 4) if total else 0.0,
+        }
+
+    def reiniciar(self) -> None:
+        with self._lock:
+            for origen in self._valores:
+                self._valores[origen] = 0
+
+
+contadores_get = ContadoresGet()
+
+
+def buscar_por_id(db: Session, model: Type[Any], id: Any) -> Optional[Any]:
+    """
+    Session.get con caché negativa por sesión. Si la fila ya está cargada (y no
+    expirada) en el identity map se devuelve sin SQL; si un get anterior de la
+    misma sesión no la encontró, tampoco se vuelve a consultar.
+    """
+    resuelto, obj = desde_cache(db, model, id)
+    if resuelto:
+        return obj
+    return registrar(db, model, id, db.get(model, id))
+
+
+def desde_cache(db: Session, model: Type[Any], id: Any) -> Tuple[bool, Optional[Any]]:
+    """(True, objeto) si el get se resuelve sin SQL; (False, None) si hay que consultar"""
+    if id is None:
+        return True, None
+
+    if (model, id) in db.info.get(_NO_ENCONTRADOS, ()):
+        contadores_get.sumar("negativos")
+        return True, None
+
+    cargado = db.identity_map.get(db.identity_key(model, id))
+    if cargado is not None and not inspect(cargado).expired:
+        contadores_get.sumar("identity_map")
+        return True, cargado
+
+    contadores_get.sumar("sql")
+    return False, None
+
+
+def registrar(db: Session, model: Type[Any], id: Any, obj: Optional[Any]) -> Optional[Any]:
+    if obj is None:
+        db.info.setdefault(_NO_ENCONTRADOS, set()).add((model, id))
+    return obj
+
+
+def _olvidar_no_encontrados(session: Session) -> None:
+    session.info.pop(_NO_ENCONTRADOS, None)
+
+
+# Cualquier escritura o fin de transacción puede crear las filas que faltaban
+event.listen(Session, "after_flush", lambda session, contexto: _olvidar_no_encontrados(session))
+event.listen(Session, "after_commit", _olvidar_no_encontrados)
+event.listen(Session, "after_rollback", _olvidar_no_encontrados)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _escritura_directa(estado: ORMExecuteState) -> None:
+    # INSERT/UPDATE/DELETE ejecutados con session.execute no pasan por flush
+    if not estado.is_select:
+        _olvidar_no_encontrados(estado.session)
@@ -0,0 +1,79 @@
+"""
+Lectura por proyección para los listados: en lugar de cargar entidades ORM
+(identity map, instrumentación de atributos, relaciones) y copiarlas a los
+modelos de salida, se seleccionan solo las columnas que esos modelos exponen
+y cada fila liviana se convierte directo con model_construct. Los valores
+vienen de columnas tipadas, así que no hace falta volver a validarlos.
+"""
+from typing import Any, List, Optional
+
+from sqlalchemy.orm.util import AliasedClass
+
+from app.models.outputs.familia.familia_output import FamiliaOut
+from app.models.outputs.parcialidad.parcialidad_output import ParcialidadOut
+from app.models.outputs.persona.persona_output import PersonaOut
+from app.persistence.model.familia import Familia
+from app.persistence.model.parcialidad import Parcialidad
+from app.persistence.model.persona import Persona
+
+# Columnas de Persona que expone PersonaOut (idFamilia y parcialidad aparte)
+CAMPOS_PERSONA = (
+    "id", "tipoDocumento", "nombre", "apellido", "fechaNacimiento", "parentesco",
+    "sexo", "profesion", "escolaridad", "direccion", "telefono", "fechaDefuncion",
+)
+
+PREFIJO_REPRESENTANTE = "representante_"
+
+
+def columnas_persona(persona: type[Persona] | AliasedClass = Persona,
+                     parcialidad: type[Parcialidad] | AliasedClass = Parcialidad,
+                     prefijo: str = "") -> List[Any]:
+    """Columnas etiquetadas para persona_out; requiere unir_parcialidad"""
+    return [getattr(persona, campo).label(prefijo + campo) for campo in CAMPOS_PERSONA] + [
+        parcialidad.id.label(prefijo + "parcialidad_id"),
+        parcialidad.nombre.label(prefijo + "parcialidad_nombre"),
+    ]
+
+
+def unir_parcialidad(query,
+                     persona: type[Persona] | AliasedClass = Persona,
+                     parcialidad: type[Parcialidad] | AliasedClass = Parcialidad):
+    return query.outerjoin(parcialidad, parcialidad.id == persona.idParcialidad)
+
+
+def persona_out(fila, prefijo: str = "", idFamilia: Optional[int] = None) -> Optional[PersonaOut]:
+    """PersonaOut desde una fila de columnas_persona; None si la persona no vino (outer join)"""
+    valores = fila._mapping
+    if valores[prefijo + "id"] is None:
+        return None
+
+    parcialidad_id = valores[prefijo + "parcialidad_id"]
+    return PersonaOut.model_construct(
+        **{campo: valores[prefijo + campo] for campo in CAMPOS_PERSONA},
+        idFamilia=idFamilia,
+        parcialidad=ParcialidadOut.model_construct(
+            id=parcialidad_id, nombre=valores[prefijo + "parcialidad_nombre"])
+        if parcialidad_id is not None else None,
+    )
+
+
+def columnas_familia(representante: type[Persona] | AliasedClass,
+                     parcialidad: type[Parcialidad] | AliasedClass = Parcialidad) -> List[Any]:
+    """Columnas de Familia más las del representante, para familia_out"""
+    return [
+        Familia.id.label("id"),
+        Familia.estado.label("estado"),
+        Familia.fechaCreacion.label("fechaCreacion"),
+        *columnas_persona(representante, parcialidad, PREFIJO_REPRESENTANTE),
+    ]
+
+
+def familia_out(fila) -> FamiliaOut:
+    representante = persona_out(fila, PREFIJO_REPRESENTANTE)
+    return FamiliaOut.model_construct(
+        id=fila.id,
+        representanteId=representante.id if representante else None,
+        estado=fila.estado,
+        fechaCreacion=fila.fechaCreacion,
+        representante=representante,
+    )
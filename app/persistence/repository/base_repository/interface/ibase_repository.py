@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Generic, TypeVar, Optional, List, Union
+from typing import Any, Callable, Dict, Generic, Iterable, Set, TypeVar, Optional, List, Union
 from pydantic import BaseModel
 
 T = TypeVar('T', bound=BaseModel)
@@ -15,11 +15,11 @@ class IBaseRepository(ABC, Generic[T, ID]):
         pass
     
     @abstractmethod
-    def create(self, obj_in: T) -> T:
-        pass
+    def create(self, obj_in: T, refrescar: bool = False) -> T:
+        """refrescar=True recarga los valores generados por la base (p. ej. server_default)"""
     
     @abstractmethod
-    def update(self, id: ID, obj_in: T) -> Optional[T]:
+    def update(self, id: ID, obj_in: T, refrescar: bool = False) -> Optional[T]:
         pass
     
     @abstractmethod
@@ -27,5 +27,12 @@ class IBaseRepository(ABC, Generic[T, ID]):
         pass
     
     @abstractmethod
-    def paginate(self, page: int = 1, page_size: int = 10, query=None) -> Dict[str, Union[int, List[M]]]:
-        """Devuelve un diccionario con los campos: total_items, total_pages, current_page, items"""
+    def get_existing_ids(self, ids: Iterable[ID]) -> Set[ID]:
+        """Devuelve el subconjunto de ids que ya existen en base de datos"""
+
+    @abstractmethod
+    def paginate(self, page: int = 1, page_size: int = 10, query=None,
+                 cursor: Optional[str] = None, key_column=None,
+                 key_of: Optional[Callable[[Any], Any]] = None,
+                 conteo: Optional[str] = None) -> Dict[str, Union[int, bool, str, List[M]]]:
+        """Devuelve un diccionario con los campos: total_items, total_items_exact, total_pages, current_page, next_cursor, items"""
@@ -1,15 +1,20 @@
+from collections import Counter
 from typing import List, Optional
-from sqlalchemy import and_, or_, func, text, case
-from sqlalchemy.orm import Session, aliased, joinedload
+from sqlalchemy import and_, func, text, case
+from sqlalchemy.orm import Session, aliased
 from app.models.inputs.familia.familia_create import FamiliaCreate
-from app.models.outputs.familia.familia_output import FamiliaDataLeader, FamiliaOut, FamiliaResumenOut
-from app.models.outputs.persona.persona_output import PersonaFamiliaOut, PersonaOut
+from app.models.outputs.familia.familia_output import FamiliaOut, FamiliaResumenOut
+from app.models.outputs.persona.persona_output import PersonaOut
 from app.persistence.model.enum import EnumEstadoFamilia
 from app.persistence.model.familia import Familia
+from app.persistence.model.familia_stats import FamiliaStats
 from app.persistence.model.miembro_familia import MiembroFamilia
 from app.persistence.model.parcialidad import Parcialidad
 from app.persistence.model.persona import Persona
 from app.persistence.repository.base_repository.impl.base_repository import BaseRepository
+from app.persistence.repository.base_repository.impl.eager_loading import con_parcialidad
+from app.persistence.repository.base_repository.impl.proyecciones import columnas_familia, familia_out, unir_parcialidad
+from app.persistence.repository.persona_token_repository.impl.persona_token_repository import coincide_busqueda
 from app.persistence.repository.familia_repository.interface.interface_familia_repository import IFamiliaRepository
 from app.utils.exceptions_handlers.models.error_response import AppException
 
@@ -22,9 +27,11 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
     def get_familia_by_id(self, id_familia: int) -> FamiliaOut:
         representante = aliased(Persona)
 
-        # Query principal
-        familia = (
-            self.db.query(Familia)
+        # Una sola consulta: familia + representante activo + su parcialidad.
+        # El representante y su parcialidad llegan cargados en la misma fila,
+        # sin recorrer familia.miembros ni disparar lazy loads.
+        fila = (
+            self.db.query(Familia, representante)
             .outerjoin(
                 MiembroFamilia,
                 and_(
@@ -38,35 +45,28 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
                 representante.id == MiembroFamilia.personaId
             )
             .filter(Familia.id == id_familia)
-            .first()
         )
+        fila = con_parcialidad(fila, representante).first()
 
-        if not familia:
+        if not fila:
             return None
 
-        # Obtener el miembro líder activo
-        miembro_lider = next(
-            (m for m in familia.miembros if m.esRepresentante and m.activo), None
-        )
-
-        representante_id = miembro_lider.personaId if miembro_lider else None
-        persona_obj = PersonaOut.from_orm(
-            miembro_lider.persona) if miembro_lider else None
-
+        familia, persona = fila
         return FamiliaOut(
             id=familia.id,
             estado=familia.estado,
             fechaCreacion=familia.fechaCreacion,
-            representanteId=representante_id,
-            representante=persona_obj,
+            representanteId=persona.id if persona else None,
+            representante=PersonaOut.from_orm(persona) if persona else None,
         )
 
-    def get_familias_con_lider(self, page: int, page_size: int):
+    def get_familias_con_lider(self, page: int, page_size: int, cursor: Optional[str] = None):
         representante = aliased(Persona)
 
-        # Query: solo trae familias y representante activo
+        # Query: solo trae familias y representante activo, por proyección
         query = (
-            self.db.query(Familia, MiembroFamilia, representante)
+            self.db.query(*columnas_familia(representante))
+            .select_from(Familia)
             .outerjoin(
                 MiembroFamilia,
                 (MiembroFamilia.familiaId == Familia.id) &
@@ -79,27 +79,13 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
             )
             .order_by(Familia.id)
         )
+        query = unir_parcialidad(query, representante)
 
         # Paginar resultados
-        result = self.paginate(query=query, page=page, page_size=page_size)
-
-        items = []
-        for familia, miembro, persona in result['items']:
-            familia_out = FamiliaOut(
-                id=familia.id,
-                estado=familia.estado,
-                fechaCreacion=familia.fechaCreacion,
-                representanteId=persona.id if persona else None,
-                representante=PersonaOut.from_orm(persona) if persona else None
-            )
-            items.append(familia_out)
-
-        return {
-            "total_items": result['total_items'],
-            "current_page": result['current_page'],
-            "total_pages": result['total_pages'],
-            "items": items
-        }
+        result = self.paginate(query=query, page=page, page_size=page_size,
+                               cursor=cursor)
+        result["items"] = [familia_out(fila) for fila in result["items"]]
+        return result
 
     def bulk_insert(self, familias: List[FamiliaCreate]) -> int:
         for familia in familias:
@@ -115,7 +101,8 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
         query: str,
         parcialidad_id: int | None = None,
         rango_miembros: str | None = None,
-        estado: EnumEstadoFamilia | None = None
+        estado: EnumEstadoFamilia | None = None,
+        cursor: str | None = None
     ):
         query_str = query.strip() if query else ""
 
@@ -123,9 +110,10 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
         representante = aliased(Persona)
         miembro_rep = aliased(MiembroFamilia)
 
-        # Base query: familias + representante activo
+        # Base query: familias + representante activo, por proyección
         base_query = (
-            self.db.query(Familia, miembro_rep, representante)
+            self.db.query(*columnas_familia(representante))
+            .select_from(Familia)
             .outerjoin(
                 miembro_rep,
                 (miembro_rep.familiaId == Familia.id) &
@@ -139,17 +127,10 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
         )
 
         # --- FILTRO POR QUERY ---
+        # Prefijos de palabra sobre el índice PersonaToken (sin tildes)
         if query_str:
-            like_query = f"%{query_str}%"
             base_query = base_query.filter(
-                or_(
-                    representante.id.like(like_query),
-                    func.lower(representante.nombre).like(
-                        func.lower(like_query)),
-                    func.lower(representante.apellido).like(
-                        func.lower(like_query))
-                )
-            )
+                coincide_busqueda(representante.id, query_str))
 
         # --- FILTRO POR PARCIALIDAD ---
         if parcialidad_id is not None:
@@ -161,62 +142,36 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
             base_query = base_query.filter(Familia.estado == estado)
 
         # --- FILTRO POR CANTIDAD DE MIEMBROS ---
+        # Conteo precalculado en FamiliaStats (búsqueda por índice)
         if rango_miembros:
-            subq = (
-                self.db.query(
-                    MiembroFamilia.familiaId.label("fam_id"),
-                    func.count(MiembroFamilia.id).label("num_miembros")
-                )
-                .group_by(MiembroFamilia.familiaId)
-                .subquery()
-            )
-            base_query = base_query.outerjoin(
-                subq, subq.c.fam_id == Familia.id)
+            base_query = base_query.join(
+                FamiliaStats, FamiliaStats.familiaId == Familia.id)
 
             if rango_miembros == "1-3":
                 base_query = base_query.filter(
-                    subq.c.num_miembros.between(1, 3))
+                    FamiliaStats.totalMiembros.between(1, 3))
             elif rango_miembros == "4-6":
                 base_query = base_query.filter(
-                    subq.c.num_miembros.between(4, 6))
+                    FamiliaStats.totalMiembros.between(4, 6))
             elif rango_miembros == "7+":
-                base_query = base_query.filter(subq.c.num_miembros >= 7)
+                base_query = base_query.filter(FamiliaStats.totalMiembros >= 7)
 
         # Orden
-        base_query = base_query.order_by(Familia.id)
+        base_query = unir_parcialidad(base_query.order_by(Familia.id), representante)
 
         # Ejecutar paginación
         result = self.paginate(
-            query=base_query, page=page, page_size=page_size)
-
-        # Mapear a Pydantic dentro de la sesión
-        items = []
-        for familia, miembro, persona in result['items']:
-            familia_out = FamiliaOut(
-                id=familia.id,
-                estado=familia.estado,
-                fechaCreacion=familia.fechaCreacion,
-                representanteId=persona.id if persona else None,
-                representante=PersonaOut.from_orm(persona) if persona else None
-            )
-            items.append(familia_out)
-
-        return {
-            "total_items": result['total_items'],
-            "current_page": result['current_page'],
-            "total_pages": result['total_pages'],
-            "items": items
-        }
+            query=base_query, page=page, page_size=page_size, cursor=cursor)
+        result["items"] = [familia_out(fila) for fila in result["items"]]
+        return result
 
-    def get_familias_dashboard(self, page: int, page_size: int):
+    def get_familias_dashboard(self, page: int, page_size: int, cursor: Optional[str] = None):
         """
         Consulta familias con su líder y parcialidad, usando paginate()
-        y luego convierte los resultados a FamiliaDataLeader.
+        con columnas etiquetadas como los campos de FamiliaDataLeader.
+        El número de miembros y el líder salen de FamiliaStats, sin agrupar.
         """
-        # Aliases
         lider = aliased(Persona)
-        miembro = aliased(Persona)
-        miembro_familia = aliased(MiembroFamilia)
 
         # Query principal
         query = (
@@ -226,61 +181,24 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
                 lider.apellido.label("lider_apellido"),
                 lider.id.label("cedula"),
                 Parcialidad.nombre.label("parcialidad"),
-                func.count(miembro.id).label("miembros"),
+                FamiliaStats.totalMiembros.label("miembros"),
                 Familia.fechaCreacion.label("fechaCreacion"),
                 Familia.estado.label("estado")
-
-            )
-            # LÍDER: unir solo MiembroFamilia activo y representante
-            .join(
-                miembro_familia,
-                (miembro_familia.familiaId == Familia.id) &
-                (miembro_familia.esRepresentante == 1) &
-                (miembro_familia.activo == 1)
             )
-            .join(lider, lider.id == miembro_familia.personaId)
+            .join(FamiliaStats, FamiliaStats.familiaId == Familia.id)
+            # LÍDER actual según la proyección
+            .join(lider, lider.id == FamiliaStats.liderId)
             # PARCIALIDAD del líder
-            .outerjoin(Parcialidad, Parcialidad.id == lider.idParcialidad)
-            # CONTAR MIEMBROS
-            .outerjoin(
-                MiembroFamilia,
-                (MiembroFamilia.familiaId == Familia.id) &
-                (MiembroFamilia.activo == 1)
-            )
-            .outerjoin(miembro, miembro.id == MiembroFamilia.personaId)
-            .group_by(
-                Familia.id,
-                lider.nombre,
-                lider.apellido,
-                lider.id,
-                Parcialidad.nombre,
-                Familia.estado
-            )
+            .outerjoin(Parcialidad, Parcialidad.id == FamiliaStats.liderParcialidadId)
             .order_by(Familia.id)
         )
 
-        # Ejecutar paginación
-        result = self.paginate(page, page_size, query)
-
-        # Mapear a Pydantic
-        result["items"] = [
-            FamiliaDataLeader(
-                id=row.id,
-                lider_nombre=row.lider_nombre,
-                lider_apellido=row.lider_apellido,
-                cedula=row.cedula,
-                parcialidad=row.parcialidad,
-                miembros=row.miembros,
-                fechaCreacion=row.fechaCreacion,
-                estado=row.estado.value if hasattr(
-                    row.estado, "value") else row.estado
-            )
-            for row in result["items"]
-        ]
-
-        return result
+        # Las filas ya traen las columnas con los nombres de FamiliaDataLeader;
+        # se validan una sola vez al armar la página (PaginatedDataLeader)
+        return self.paginate(page, page_size, query, cursor=cursor)
 
-    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool):
+    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool,
+                            cursor: Optional[str] = None):
         """
         Devuelve los miembros de una familia con información detallada:
         nombre, parentesco, parcialidad, cédula, edad y estado (ACTIVO/FALLECIDO).
@@ -317,68 +235,39 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
 
         # 🔍 Búsqueda flexible
         if query:
-            q = q.filter(
-                or_(
-                    miembro.nombre.ilike(f"%{query}%"),
-                    miembro.apellido.ilike(f"%{query}%"),
-                    miembro.id.like(f"%{query}%")
-                )
-            )
+            q = q.filter(coincide_busqueda(miembro.id, query))
         if vivos is True:
              q = q.filter(miembro.fechaDefuncion.is_(None))
 
-        # 🔹 Paginación
-        result = self.paginate(page, page_size, q)
-
-        # 🔹 Mapeo a modelo Pydantic
-        result["items"] = [
-            PersonaFamiliaOut(
-                id=row.id,
-                nombre=row.nombre,
-                apellido=row.apellido,
-                parentesco=row.parentesco,
-                parcialidad=row.parcialidad,
-                cedula=row.cedula,
-                edad=row.edad,
-                estado=row.estado
-            )
-            for row in result["items"]
-        ]
-
-        return result
+        # 🔹 Paginación (por cédula, para poder continuar con cursor)
+        q = q.order_by(miembro.id)
+        # 🔹 Las filas se validan como PersonaFamiliaOut al armar la página
+        return self.paginate(page, page_size, q,
+                             cursor=cursor, key_column=miembro.id)
 
     def get_familia_resumen(self, id_familia: int) -> FamiliaResumenOut:
         """
         Devuelve un resumen con los datos principales de una familia.
         Incluye líder, parcialidad, total de miembros, miembros activos y defunciones.
         """
-        # Aliases
         representante = aliased(Persona)
-        miembro = aliased(Persona)
-        miembro_familia = aliased(MiembroFamilia)
 
+        # Lectura directa de FamiliaStats por llave primaria
         query = (
             self.db.query(
                 Familia.id.label("id"),
                 func.concat(representante.nombre, " ",
                             representante.apellido).label("lider_familia"),
                 Parcialidad.nombre.label("parcialidad"),
-                func.count(miembro.id).label("total_miembros"),
-                func.sum(func.if_(miembro.fechaDefuncion.is_(
-                    None), 1, 0)).label("miembros_activos"),
-                func.sum(func.if_(miembro.fechaDefuncion.isnot(
-                    None), 1, 0)).label("defunciones"),
+                FamiliaStats.totalMiembros.label("total_miembros"),
+                FamiliaStats.miembrosActivos.label("miembros_activos"),
+                FamiliaStats.defunciones.label("defunciones"),
                 Familia.fechaCreacion.label("fechaCreacion")
             )
-            # Unimos al representante a través de MiembroFamilia
-            .join(MiembroFamilia, (MiembroFamilia.familiaId == Familia.id) & (MiembroFamilia.esRepresentante == True))
-            .join(representante, representante.id == MiembroFamilia.personaId)
-            # Contamos todos los miembros
-            .outerjoin(miembro_familia, miembro_familia.familiaId == Familia.id)
-            .outerjoin(miembro, miembro.id == miembro_familia.personaId)
-            .outerjoin(Parcialidad, Parcialidad.id == representante.idParcialidad)
+            .join(FamiliaStats, FamiliaStats.familiaId == Familia.id)
+            .join(representante, representante.id == FamiliaStats.liderId)
+            .outerjoin(Parcialidad, Parcialidad.id == FamiliaStats.liderParcialidadId)
             .filter(Familia.id == id_familia)
-            .group_by(Familia.id, representante.nombre, representante.apellido, Parcialidad.nombre)
         )
 
         result = query.first()
@@ -397,12 +286,46 @@ class FamiliaRepository(BaseRepository, IFamiliaRepository):
 
     def get_estadisticas_generales(self) -> dict:
         """
-        Devuelve el total de familias y el total de personas registradas.
+        Devuelve el total de familias y personas con sus desgloses por sexo,
+        escolaridad, parcialidad y estado. Usa dos consultas agrupadas.
         """
-        total_familias = self.db.query(func.count(Familia.id)).scalar() or 0
-        total_personas = self.db.query(func.count(Persona.id)).scalar() or 0
+        personas = (
+            self.db.query(
+                Persona.sexo,
+                Persona.escolaridad,
+                Parcialidad.nombre,
+                func.count(Persona.id)
+            )
+            .outerjoin(Parcialidad, Parcialidad.id == Persona.idParcialidad)
+            .group_by(Persona.sexo, Persona.escolaridad, Parcialidad.nombre)
+            .all()
+        )
+        familias = (
+            self.db.query(Familia.estado, func.count(Familia.id))
+            .group_by(Familia.estado)
+            .all()
+        )
+
+        por_sexo, por_escolaridad, por_parcialidad = Counter(), Counter(), Counter()
+        for sexo, escolaridad, parcialidad, total in personas:
+            por_sexo[_clave_estadistica(sexo)] += total
+            por_escolaridad[_clave_estadistica(escolaridad)] += total
+            por_parcialidad[_clave_estadistica(parcialidad)] += total
+
+        familias_por_estado = {
+            _clave_estadistica(estado): total for estado, total in familias}
 
         return {
-            "total_familias": total_familias,
-            "total_personas": total_personas
+            "total_familias": sum(familias_por_estado.values()),
+            "total_personas": sum(por_sexo.values()),
+            "personas_por_sexo": dict(por_sexo),
+            "personas_por_escolaridad": dict(por_escolaridad),
+            "personas_por_parcialidad": dict(por_parcialidad),
+            "familias_por_estado": familias_por_estado
         }
+
+
+def _clave_estadistica(valor) -> str:
+    if valor is None:
+        return "SIN_DATO"
+    return valor.value if hasattr(valor, "value") else str(valor)
@@ -14,7 +14,8 @@ class IFamiliaRepository(IBaseRepository[Familia, int], ABC):
     def get_familias_con_lider(
         self,
         page: int,
-        page_size: int
+        page_size: int,
+        cursor: Optional[str] = None
     ):
         pass
 
@@ -27,11 +28,12 @@ class IFamiliaRepository(IBaseRepository[Familia, int], ABC):
         pass
 
     @abstractmethod
-    def get_familias_dashboard(self, page: int, page_size: int):
+    def get_familias_dashboard(self, page: int, page_size: int, cursor: Optional[str] = None):
         pass
 
     @abstractmethod
-    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool):
+    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool,
+                            cursor: Optional[str] = None):
         pass
 
     @abstractmethod
@@ -50,7 +52,8 @@ class IFamiliaRepository(IBaseRepository[Familia, int], ABC):
             query: str,
             parcialidad_id: int | None = None,
             rango_miembros: str | None = None,
-            estado: EnumEstadoFamilia | None = None):
+            estado: EnumEstadoFamilia | None = None,
+            cursor: str | None = None):
         pass
     @abstractmethod
     def get_familia_by_id(self, id_familia: int) -> FamiliaOut:
@@ -0,0 +1,82 @@
+from typing import Iterable, Optional
+from sqlalchemy import case, delete, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from app.persistence.model.familia import Familia
+from app.persistence.model.familia_stats import FamiliaStats
+from app.persistence.model.miembro_familia import MiembroFamilia
+from app.persistence.model.persona import Persona
+from app.persistence.repository.base_repository.impl.base_repository import BaseRepository
+from app.persistence.unit_of_work import en_unidad_de_trabajo, transaccion
+from app.persistence.repository.familia_stats_repository.interface.interface_familia_stats_repository import IFamiliaStatsRepository
+
+
+class FamiliaStatsRepository(BaseRepository, IFamiliaStatsRepository):
+    def __init__(self, db: Session):
+        super().__init__(FamiliaStats, db)
+
+    def refresh(self, familia_ids: Iterable[int]) -> None:
+        ids = list({id for id in familia_ids if id is not None})
+        if not ids:
+            return
+        # Dos refrescos concurrentes de la misma familia pueden chocar en la
+        # llave primaria; el segundo intento ya ve la fila del otro borrada.
+        # Dentro de una UnitOfWork no se reintenta: el rollback es de ella
+        for intento in range(2):
+            try:
+                with transaccion(self.db):
+                    self.db.execute(
+                        delete(FamiliaStats).where(FamiliaStats.familiaId.in_(ids)))
+                    self._insertar_desde_agregado(ids)
+                return
+            except IntegrityError:
+                if intento or en_unidad_de_trabajo(self.db):
+                    raise
+
+    def rebuild(self) -> int:
+        with transaccion(self.db):
+            self.db.execute(delete(FamiliaStats))
+            self._insertar_desde_agregado(None)
+        return self.db.query(func.count(FamiliaStats.familiaId)).scalar() or 0
+
+    def _insertar_desde_agregado(self, familia_ids: Optional[list]) -> None:
+        """
+        INSERT ... SELECT con los conteos de miembros activos de cada familia,
+        calculados en la base de datos en una sola sentencia.
+        """
+        es_lider = MiembroFamilia.esRepresentante == True
+        vivo = Persona.id.isnot(None) & Persona.fechaDefuncion.is_(None)
+        agregado = (
+            select(
+                Familia.id,
+                func.count(Persona.id),
+                func.coalesce(func.sum(case((vivo, 1), else_=0)), 0),
+                func.coalesce(func.sum(case((Persona.fechaDefuncion.isnot(None), 1), else_=0)), 0),
+                func.max(case((es_lider, Persona.id))),
+                func.max(case((es_lider, Persona.idParcialidad))),
+            )
+            .select_from(Familia)
+            .outerjoin(
+                MiembroFamilia,
+                (MiembroFamilia.familiaId == Familia.id) &
+                (MiembroFamilia.activo == True)
+            )
+            .outerjoin(Persona, Persona.id == MiembroFamilia.personaId)
+            .group_by(Familia.id)
+        )
+        if familia_ids is not None:
+            agregado = agregado.where(Familia.id.in_(familia_ids))
+
+        self.db.execute(
+            insert(FamiliaStats).from_select(
+                [
+                    FamiliaStats.familiaId,
+                    FamiliaStats.totalMiembros,
+                    FamiliaStats.miembrosActivos,
+                    FamiliaStats.defunciones,
+                    FamiliaStats.liderId,
+                    FamiliaStats.liderParcialidadId,
+                ],
+                agregado
+            )
+        )
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from typing import Iterable
+from app.persistence.model.familia_stats import FamiliaStats
+from app.persistence.repository.base_repository.interface.ibase_repository import IBaseRepository
+
+
+class IFamiliaStatsRepository(IBaseRepository[FamiliaStats, int], ABC):
+    @abstractmethod
+    def refresh(self, familia_ids: Iterable[int]) -> None:
+        """Recalcula la proyección solo para las familias indicadas"""
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """Recalcula la proyección completa; devuelve el número de familias"""
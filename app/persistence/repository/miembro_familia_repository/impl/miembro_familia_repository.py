@@ -1,9 +1,10 @@
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import exists
+from sqlalchemy import delete, insert
 from app.persistence.model.miembro_familia import MiembroFamilia
 from app.persistence.model.persona import Persona
 from app.persistence.repository.base_repository.impl.base_repository import BaseRepository
+from app.persistence.unit_of_work import transaccion
 from app.persistence.repository.miembro_familia_repository.interface.inteface_miembro_familia import IMiembroRepository
 
 
@@ -41,4 +42,39 @@ class MiembroRepository(BaseRepository, IMiembroRepository):
                 MiembroFamilia.activo.is_(True)
             )
             .one_or_none()
-        )
\ No newline at end of file
+        )
+
+    def get_familias_actuales(self, persona_ids: Iterable[str],
+                              chunk_size: int = 1000) -> Dict[str, MiembroFamilia]:
+        ids = list({id for id in persona_ids if id is not None})
+        actuales: Dict[str, MiembroFamilia] = {}
+
+        for inicio in range(0, len(ids), chunk_size):
+            miembros = (
+                self.db.query(MiembroFamilia)
+                .filter(MiembroFamilia.personaId.in_(ids[inicio:inicio + chunk_size]))
+                .order_by(MiembroFamilia.id)
+                .all()
+            )
+            # Igual que get_familia_actual: la primera membresía de la persona
+            for miembro in miembros:
+                actuales.setdefault(miembro.personaId, miembro)
+
+        return actuales
+
+    def reasignar(self, miembro_ids: List[int], persona_ids: List[str], familia_id: int) -> None:
+        with transaccion(self.db):
+            if miembro_ids:
+                self.db.execute(
+                    delete(MiembroFamilia)
+                    .where(MiembroFamilia.id.in_(miembro_ids))
+                )
+            if persona_ids:
+                self.db.execute(
+                    insert(MiembroFamilia),
+                    [
+                        {"personaId": persona_id, "familiaId": familia_id,
+                         "activo": True, "esRepresentante": False}
+                        for persona_id in persona_ids
+                    ]
+                )
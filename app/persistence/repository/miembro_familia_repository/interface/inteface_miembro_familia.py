@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, List, Optional
 from app.persistence.model.miembro_familia import MiembroFamilia
 from app.persistence.model.persona import Persona
 from app.persistence.repository.base_repository.interface.ibase_repository import IBaseRepository
@@ -17,3 +17,12 @@ class IMiembroRepository(IBaseRepository[MiembroFamilia, int], ABC):
     @abstractmethod
     def get_lider_familia(self, familia_id: int) -> Optional[MiembroFamilia]:
         pass
+
+
+    @abstractmethod
+    def get_familias_actuales(self, persona_ids: Iterable[str]) -> Dict[str, MiembroFamilia]:
+        """Membresía actual de cada persona, resuelta en lote"""
+
+    @abstractmethod
+    def reasignar(self, miembro_ids: List[int], persona_ids: List[str], familia_id: int) -> None:
+        """Borra las membresías indicadas y crea las nuevas en una sola transacción"""
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from sqlalchemy.orm import Session
 from sqlalchemy import func
 from app.persistence.model.parcialidad import Parcialidad
@@ -18,11 +18,12 @@ class ParcialidadRepository(BaseRepository, IParcialiadRepository):
             .first()
         )
 
-    def find_by_params(self, page: int, page_size: int, filters: Dict[str, Any]):
+    def find_by_params(self, page: int, page_size: int, filters: Dict[str, Any], cursor: Optional[str] = None):
         query = (
             self.apply_filters(self.db, Parcialidad, filters)
+            .order_by(Parcialidad.id)
         )
-        return self.paginate(page, page_size, query)
+        return self.paginate(page, page_size, query, cursor=cursor)
 
     def bulk_insert(self, parcialidades) -> int:
         for parcialidad in parcialidades:
@@ -50,3 +51,8 @@ class ParcialidadRepository(BaseRepository, IParcialiadRepository):
             .all()
         )
 
+    def find_all_nombres(self) -> List[Tuple[int, str]]:
+        return [
+            (row.id, row.nombre)
+            for row in self.db.query(Parcialidad.id, Parcialidad.nombre).all()
+        ]
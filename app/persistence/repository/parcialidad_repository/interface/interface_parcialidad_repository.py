@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 from app.models.outputs.paginated_response import PaginatedParcialidad
 from app.persistence.model.parcialidad import Parcialidad
 from app.persistence.repository.base_repository.interface.ibase_repository import IBaseRepository
@@ -12,7 +12,7 @@ class IParcialiadRepository(IBaseRepository[Parcialidad, int], ABC):
         pass
 
     @abstractmethod
-    def find_by_params(self, page: int, page_size: int, filters: Dict[str, Any]) -> PaginatedParcialidad:
+    def find_by_params(self, page: int, page_size: int, filters: Dict[str, Any], cursor: Optional[str] = None) -> PaginatedParcialidad:
         pass
 
     @abstractmethod
@@ -25,4 +25,8 @@ class IParcialiadRepository(IBaseRepository[Parcialidad, int], ABC):
     
     @abstractmethod
     def find_by_names(self, names: List[str]) -> List[Parcialidad]:
-        pass
\ No newline at end of file
+        pass
+
+    @abstractmethod
+    def find_all_nombres(self) -> List[Tuple[int, str]]:
+        """(id, nombre) de todas las parcialidades, para ParcialidadResolver"""
@@ -1,13 +1,17 @@
-from typing import Any, Dict, List
-from sqlalchemy import and_
-from sqlalchemy.orm import Session, joinedload
+from typing import Any, Dict, List, Optional
+from sqlalchemy import and_, insert
+from sqlalchemy.orm import Session
 from app.models.inputs.persona.persona_create import PersonaCreate
 from app.models.outputs.persona.persona_output import PersonaOut
 from app.persistence.model.miembro_familia import MiembroFamilia
-from app.persistence.model.parcialidad import Parcialidad
 from app.persistence.model.persona import Persona
 from app.persistence.repository.base_repository.impl.base_repository import BaseRepository
+from app.persistence.repository.base_repository.impl.eager_loading import con_parcialidad
+from app.persistence.repository.base_repository.impl.proyecciones import columnas_persona, persona_out, unir_parcialidad
 from app.persistence.repository.persona_repository.interface.interface_persona_repository import IPersonaRepository
+from app.persistence.unit_of_work import transaccion
+from app.utils.enviroment import settings
+from app.utils.exceptions_handlers.models.error_response import BulkInsertError
 
 
 class PersonaRepository(BaseRepository, IPersonaRepository):
@@ -21,11 +25,15 @@ class PersonaRepository(BaseRepository, IPersonaRepository):
             .count()
         )
 
-    def find_all_personas(self, page: int, page_size: int, filters: Dict[str, Any]):
+    def find_all_personas(self, page: int, page_size: int, filters: Dict[str, Any], cursor: Optional[str] = None):
 
         id_familia = filters.pop("idFamilia", None)
 
-        query = self.apply_filters(self.db, Persona, filters)
+        # Solo las columnas de PersonaOut, sin cargar entidades Persona
+        query = (
+            self.apply_filters(self.db, Persona, filters)
+            .with_entities(*columnas_persona())
+        )
 
         if id_familia:
             query = query.join(
@@ -45,26 +53,22 @@ class PersonaRepository(BaseRepository, IPersonaRepository):
                 )
             )
 
-        query = (
+        query = unir_parcialidad(
             query
-            .outerjoin(Persona.parcialidad)
-            .options(joinedload(Persona.parcialidad))
             .add_columns(MiembroFamilia.familiaId.label("idFamilia"))
+            .order_by(Persona.id)
         )
 
-        page_data = self.paginate(page, page_size, query)
-
-        personas = []
-        for persona, idFamilia in page_data["items"]:
-            persona.idFamilia = idFamilia
-            personas.append(persona)
-
-        page_data["items"] = personas
+        page_data = self.paginate(
+            page, page_size, query, cursor=cursor, key_of=lambda row: row.id)
+        page_data["items"] = [
+            persona_out(fila, idFamilia=fila.idFamilia) for fila in page_data["items"]
+        ]
         return page_data
 
     def find_persona_by_id(self, persona_id: str):
 
-        query = (
+        query = con_parcialidad(
             self.db.query(Persona)
             .join(
                 MiembroFamilia,
@@ -74,8 +78,6 @@ class PersonaRepository(BaseRepository, IPersonaRepository):
                 ),
                 isouter=True
             )
-            .outerjoin(Persona.parcialidad)
-            .options(joinedload(Persona.parcialidad))
             .add_columns(MiembroFamilia.familiaId.label("idFamilia"))
             .filter(Persona.id == persona_id)
         )
@@ -91,19 +93,51 @@ class PersonaRepository(BaseRepository, IPersonaRepository):
 
         return persona
 
-    def bulk_insert(self, personas: List[PersonaCreate]) -> int:
-        for persona in personas:
-            self.create(persona)
-        return len(personas)
-
-    def bulk_insert_fast(self, lista_diccionarios):
-        # Crear nueva sesión aislada para el thread
-
-        try:
-            self.db.bulk_insert_mappings(Persona, lista_diccionarios)
-            self.db.commit()
-        except Exception:
-            self.db.rollback()
-            raise
-        finally:
-            self.db.close()
+    def bulk_insert(self, personas: List[PersonaCreate], chunk_size: Optional[int] = None) -> int:
+        """
+        Inserta personas con INSERT multi-fila por bloques, una transacción por
+        bloque. En el mismo bloque se crean los MiembroFamilia de las personas
+        que traen idFamilia. Si un bloque falla se revierte solo ese bloque y se
+        lanza BulkInsertError indicando cuál fue.
+        """
+        filas = [persona.model_dump() for persona in personas]
+        return self.bulk_insert_fast(filas, chunk_size)
+
+    def bulk_insert_fast(self, lista_diccionarios, chunk_size: Optional[int] = None) -> int:
+        """
+        Igual que bulk_insert pero con diccionarios ya preparados. Usa la sesión
+        del request sin cerrarla.
+        """
+        chunk_size = chunk_size or settings.bulk_insert_chunk_size
+        insertados = 0
+
+        for bloque, inicio in enumerate(range(0, len(lista_diccionarios), chunk_size), start=1):
+            lote = lista_diccionarios[inicio:inicio + chunk_size]
+
+            filas_persona = [
+                {k: v for k, v in fila.items() if k != "idFamilia"} for fila in lote
+            ]
+            filas_miembro = [
+                {
+                    "personaId": fila["id"],
+                    "familiaId": fila["idFamilia"],
+                    "activo": True,
+                    "esRepresentante": False
+                }
+                for fila in lote if fila.get("idFamilia") is not None
+            ]
+
+            # Fuera de una UnitOfWork cada bloque confirma (o revierte) solo;
+            # dentro, el error llega a la unidad y esta revierte todo
+            try:
+                with transaccion(self.db):
+                    self.db.execute(insert(Persona).values(filas_persona))
+                    if filas_miembro:
+                        self.db.execute(insert(MiembroFamilia).values(filas_miembro))
+            except Exception as e:
+                raise BulkInsertError(
+                    bloque=bloque, insertados=insertados, mensaje=str(e))
+
+            insertados += len(lote)
+
+        return insertados
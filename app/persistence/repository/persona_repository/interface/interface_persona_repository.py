@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from app.models.inputs.persona.persona_create import PersonaCreate
 from app.models.outputs.paginated_response import PaginatedPersonas
 from app.models.outputs.persona.persona_output import PersonaOut
@@ -13,15 +13,15 @@ class IPersonaRepository(IBaseRepository[Persona, str], ABC):
         pass
 
     @abstractmethod
-    def find_all_personas(self, page: int, page_size: int, filters: Dict[str, Any]) -> PaginatedPersonas:
+    def find_all_personas(self, page: int, page_size: int, filters: Dict[str, Any], cursor: Optional[str] = None) -> PaginatedPersonas:
         pass
 
     @abstractmethod
-    def bulk_insert(self, personas: List[PersonaCreate]) -> int:
+    def bulk_insert(self, personas: List[PersonaCreate], chunk_size: Optional[int] = None) -> int:
         pass
 
     @abstractmethod
-    def bulk_insert_fast(self, lista_diccionarios):
+    def bulk_insert_fast(self, lista_diccionarios, chunk_size: Optional[int] = None) -> int:
         pass
 
     @abstractmethod
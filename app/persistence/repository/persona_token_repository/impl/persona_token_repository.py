@@ -0,0 +1,87 @@
+import re
+from typing import Any, Iterable, List, Set
+from sqlalchemy import and_, delete, insert, select, true
+from sqlalchemy.orm import Session
+from app.persistence.model.persona import Persona
+from app.persistence.model.persona_token import PersonaToken
+from app.persistence.unit_of_work import transaccion
+from app.persistence.repository.persona_token_repository.interface.interface_persona_token_repository import IPersonaTokenRepository
+from app.utils.enviroment import settings
+from app.utils.util_functions import normalizar_texto, tokenizar
+
+MAX_TOKEN = 100
+
+
+def tokens_persona(persona: Any) -> Set[str]:
+    tokens = set(tokenizar(persona.nombre)) | set(tokenizar(persona.apellido))
+    # La cédula se indexa completa, sin separadores, para buscarla por prefijo
+    cedula = re.sub(r"[^a-z0-9]", "", normalizar_texto(persona.id))
+    if cedula:
+        tokens.add(cedula)
+    return {token[:MAX_TOKEN] for token in tokens}
+
+
+def coincide_busqueda(persona_id, texto: str):
+    """
+    Condición para filtrar por texto libre: cada palabra del texto debe ser
+    prefijo de algún token de la persona. Sustituye a LIKE '%texto%', que no
+    puede usar índices.
+    """
+    condiciones = []
+    for palabra in tokenizar(texto):
+        patron = palabra.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        condiciones.append(persona_id.in_(
+            select(PersonaToken.personaId)
+            .where(PersonaToken.token.like(f"{patron[:MAX_TOKEN]}%", escape="\\"))
+        ))
+    return and_(*condiciones) if condiciones else true()
+
+
+class PersonaTokenRepository(IPersonaTokenRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def indexar(self, personas: Iterable[Any]) -> None:
+        personas = list(personas)
+        if not personas:
+            return
+        ids = list({persona.id for persona in personas})
+        filas = [
+            {"token": token, "personaId": persona.id}
+            for persona in personas
+            for token in tokens_persona(persona)
+        ]
+        with transaccion(self.db):
+            self.db.execute(
+                delete(PersonaToken).where(PersonaToken.personaId.in_(ids)))
+            self._insertar(filas)
+
+    def rebuild(self) -> int:
+        chunk_size = settings.bulk_insert_chunk_size
+        total = 0
+        ultimo_id = None
+        with transaccion(self.db):
+            self.db.execute(delete(PersonaToken))
+            # Se recorre Persona por llave en bloques (no con un cursor abierto)
+            # para poder insertar en la misma conexión mientras se lee
+            while True:
+                bloque = self.db.query(Persona.id, Persona.nombre, Persona.apellido)
+                if ultimo_id is not None:
+                    bloque = bloque.filter(Persona.id > ultimo_id)
+                personas = bloque.order_by(Persona.id).limit(chunk_size).all()
+                if not personas:
+                    break
+                total += self._insertar([
+                    {"token": token, "personaId": persona.id}
+                    for persona in personas
+                    for token in tokens_persona(persona)
+                ])
+                ultimo_id = personas[-1].id
+        return total
+
+    def _insertar(self, filas: List[dict]) -> int:
+        chunk_size = settings.bulk_insert_chunk_size
+        for inicio in range(0, len(filas), chunk_size):
+            self.db.execute(
+                insert(PersonaToken).values(filas[inicio:inicio + chunk_size]))
+        return len(filas)
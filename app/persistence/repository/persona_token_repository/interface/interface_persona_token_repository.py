@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+
+class IPersonaTokenRepository(ABC):
+    @abstractmethod
+    def indexar(self, personas: Iterable[Any]) -> None:
+        """Reemplaza los tokens de las personas dadas (objetos con id, nombre y apellido)"""
+
+    @abstractmethod
+    def rebuild(self) -> int:
+        """Recalcula el índice completo; devuelve el número de tokens"""
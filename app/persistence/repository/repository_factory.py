@@ -2,10 +2,14 @@ from typing import Type, TypeVar
 from sqlalchemy.orm import Session
 from app.persistence.repository.familia_repository.impl.familia_repository import FamiliaRepository
 from app.persistence.repository.familia_repository.interface.interface_familia_repository import IFamiliaRepository
+from app.persistence.repository.familia_stats_repository.impl.familia_stats_repository import FamiliaStatsRepository
+from app.persistence.repository.familia_stats_repository.interface.interface_familia_stats_repository import IFamiliaStatsRepository
 from app.persistence.repository.miembro_familia_repository.impl.miembro_familia_repository import MiembroRepository
 from app.persistence.repository.miembro_familia_repository.interface.inteface_miembro_familia import IMiembroRepository
 from app.persistence.repository.parcialidad_repository.impl.parcialidad_repository import ParcialidadRepository
 from app.persistence.repository.parcialidad_repository.interface.interface_parcialidad_repository import IParcialiadRepository
+from app.persistence.repository.persona_token_repository.impl.persona_token_repository import PersonaTokenRepository
+from app.persistence.repository.persona_token_repository.interface.interface_persona_token_repository import IPersonaTokenRepository
 from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
 from app.persistence.repository.persona_repository.interface.interface_persona_repository import IPersonaRepository
 from app.persistence.repository.user_repository.impl.user_repository import UsuarioRepository
@@ -24,7 +28,9 @@ class RepositoryFactory:
         IPersonaRepository: PersonaRepository,
         IFamiliaRepository: FamiliaRepository,
         IParcialiadRepository: ParcialidadRepository,
-        IMiembroRepository: MiembroRepository
+        IMiembroRepository: MiembroRepository,
+        IFamiliaStatsRepository: FamiliaStatsRepository,
+        IPersonaTokenRepository: PersonaTokenRepository
     }
 
     def get_repository(self, interface: Type[T]) -> T:
@@ -34,3 +40,4 @@ class RepositoryFactory:
                 f"No hay implementación registrada para la interfaz: {interface}")
         # Solo pasamos db, el modelo se define en el repositorio
         return impl_class(self.db)
+
@@ -15,6 +15,5 @@ class UsuarioRepository(BaseRepository, IUsuarioRepository):
         usuario = self.get_by_email(email)
         if usuario:
             usuario.password = password
-            self.db.commit()
-            self.db.refresh(usuario)
+            self._commit_with_handling()
         return usuario
@@ -0,0 +1,129 @@
+import logging
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from sqlalchemy.orm import Session
+
+_PROFUNDIDAD = "unit_of_work_profundidad"
+_PENDIENTE = "unit_of_work_pendiente"
+_AL_CONFIRMAR = "unit_of_work_al_confirmar"
+
+logger = logging.getLogger(__name__)
+
+
+def en_unidad_de_trabajo(db: Session) -> bool:
+    return db.info.get(_PROFUNDIDAD, 0) > 0
+
+
+def marcar_escritura(db: Session) -> None:
+    """Indica a la UnitOfWork abierta que hay cambios por confirmar"""
+    db.info[_PENDIENTE] = True
+
+
+def al_confirmar(db: Session, callback: Callable[[], Any]) -> None:
+    """
+    Ejecuta callback cuando los cambios de la operación ya son visibles para
+    otras sesiones: dentro de una UnitOfWork, después de su commit (y nunca si
+    revierte); fuera de ella, en el acto, porque cada escritura ya confirmó.
+    Para invalidar cachés de proceso: hacerlo antes del commit deja una
+    ventana en que otro request vuelve a cachear la fila anterior.
+    """
+    if en_unidad_de_trabajo(db):
+        db.info.setdefault(_AL_CONFIRMAR, []).append(callback)
+    else:
+        callback()
+
+
+class InvalidarAlConfirmar:
+    """
+    Envuelve una caché de proceso para una sesión: sus métodos invalidar* y
+    limpiar se difieren con al_confirmar; el resto (obtener, resolver...) se
+    delega tal cual. Los iteradores recibidos se materializan al llamar,
+    porque se consumen después.
+    """
+
+    def __init__(self, cache: Any, db: Session):
+        self._cache = cache
+        self._db = db
+
+    def __getattr__(self, nombre: str) -> Any:
+        atributo = getattr(self._cache, nombre)
+        if not nombre.startswith(("invalidar", "limpiar")):
+            return atributo
+
+        def diferido(*args, **kwargs):
+            args = tuple(list(a) if isinstance(a, Iterator) else a for a in args)
+            al_confirmar(self._db, lambda: atributo(*args, **kwargs))
+        return diferido
+
+
+class UnitOfWork:
+    """
+    Delimita la transacción de una operación completa sobre la sesión del
+    request. Mientras está abierta los repositorios solo hacen flush; al cerrar
+    la unidad más externa se confirma una sola vez, o se revierte si salió una
+    excepción. Se puede anidar: las unidades internas no confirman.
+
+    Si dentro no hubo escrituras no se hace commit, para no expirar los
+    objetos que la operación devuelve. Los callbacks de al_confirmar corren
+    al final de la unidad más externa si no hubo excepción, y se descartan
+    si se revierte.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __enter__(self) -> "UnitOfWork":
+        profundidad = self.db.info.get(_PROFUNDIDAD, 0)
+        if profundidad == 0:
+            self.db.info[_PENDIENTE] = False
+        self.db.info[_PROFUNDIDAD] = profundidad + 1
+        return self
+
+    def __exit__(self, tipo, valor, traza) -> bool:
+        profundidad = self.db.info[_PROFUNDIDAD] - 1
+        self.db.info[_PROFUNDIDAD] = profundidad
+        if profundidad:
+            return False
+
+        pendiente = self.db.info.pop(_PENDIENTE, False)
+        callbacks = self.db.info.pop(_AL_CONFIRMAR, [])
+        if tipo is not None:
+            self.db.rollback()
+            return False
+        if pendiente:
+            try:
+                self.db.commit()
+            except:
+                self.db.rollback()
+                raise
+
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                # Los cambios ya están confirmados; el TTL acota lo que quede
+                logger.warning(f"[UnitOfWork] ⚠️ Falló un callback posterior al commit: {e}")
+        return False
+
+
+@contextmanager
+def transaccion(db: Session) -> Iterator[None]:
+    """
+    Bloque de escritura de un repositorio. Dentro de una UnitOfWork solo hace
+    flush y deja el commit a quien la abrió; fuera de ella confirma al terminar
+    el bloque y revierte si falla, como un commit por llamada.
+    """
+    if en_unidad_de_trabajo(db):
+        marcar_escritura(db)
+        yield
+        db.flush()
+        return
+
+    try:
+        yield
+        db.flush()
+        db.commit()
+    except:
+        db.rollback()
+        raise
@@ -1,17 +1,20 @@
 from typing import Optional
 from fastapi import APIRouter, File, UploadFile, Depends, Query, status
-from fastapi.responses import JSONResponse
 
-from app.ioc.container import get_familia_manager
+from app.ioc.container import get_familia_manager, get_familia_runner, get_import_job_manager
 from app.models.inputs.familia.familia_create import FamiliaCreate
 from app.models.inputs.familia.familia_update import FamiliaUpdate
 from app.models.inputs.persona.persona_carga_masiva import CargaMasivaResponse
+from app.models.outputs.import_job.import_job_output import ImportJobOut
 from app.models.outputs.familia.familia_output import FamiliaDataLeader, FamiliaOut, FamiliaResumenOut
 from app.models.outputs.paginated_response import PaginatedDataLeader, PaginatedFamilias, PaginatedPersonasFamilia
 from app.models.outputs.persona.persona_output import EstadisticaGeneralOut
 from app.models.outputs.response_estado import EstadoResponse
-from app.persistence.model.enum import EnumEstadoFamilia
+from app.persistence.model.enum import EnumEstadoFamilia, EnumTipoImportacion
 from app.services.familia_manager import FamiliaManager
+from app.services.import_job_manager import ImportJobManager
+from app.services.manager_runner import ManagerRunner
+from app.utils.respuesta_modelo import RespuestaModelo
 
 familia_router = APIRouter(prefix="/familias", tags=["Familia"])
 
@@ -23,13 +26,13 @@ familia_router = APIRouter(prefix="/familias", tags=["Familia"])
 )
 async def create(
     data: FamiliaCreate,
-    manager: FamiliaManager = Depends(get_familia_manager)
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
     """
     Crea una familia nueva con estado y representante opcional.
     """
-    response = manager.create(data)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=201)
+    response = await runner.run(lambda manager: manager.create(data))
+    return RespuestaModelo(response, status_code=201, exclude_none=True)
 
 
 @familia_router.put(
@@ -40,10 +43,10 @@ async def create(
 )
 async def update_familia(
     data: FamiliaUpdate,
-    manager: FamiliaManager = Depends(get_familia_manager)
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
-    response = manager.update_familias(data)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=200)
+    response = await runner.run(lambda manager: manager.update_familias(data))
+    return RespuestaModelo(response, status_code=200, exclude_none=True)
 
 
 @familia_router.post(
@@ -51,15 +54,29 @@ async def update_familia(
     status_code=status.HTTP_201_CREATED,
     response_model=CargaMasivaResponse
 )
-async def upload_excel(
+def upload_excel(
     file: UploadFile = File(...),
     manager: FamiliaManager = Depends(get_familia_manager)
 ):
     """
     Carga masiva de familias desde archivo Excel.
     """
-    response = await manager.upload_excel(file)
-    return response
+    return manager.upload_excel(file)
+
+
+@familia_router.post(
+    "/upload-excel/async",
+    status_code=status.HTTP_202_ACCEPTED,
+    response_model=ImportJobOut
+)
+def upload_excel_async(
+    file: UploadFile = File(...),
+    manager: ImportJobManager = Depends(get_import_job_manager)
+):
+    """
+    Encola la carga masiva de familias y retorna el job para consultar su avance.
+    """
+    return manager.submit(EnumTipoImportacion.FAMILIAS, file)
 
 
 @familia_router.delete(
@@ -69,10 +86,10 @@ async def upload_excel(
 )
 async def delete(
     id_familia: int,
-    manager: FamiliaManager = Depends(get_familia_manager)
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
-    response = manager.delete(id_familia)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=200)
+    response = await runner.run(lambda manager: manager.delete(id_familia))
+    return RespuestaModelo(response, status_code=200, exclude_none=True)
 
 
 @familia_router.get(
@@ -80,12 +97,14 @@ async def delete(
     status_code=status.HTTP_200_OK,
     response_model=PaginatedFamilias
 )
-def get_familias(
+async def get_familias(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
-    manager: FamiliaManager = Depends(get_familia_manager)
+    cursor: Optional[str] = Query(
+        None, description="Cursor next_cursor de la página anterior"),
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
-    return manager.get_familias(page, page_size)
+    return await runner.run(lambda manager: RespuestaModelo(manager.get_familias(page, page_size, cursor)))
 
 
 @familia_router.get(
@@ -93,24 +112,26 @@ def get_familias(
     status_code=status.HTTP_200_OK,
     response_model=PaginatedFamilias
 )
-def search_familia(
+async def search_familia(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
     query: Optional[str] = Query(None),
     parcialidad_id: Optional[int] = Query(None),
     rango_miembros: Optional[str] = Query(None, pattern="^(1-3|4-6|7\+)$"),
     estado: Optional[EnumEstadoFamilia] = Query(None),
-    manager: FamiliaManager = Depends(get_familia_manager)
+    cursor: Optional[str] = Query(
+        None, description="Cursor next_cursor de la página anterior"),
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
-    result = manager.search_familia_by_lider(
+    return await runner.run(lambda manager: RespuestaModelo(manager.search_familia_by_lider(
         query=query,
         page=page,
         page_size=page_size,
         parcialidad_id=parcialidad_id,
         rango_miembros=rango_miembros,
-        estado=estado
-    )
-    return result
+        estado=estado,
+        cursor=cursor
+    )))
 
 
 @familia_router.get(
@@ -119,15 +140,17 @@ def search_familia(
     response_model=PaginatedDataLeader,
     summary="Lista familias con datos del líder y parcialidad"
 )
-def get_familias_dashboard(
+async def get_familias_dashboard(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
-    manager: FamiliaManager = Depends(get_familia_manager),
+    cursor: Optional[str] = Query(
+        None, description="Cursor next_cursor de la página anterior"),
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner),
 ):
     """
     Obtiene un resumen de las familias con su líder, cédula, parcialidad y estado.
     """
-    return manager.get_familias_leaderdata(page, page_size)
+    return await runner.run(lambda manager: RespuestaModelo(manager.get_familias_leaderdata(page, page_size, cursor)))
 
 
 @familia_router.get(
@@ -136,19 +159,22 @@ def get_familias_dashboard(
     response_model=PaginatedPersonasFamilia,
     summary="Obtiene los miembros de una familia por su ID"
 )
-def get_miembros_familia(
+async def get_miembros_familia(
     id_familia: int,
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
     query: Optional[str] = Query(
         None, description="Buscar por nombre, apellido o cédula"),
     vivos: bool = Query(False, description="Filtrar solo miembros vivos"),
-    manager: FamiliaManager = Depends(get_familia_manager)
+    cursor: Optional[str] = Query(
+        None, description="Cursor next_cursor de la página anterior"),
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
     """
     Retorna los miembros de la familia especificada, con búsqueda parcial.
     """
-    return manager.get_miembros_familia(id_familia, query, page, page_size,vivos)
+    return await runner.run(lambda manager: RespuestaModelo(
+        manager.get_miembros_familia(id_familia, query, page, page_size, vivos, cursor)))
 
 
 @familia_router.get(
@@ -156,15 +182,15 @@ def get_miembros_familia(
     response_model=FamiliaResumenOut,
     summary="Obtiene resumen de una familia"
 )
-def get_familia_resumen(
+async def get_familia_resumen(
     id_familia: int,
-    manager: FamiliaManager = Depends(get_familia_manager)
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
     """
     Retorna información resumida de una familia:
     ID, líder, parcialidad, total de miembros, miembros activos y defunciones.
     """
-    return manager.get_familia_resumen(id_familia)
+    return await runner.run(lambda manager: RespuestaModelo(manager.get_familia_resumen(id_familia)))
 
 
 @familia_router.get(
@@ -172,15 +198,15 @@ def get_familia_resumen(
     response_model=EstadisticaGeneralOut,
     summary="Obtiene el total de familias y total de personas"
 )
-def get_estadisticas_generales(
-    manager: FamiliaManager = Depends(get_familia_manager)
+async def get_estadisticas_generales(
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
     """
     Retorna estadísticas generales del sistema:
     - Total de familias registradas
     - Total de personas registradas
     """
-    return manager.get_estadisticas_generales()
+    return await runner.run(lambda manager: manager.get_estadisticas_generales())
 
 
 @familia_router.get(
@@ -188,8 +214,8 @@ def get_estadisticas_generales(
     status_code=status.HTTP_200_OK,
     response_model=FamiliaOut
 )
-def get_familia(
+async def get_familia(
     id: int,
-    manager: FamiliaManager = Depends(get_familia_manager)
+    runner: ManagerRunner[FamiliaManager] = Depends(get_familia_runner)
 ):
-    return manager.get_familia(id)
+    return await runner.run(lambda manager: RespuestaModelo(manager.get_familia(id)))
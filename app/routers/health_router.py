@@ -0,0 +1,27 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from app.config.database import async_engine, resumen_pool, verificar_conexion
+from app.models.outputs.metricas.metricas_output import HealthOut
+
+health_router = APIRouter(prefix="/health", tags=["Métricas"])
+
+
+@health_router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=HealthOut,
+    summary="Verifica la conexión a la base y reporta el estado del pool"
+)
+async def health():
+    """
+    Responde 503 si la base no contesta un SELECT 1 dentro del timeout del pool.
+    """
+    pool = resumen_pool(asincrono=async_engine is not None)
+    try:
+        await verificar_conexion()
+    except Exception as e:
+        salud = HealthOut(estado="error", base_datos=False, mensaje=str(e), pool=pool)
+        return JSONResponse(content=salud.model_dump(mode="json"),
+                            status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
+    return HealthOut(estado="ok", base_datos=True, pool=pool)
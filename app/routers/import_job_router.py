@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, status
+
+from app.ioc.container import get_import_job_manager
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.services.import_job_manager import ImportJobManager
+
+import_job_router = APIRouter(prefix="/import-jobs", tags=["Importaciones"])
+
+
+@import_job_router.get(
+    "/{job_id}",
+    status_code=status.HTTP_200_OK,
+    response_model=ImportJobOut,
+    summary="Consulta el avance de una carga masiva en segundo plano"
+)
+def get_import_job(
+    job_id: str,
+    manager: ImportJobManager = Depends(get_import_job_manager)
+):
+    """
+    Retorna el estado del trabajo: filas procesadas, insertados y errores hasta
+    el momento, y el CargaMasivaResponse final cuando termina.
+    """
+    return manager.get_job(job_id)
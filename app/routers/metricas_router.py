@@ -0,0 +1,59 @@
+from fastapi import APIRouter, status
+from fastapi.responses import PlainTextResponse
+
+from app.config.database import async_engine, resumen_pool
+from app.config.prometheus import CONTENT_TYPE, exposicion_prometheus
+from app.config.sql_metrics import metricas_sql
+from app.models.outputs.metricas.metricas_output import MetricasOut
+from app.persistence.repository.base_repository.impl.identity_cache import contadores_get
+from app.services.lecturas_cache import lecturas_cache
+
+metricas_router = APIRouter(prefix="/metricas", tags=["Métricas"])
+
+
+@metricas_router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=MetricasOut,
+    summary="Contadores internos del servicio desde que inició el proceso"
+)
+def get_metricas():
+    """
+    repositorio_get: búsquedas por id resueltas desde el identity map de la
+    sesión o la caché negativa (sin SQL) frente a las que fueron a la base.
+    lecturas_cache: aciertos y fallos de la caché de lecturas por id entre
+    requests; errores cuenta fallas del backend (se sirvió desde la base).
+    pool: conexiones en uso, overflow, timeouts e histograma de latencia de
+    checkout de este worker, junto con la configuración efectiva del pool.
+    sql: por ruta, requests, sentencias y tiempo en base acumulados y la
+    sentencia más lenta; consultas_lentas cuenta las que superaron
+    SQL_SLOW_QUERY_MS (cada una queda en el log con su SQL y parámetros).
+    """
+    return MetricasOut(
+        repositorio_get=contadores_get.resumen(),
+        lecturas_cache=lecturas_cache.resumen(),
+        pool=resumen_pool(),
+        pool_async=resumen_pool(asincrono=True) if async_engine is not None else None,
+        sql=metricas_sql.resumen()
+    )
+
+
+@metricas_router.get(
+    "/prometheus",
+    status_code=status.HTTP_200_OK,
+    response_class=PlainTextResponse,
+    summary="Las mismas métricas en formato de exposición de Prometheus"
+)
+def get_metricas_prometheus():
+    """
+    Contadores de este worker; con varios workers cada uno expone los suyos,
+    así que el scrape debe apuntar a cada proceso o agregarlos aparte.
+    """
+    return PlainTextResponse(
+        exposicion_prometheus(
+            sql=metricas_sql.resumen(),
+            repositorio_get=contadores_get.resumen(),
+            lecturas_cache=lecturas_cache.resumen(),
+            pool=resumen_pool(),
+            pool_async=resumen_pool(asincrono=True) if async_engine is not None else None),
+        media_type=CONTENT_TYPE)
@@ -1,5 +1,6 @@
+from typing import Optional
+
 from fastapi import APIRouter, Depends, File, Query, UploadFile, status
-from fastapi.responses import JSONResponse
 
 from app.models.inputs.familia.assing_familia_users import AssingFamilia
 from app.models.inputs.persona.persona_carga_masiva import CargaMasivaResponse
@@ -12,8 +13,13 @@ from app.models.outputs.response_estado import EstadoResponse
 from app.models.outputs.paginated_response import PaginatedPersonas
 
 from app.services.persona_manager import PersonaManager
-from app.ioc.container import get_persona_manager
+from app.ioc.container import get_import_job_manager, get_persona_manager, get_persona_runner
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.persistence.model.enum import EnumTipoImportacion
+from app.services.import_job_manager import ImportJobManager
+from app.services.manager_runner import ManagerRunner
 from app.utils.middlewares.validate_persona_admin import validar_persona_admin
+from app.utils.respuesta_modelo import RespuestaModelo
 
 persona_router = APIRouter(prefix="/personas", tags=["Persona"])
 
@@ -21,19 +27,29 @@ persona_router = APIRouter(prefix="/personas", tags=["Persona"])
 @persona_router.post("/create", status_code=status.HTTP_201_CREATED, response_model=EstadoResponse)
 async def create(
     data: PersonaCreate,
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    response = manager.create_persona(data)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=201)
+    response = await runner.run(lambda manager: manager.create_persona(data))
+    return RespuestaModelo(response, status_code=201, exclude_none=True)
 
 
 @persona_router.post("/upload-excel", status_code=status.HTTP_201_CREATED, response_model=CargaMasivaResponse)
-async def upload_excel(
+def upload_excel(
     file: UploadFile = File(...),
     manager: PersonaManager = Depends(get_persona_manager)
 ):
-    response = manager.upload_excel(file)
-    return await response
+    return manager.upload_excel(file)
+
+
+@persona_router.post("/upload-excel/async", status_code=status.HTTP_202_ACCEPTED, response_model=ImportJobOut)
+def upload_excel_async(
+    file: UploadFile = File(...),
+    manager: ImportJobManager = Depends(get_import_job_manager)
+):
+    """
+    Encola la carga masiva de personas y retorna el job para consultar su avance.
+    """
+    return manager.submit(EnumTipoImportacion.PERSONAS, file)
 
 
 @persona_router.put("/{persona_id}", status_code=status.HTTP_202_ACCEPTED, response_model=EstadoResponse)
@@ -41,36 +57,40 @@ async def update(
     persona_id: str,
     data: PersonaUpdate,
     _: bool = validar_persona_admin(),
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    response = manager.update_persona(persona_id, data)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=202)
+    response = await runner.run(lambda manager: manager.update_persona(persona_id, data))
+    return RespuestaModelo(response, status_code=202, exclude_none=True)
 
 
 @persona_router.get("", response_model=PaginatedPersonas)
-def get_personas(
+async def get_personas(
     page: int = Query(1, ge=1),
     page_size: int = Query(10, le=100),
     filters: PersonaFilter = Depends(),
-    manager: PersonaManager = Depends(get_persona_manager)
+    cursor: Optional[str] = Query(
+        None, description="Cursor next_cursor de la página anterior"),
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    return manager.get_personas(page, page_size, filters.model_dump(exclude_none=True))
+    return await runner.run(
+        lambda manager: RespuestaModelo(
+            manager.get_personas(page, page_size, filters.model_dump(exclude_none=True), cursor)))
 
 
 @persona_router.get("/{persona_id}", response_model=PersonaOut)
-def get_personas(
+async def get_personas(
     persona_id: str,
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    return manager.get_persona(persona_id)
+    return await runner.run(lambda manager: RespuestaModelo(manager.get_persona(persona_id)))
 
 
 @persona_router.patch("/assing-family", response_model=AsignacionFamiliaResponse)
-def assing_family_users(
+async def assing_family_users(
     data: AssingFamilia,
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    return manager.assing_familia_persona(data)
+    return await runner.run(lambda manager: manager.assing_familia_persona(data))
 
 
 @persona_router.patch(
@@ -78,12 +98,12 @@ def assing_family_users(
     response_model=EstadoResponse,
     summary="Saca una persona de su familia (pone idFamilia = NULL)"
 )
-def unassign_family_user(
+async def unassign_family_user(
     persona_id: str,
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    response = manager.unassign_familia_persona(persona_id)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=200)
+    response = await runner.run(lambda manager: manager.unassign_familia_persona(persona_id))
+    return RespuestaModelo(response, status_code=200, exclude_none=True)
 
 
 @persona_router.patch(
@@ -91,9 +111,9 @@ def unassign_family_user(
     response_model=EstadoResponse,
     summary="Registra la fecha de defunción de una persona"
 )
-def register_defuncion(
+async def register_defuncion(
     data: PersonaDefuncion,
-    manager: PersonaManager = Depends(get_persona_manager)
+    runner: ManagerRunner[PersonaManager] = Depends(get_persona_runner)
 ):
-    response = manager.registrar_defuncion(data)
-    return JSONResponse(content=response.model_dump(exclude_none=True), status_code=200)
+    response = await runner.run(lambda manager: manager.registrar_defuncion(data))
+    return RespuestaModelo(response, status_code=200, exclude_none=True)
@@ -0,0 +1,25 @@
+from typing import Callable
+
+from app.models.outputs.persona.persona_output import EstadisticaGeneralOut
+from app.utils.enviroment import settings
+from app.utils.ttl_cache import ValorEnCache
+
+
+class EstadisticasCache:
+    """
+    Estadísticas globales en memoria del proceso. Se calculan una vez y los
+    managers las invalidan al crear o eliminar personas, familias o
+    parcialidades; el TTL cubre escrituras hechas por otros workers.
+    """
+
+    def __init__(self, ttl: float):
+        self._valor = ValorEnCache(ttl)
+
+    def obtener(self, calcular: Callable[[], EstadisticaGeneralOut]) -> EstadisticaGeneralOut:
+        return self._valor.obtener(calcular)
+
+    def invalidar(self) -> None:
+        self._valor.invalidar()
+
+
+estadisticas_cache = EstadisticasCache(ttl=settings.estadisticas_ttl)
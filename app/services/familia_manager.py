@@ -1,8 +1,7 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 import pandas as pd
-import io
 
 from fastapi import UploadFile
 from app.models.inputs.familia.familia_create import FamiliaCreate
@@ -10,7 +9,7 @@ from app.models.inputs.familia.familia_update import FamiliaUpdate
 from app.models.inputs.persona.persona_carga_masiva import CargaMasivaResponse, ErrorPersonaOut
 from app.models.inputs.persona.persona_update import PersonaUpdate
 from app.models.outputs.familia.familia_output import FamiliaOut, FamiliaResumenOut
-from app.models.outputs.paginated_response import PaginatedFamilias
+from app.models.outputs.paginated_response import PaginatedDataLeader, PaginatedFamilias, PaginatedPersonasFamilia
 from app.models.outputs.persona.persona_output import EstadisticaGeneralOut
 from app.models.outputs.response_estado import EstadoResponse
 from app.persistence.model import miembro_familia
@@ -19,20 +18,31 @@ from app.persistence.model.enum import EnumEstadoFamilia
 from app.persistence.model.miembro_familia import MiembroFamilia
 from app.persistence.model.persona import Persona
 from app.persistence.repository.familia_repository.interface.interface_familia_repository import IFamiliaRepository
+from app.persistence.repository.familia_stats_repository.interface.interface_familia_stats_repository import IFamiliaStatsRepository
 from app.persistence.repository.miembro_familia_repository.interface.inteface_miembro_familia import IMiembroRepository
 from app.persistence.repository.persona_repository.interface.interface_persona_repository import IPersonaRepository
+from app.services.estadisticas_cache import EstadisticasCache
+from app.services.lecturas_cache import FAMILIA, PERSONA, RESUMEN, LecturasCache
 from app.utils.constans import COLUMNS_FAMILIA
+from app.utils.enviroment import settings
 from app.utils.exceptions_handlers.models.error_response import AppException
+from app.utils.file_reader import ProgresoCallback, leer_por_lotes, texto_celda
 
 
 class FamiliaManager:
     def __init__(self, familia_repository: IFamiliaRepository,
                  persona_repository: IPersonaRepository,
                  miembro_repository: IMiembroRepository,
+                 familia_stats_repository: IFamiliaStatsRepository,
+                 estadisticas_cache: EstadisticasCache,
+                 lecturas_cache: LecturasCache,
                  logger: logging.Logger):
         self.familia_repository: IFamiliaRepository = familia_repository
         self.persona_repository: IPersonaRepository = persona_repository
         self.miembro_repository = miembro_repository
+        self.familia_stats_repository: IFamiliaStatsRepository = familia_stats_repository
+        self.estadisticas_cache = estadisticas_cache
+        self.lecturas_cache = lecturas_cache
         self.logger = logger
 
     def create(self, data: FamiliaCreate) -> EstadoResponse:
@@ -60,6 +70,10 @@ class FamiliaManager:
                 self.logger.info(
                     f"[FamiliaManager] ✅ Representante {data.representanteId} asignado correctamente a la familia {created.id}"
                 )
+            self.familia_stats_repository.refresh([created.id])
+            self.estadisticas_cache.invalidar()
+            self.lecturas_cache.invalidar_familias([created.id])
+            self.lecturas_cache.invalidar_personas([data.representanteId])
             self.logger.info(
                 f"[FamiliaManager] ✅ Familia creada exitosamente | ID: {created.id}, "
                 f"Estado: {created.estado}, Representante: {data.representanteId}"
@@ -87,6 +101,12 @@ class FamiliaManager:
                 f"[FamiliaManager] ⚠️ No se encontró familia con ID {familia_id} para eliminar")
             raise AppException("No se encontró la familia para eliminar")
 
+        self.familia_stats_repository.refresh([familia_id])
+        self.estadisticas_cache.invalidar()
+        self.lecturas_cache.invalidar_familias([familia_id])
+        # Las membresías se borran en cascada: cualquier persona cacheada
+        # pudo quedar con este idFamilia
+        self.lecturas_cache.limpiar(PERSONA)
         self.logger.info(
             f"[FamiliaManager] 🗑️ Familia eliminada correctamente: ID {familia_id}")
         return EstadoResponse(
@@ -94,15 +114,16 @@ class FamiliaManager:
             message="Familia eliminada exitosamente"
         )
 
-    def get_familias(self, page: int, page_size: int) -> PaginatedFamilias:
+    def get_familias(self, page: int, page_size: int, cursor: Optional[str] = None) -> PaginatedFamilias:
         self.logger.info(
-            f"[FamiliaManager] Consultando familias | Página: {page}, Tamaño: {page_size}")
+            f"[FamiliaManager] Consultando familias | Página: {page}, Tamaño: {page_size}, Cursor: {cursor}")
         result = self.familia_repository.get_familias_con_lider(
-            page, page_size)
+            page, page_size, cursor)
 
         self.logger.info(
             f"[FamiliaManager] ✅ Consulta completada | Total familias en página: {result['items'].__len__()}")
-        return result
+        # Los FamiliaOut ya vienen validados del repositorio; no se revalidan
+        return PaginatedFamilias.model_validate(result)
 
     def update_familias(self, request: FamiliaUpdate):
         self.logger.info(
@@ -120,6 +141,8 @@ class FamiliaManager:
             familia_id=request.familiaId,
             representante_id=request.representanteId
         )
+        self.familia_stats_repository.refresh([request.familiaId])
+        self.lecturas_cache.invalidar_familias([request.familiaId])
 
         self.logger.info(
             f"[FamiliaManager] 🎉 Familia {familia.id} actualizada exitosamente"
@@ -172,6 +195,11 @@ class FamiliaManager:
     def get_familia(self, familia_id: int) -> FamiliaOut:
         self.logger.info(
             f"[FamiliaManager] Buscando familia con ID: {familia_id}")
+        return self.lecturas_cache.obtener(
+            FAMILIA + str(familia_id), FamiliaOut,
+            lambda: self._buscar_familia(familia_id))
+
+    def _buscar_familia(self, familia_id: int) -> Familia:
         familia = self.familia_repository.get_familia_by_id(familia_id)
 
         if familia is None:
@@ -185,19 +213,19 @@ class FamiliaManager:
         )
         return familia
 
-    async def upload_excel(self, file: UploadFile) -> CargaMasivaResponse:
+    def upload_excel(self, file: UploadFile, progreso: ProgresoCallback = None) -> CargaMasivaResponse:
         self.logger.info(
             f"[FamiliaManager] Iniciando carga masiva de familias desde archivo: {file.filename}"
         )
 
+        insertados = 0
+        total = 0
+        errores: List[ErrorPersonaOut] = []
+
         try:
-            content = await file.read()
-            df = pd.read_excel(io.BytesIO(content))
-            self.logger.info(
-                f"[FamiliaManager] Archivo leído correctamente | Filas detectadas: {len(df)}"
-            )
+            columnas, lotes = leer_por_lotes(file, settings.upload_batch_size)
 
-            missing = [col for col in COLUMNS_FAMILIA if col not in df.columns]
+            missing = [col for col in COLUMNS_FAMILIA if col not in columnas]
             if missing:
                 self.logger.error(
                     f"[FamiliaManager] ❌ Faltan columnas requeridas en Excel: {missing}"
@@ -213,72 +241,22 @@ class FamiliaManager:
                     ]
                 )
 
-            df = df.replace({np.nan: None})
-
-            familias: List[FamiliaCreate] = []
-            errores: List[ErrorPersonaOut] = []
-            representantes: Dict[int, str] = {}
-
-            for i, row in df.iterrows():
-                try:
-                    familia_dict = row.to_dict()
-                    representante_id = familia_dict.pop(
-                        "cedulaRepresentante", None)
-
-                    if representante_id:
-                        persona = self.persona_repository.get(representante_id)
-                        if not persona:
-                            raise AppException(
-                                f"El representante '{representante_id}' no existe"
-                            )
-                        representantes[familia_dict["idFamilia"]] = str(
-                            representante_id)
-
-                    familia = FamiliaCreate(**familia_dict)
-                    self._validar_familia(familia)
-                    familias.append(familia)
-
-                except Exception as e:
-                    self.logger.warning(
-                        f"[FamiliaManager] Error en fila {i + 2}: {e}"
-                    )
-                    errores.append(
-                        ErrorPersonaOut(
-                            fila=i + 2,
-                            id=str(row.get("idFamilia")) if row.get(
-                                "idFamilia") else None,
-                            mensaje=str(e),
-                        )
-                    )
-
-            insertados = 0
-            if familias:
+            # Cada lote se valida e inserta antes de leer el siguiente
+            for df in lotes:
                 self.logger.info(
-                    f"[FamiliaManager] Insertando {len(familias)} familias válidas..."
+                    f"[FamiliaManager] Procesando lote | Filas: {len(df)}"
                 )
-                insertados = self.familia_repository.bulk_insert(familias)
+                df["cedulaRepresentante"] = df["cedulaRepresentante"].map(texto_celda)
+                df = df.replace({np.nan: None})
 
-                for familia_id, representante_id in representantes.items():
-                    miembro = self.miembro_repository.get_familia_actual(
-                        representante_id
-                    )
+                insertados_lote, errores_lote = self._procesar_lote_familias(df)
+                insertados += insertados_lote
+                errores.extend(errores_lote)
+                total += len(df)
 
-                    if not miembro:
-                        self.miembro_repository.create(
-                            MiembroFamilia(
-                                personaId=representante_id,
-                                familiaId=familia_id,
-                                activo=True,
-                                esRepresentante=False
-                            )
-                        )
+                if progreso:
+                    progreso(total, insertados, len(errores))
 
-                    self._set_lider(
-                        familia_id=familia_id,
-                        representante_id=representante_id
-                    )
-
-            total = len(familias) + len(errores)
             self.logger.info(
                 f"[FamiliaManager] Carga masiva finalizada | Total: {total}, Errores: {len(errores)}"
             )
@@ -296,8 +274,88 @@ class FamiliaManager:
             )
             return CargaMasivaResponse(
                 status="error",
-                errores=[ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
+                insertados=insertados,
+                total_procesados=total,
+                errores=errores + [ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
+            )
+
+    def _procesar_lote_familias(self, df: pd.DataFrame) -> Tuple[int, List[ErrorPersonaOut]]:
+        """
+        Valida e inserta un lote de filas del Excel de familias, asignando los
+        representantes del lote. Retorna los insertados y los errores por fila.
+        """
+        familias: List[FamiliaCreate] = []
+        errores: List[ErrorPersonaOut] = []
+        representantes: Dict[int, str] = {}
+
+        for i, row in df.iterrows():
+            try:
+                familia_dict = row.to_dict()
+                representante_id = familia_dict.pop(
+                    "cedulaRepresentante", None)
+
+                if representante_id:
+                    persona = self.persona_repository.get(representante_id)
+                    if not persona:
+                        raise AppException(
+                            f"El representante '{representante_id}' no existe"
+                        )
+                    representantes[familia_dict["idFamilia"]] = str(
+                        representante_id)
+
+                familia = FamiliaCreate(**familia_dict)
+                self._validar_familia(familia)
+                familias.append(familia)
+
+            except Exception as e:
+                self.logger.warning(
+                    f"[FamiliaManager] Error en fila {i + 2}: {e}"
+                )
+                errores.append(
+                    ErrorPersonaOut(
+                        fila=i + 2,
+                        id=str(row.get("idFamilia")) if row.get(
+                            "idFamilia") else None,
+                        mensaje=str(e),
+                    )
+                )
+
+        insertados = 0
+        if familias:
+            self.logger.info(
+                f"[FamiliaManager] Insertando {len(familias)} familias válidas..."
             )
+            insertados = self.familia_repository.bulk_insert(familias)
+
+            for familia_id, representante_id in representantes.items():
+                miembro = self.miembro_repository.get_familia_actual(
+                    representante_id
+                )
+
+                if not miembro:
+                    self.miembro_repository.create(
+                        MiembroFamilia(
+                            personaId=representante_id,
+                            familiaId=familia_id,
+                            activo=True,
+                            esRepresentante=False
+                        )
+                    )
+
+                self._set_lider(
+                    familia_id=familia_id,
+                    representante_id=representante_id
+                )
+
+            self.familia_stats_repository.refresh(
+                familia.idFamilia for familia in familias)
+            self.estadisticas_cache.invalidar()
+            # Los representantes cambian de familia (PersonaOut.idFamilia)
+            self.lecturas_cache.invalidar_personas(representantes.values())
+            self.lecturas_cache.invalidar_familias(
+                [familia.idFamilia for familia in familias])
+
+        return insertados, errores
 
     def search_familia_by_lider(
         self,
@@ -306,7 +364,8 @@ class FamiliaManager:
         page_size: int,
         parcialidad_id: int | None = None,
         rango_miembros: str | None = None,
-        estado: EnumEstadoFamilia | None = None
+        estado: EnumEstadoFamilia | None = None,
+        cursor: str | None = None
     ):
 
         self.logger.info(
@@ -320,41 +379,44 @@ class FamiliaManager:
             query=query,
             parcialidad_id=parcialidad_id,
             rango_miembros=rango_miembros,
-            estado=estado
+            estado=estado,
+            cursor=cursor
         )
 
-        if not familias:
+        if not familias["items"]:
             self.logger.warning(
                 "[FamiliaManager] ⚠️ No se encontraron familias con los filtros aplicados"
             )
         else:
             self.logger.info(
-                f"[FamiliaManager] ✅ {len(familias)} familia(s) encontradas"
+                f"[FamiliaManager] ✅ {len(familias['items'])} familia(s) encontradas"
             )
 
-        return familias
+        return PaginatedFamilias.model_validate(familias)
 
-    def get_familias_leaderdata(self, page: int, page_size: int) -> list:
+    def get_familias_leaderdata(self, page: int, page_size: int, cursor: Optional[str] = None) -> PaginatedDataLeader:
         """
         Obtiene la lista de familias con su líder, parcialidad y número de miembros.
         """
         self.logger.info("[FamiliaManager] Consultando dashboard de familias")
 
         result = self.familia_repository.get_familias_dashboard(
-            page, page_size)
+            page, page_size, cursor)
 
         self.logger.info(
-            f"[FamiliaManager] Se obtuvieron {len(result)} familias para el dashboard")
-        return result
+            f"[FamiliaManager] Se obtuvieron {len(result['items'])} familias para el dashboard")
+        # Las filas de la proyección se validan una sola vez, al armar la página
+        return PaginatedDataLeader.model_validate(result, from_attributes=True)
 
-    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool = False):
+    def get_miembros_familia(self, id_familia: int, query: Optional[str], page: int, page_size: int, vivos: bool = False,
+                             cursor: Optional[str] = None) -> PaginatedPersonasFamilia:
         self.logger.info(
             f"[FamiliaManager] Consultando miembros de la familia {id_familia} (query='{query}', vivos={vivos})")
         result = self.familia_repository.get_miembros_familia(
-            id_familia, query, page, page_size, vivos)
+            id_familia, query, page, page_size, vivos, cursor)
         self.logger.info(
             f"[FamiliaManager] Miembros encontrados: {result['total_items']}")
-        return result
+        return PaginatedPersonasFamilia.model_validate(result, from_attributes=True)
 
     def get_familia_resumen(self, id_familia: int) -> FamiliaResumenOut:
         """
@@ -362,7 +424,9 @@ class FamiliaManager:
         """
         self.logger.info(
             f"[FamiliaManager] Consultando resumen de familia {id_familia}")
-        return self.familia_repository.get_familia_resumen(id_familia)
+        return self.lecturas_cache.obtener(
+            RESUMEN + str(id_familia), FamiliaResumenOut,
+            lambda: self.familia_repository.get_familia_resumen(id_familia))
 
     def _validar_familia(self, data: FamiliaCreate) -> None:
         """
@@ -411,5 +475,5 @@ class FamiliaManager:
         """
         self.logger.info(
             "[FamiliaManager] Consultando estadísticas generales del sistema")
-        data = self.familia_repository.get_estadisticas_generales()
-        return EstadisticaGeneralOut(**data)
+        return self.estadisticas_cache.obtener(
+            lambda: EstadisticaGeneralOut(**self.familia_repository.get_estadisticas_generales()))
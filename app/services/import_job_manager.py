@@ -0,0 +1,124 @@
+import logging
+import os
+import shutil
+import tempfile
+import uuid
+from concurrent.futures import Executor
+from datetime import datetime
+from typing import Any, Callable, Dict
+
+from fastapi import UploadFile
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.persistence.job_store.interface.interface_job_store import IJobStore
+from app.persistence.model.enum import EnumEstadoImportacion, EnumTipoImportacion
+from app.utils.exceptions_handlers.models.error_response import AppException
+
+
+class ImportJobManager:
+    """
+    Ejecuta las cargas masivas en un pool de workers. La subida retorna de
+    inmediato un job_id y el avance se consulta en el IJobStore.
+    """
+
+    def __init__(self,
+                 job_store: IJobStore,
+                 executor: Executor,
+                 session_factory: Callable[[], Session],
+                 constructores: Dict[EnumTipoImportacion, Callable[[Session, logging.Logger], Any]],
+                 logger: logging.Logger):
+        self.job_store = job_store
+        self.executor = executor
+        self.session_factory = session_factory
+        self.constructores = constructores
+        self.logger = logger
+
+    def submit(self, tipo: EnumTipoImportacion, file: UploadFile) -> ImportJobOut:
+        # El archivo del request se cierra al terminar la petición, así que se
+        # copia a un temporal en disco (por bloques) para el worker
+        _, extension = os.path.splitext(file.filename or "")
+        ruta, job = None, None
+        try:
+            with tempfile.NamedTemporaryFile(delete=False, suffix=extension) as tmp:
+                ruta = tmp.name
+                file.file.seek(0)
+                shutil.copyfileobj(file.file, tmp)
+
+            job = self.job_store.create(ImportJobOut(
+                job_id=uuid.uuid4().hex,
+                tipo=tipo,
+                estado=EnumEstadoImportacion.PENDIENTE,
+                archivo=file.filename,
+                fechaCreacion=datetime.utcnow()
+            ))
+            self.executor.submit(
+                self._ejecutar, job.job_id, tipo, ruta, file.filename, file.content_type)
+        except Exception as e:
+            # Sin un worker que lo procese nadie más borraría el temporal
+            if ruta is not None:
+                os.remove(ruta)
+            if job is not None:
+                self.job_store.update(
+                    job.job_id,
+                    estado=EnumEstadoImportacion.FALLIDO,
+                    mensaje=str(e),
+                    fechaFin=datetime.utcnow()
+                )
+            self.logger.error(f"[ImportJobManager] ❌ No se pudo encolar la importación: {e}")
+            raise
+
+        self.logger.info(
+            f"[ImportJobManager] Job {job.job_id} encolado | Tipo: {tipo.value}, Archivo: {file.filename}")
+        return job
+
+    def get_job(self, job_id: str) -> ImportJobOut:
+        job = self.job_store.get(job_id)
+        if job is None:
+            raise AppException("Importación no encontrada", 404)
+        return job
+
+    def _ejecutar(self, job_id: str, tipo: EnumTipoImportacion, ruta: str,
+                  filename: str, content_type: str | None) -> None:
+        self.job_store.update(job_id, estado=EnumEstadoImportacion.EN_PROCESO)
+        self.logger.info(f"[ImportJobManager] Job {job_id} iniciado")
+
+        def progreso(procesadas: int, insertados: int, errores: int):
+            self.job_store.update(
+                job_id, filas_procesadas=procesadas, insertados=insertados, errores=errores)
+
+        db = self.session_factory()
+        try:
+            manager = self.constructores[tipo](db, self.logger)
+            with open(ruta, "rb") as f:
+                headers = Headers({"content-type": content_type or ""})
+                upload = UploadFile(file=f, filename=filename, headers=headers)
+                resultado = manager.upload_excel(upload, progreso=progreso)
+
+            estado = (EnumEstadoImportacion.COMPLETADO
+                      if resultado.status == "ok" else EnumEstadoImportacion.FALLIDO)
+            self.job_store.update(
+                job_id,
+                estado=estado,
+                filas_procesadas=resultado.total_procesados,
+                insertados=resultado.insertados,
+                errores=len(resultado.errores),
+                resultado=resultado,
+                fechaFin=datetime.utcnow()
+            )
+            self.logger.info(
+                f"[ImportJobManager] Job {job_id} finalizado | Estado: {estado.value}, "
+                f"Insertados: {resultado.insertados}")
+        except Exception as e:
+            self.logger.exception(
+                f"[ImportJobManager] ❌ Job {job_id} falló: {e}")
+            self.job_store.update(
+                job_id,
+                estado=EnumEstadoImportacion.FALLIDO,
+                mensaje=str(e),
+                fechaFin=datetime.utcnow()
+            )
+        finally:
+            db.close()
+            os.remove(ruta)
@@ -0,0 +1,126 @@
+import logging
+import threading
+from typing import Any, Callable, Dict, Iterable, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from app.persistence.cache_store.impl.memory_cache_store import MemoryCacheStore
+from app.persistence.cache_store.impl.redis_cache_store import RedisCacheStore
+from app.persistence.cache_store.interface.interface_cache_store import ICacheStore
+from app.utils.enviroment import settings
+
+O = TypeVar("O", bound=BaseModel)
+
+PERSONA = "persona:"
+FAMILIA = "familia:"
+RESUMEN = "resumen:"
+PARCIALIDAD = "parcialidad:"
+
+logger = logging.getLogger(__name__)
+
+
+class LecturasCache:
+    """
+    Caché read-through, entre requests, de las lecturas por id más consultadas
+    (persona, familia, resumen de familia y parcialidad). Guarda el modelo de
+    salida serializado en JSON, así sirve igual con el backend en memoria que
+    con uno compartido. Los managers invalidan las claves en sus escrituras;
+    el TTL acota lo que cambie por otros caminos.
+
+    Si el backend falla se consulta la base como si no hubiera caché.
+
+    Como en ValorEnCache, una lectura en curso no guarda su resultado si hubo
+    una invalidación mientras consultaba la base (podría traer la fila
+    anterior al commit). La generación es del proceso: con redis acota las
+    carreras de este worker; las de otros workers las acota el TTL.
+    """
+
+    def __init__(self, store: Optional[ICacheStore]):
+        self.store = store
+        self._lock = threading.Lock()
+        self._contadores = {"aciertos": 0, "fallos": 0, "errores": 0}
+        self._generacion = 0
+        self._lock_generacion = threading.Lock()
+
+    def obtener(self, clave: str, modelo: Type[O], calcular: Callable[[], Any]) -> O:
+        if self.store is None:
+            return modelo.model_validate(calcular())
+
+        guardado = self._intentar(lambda: self.store.get(clave))
+        if guardado is not None:
+            self._sumar("aciertos")
+            return modelo.model_validate_json(guardado)
+
+        self._sumar("fallos")
+        generacion = self._generacion
+        valor = modelo.model_validate(calcular())
+        with self._lock_generacion:
+            if generacion == self._generacion:
+                self._intentar(lambda: self.store.set(clave, valor.model_dump_json()))
+        return valor
+
+    def invalidar_personas(self, ids: Iterable[Any]) -> None:
+        self._borrar(PERSONA + str(id) for id in ids if id is not None)
+
+    def invalidar_familias(self, ids: Iterable[Any]) -> None:
+        self._borrar(
+            prefijo + str(id)
+            for id in ids if id is not None
+            for prefijo in (FAMILIA, RESUMEN)
+        )
+
+    def invalidar_parcialidades(self) -> None:
+        # El nombre de la parcialidad va embebido en personas, familias y
+        # resúmenes; cambia muy poco, así que se descarta todo
+        for prefijo in (PARCIALIDAD, PERSONA, FAMILIA, RESUMEN):
+            self.limpiar(prefijo)
+
+    def limpiar(self, prefijo: str) -> None:
+        if self.store is not None:
+            self._nueva_generacion()
+            self._intentar(lambda: self.store.delete_prefix(prefijo))
+
+    def resumen(self) -> Dict[str, Any]:
+        with self._lock:
+            valores = dict(self._contadores)
+        total = valores["aciertos"] + valores["fallos"]
+        return {
+            "backend": settings.lecturas_cache_backend,
+            **valores,
+            "tasa_aciertos": round(valores["aciertos"] / total, 4) if total else 0.0,
+        }
+
+    def _borrar(self, claves: Iterable[str]) -> None:
+        claves = list(claves)
+        if self.store is not None and claves:
+            self._nueva_generacion()
+            self._intentar(lambda: self.store.delete(claves))
+
+    def _nueva_generacion(self) -> None:
+        with self._lock_generacion:
+            self._generacion += 1
+
+    def _intentar(self, operacion: Callable[[], Any]) -> Any:
+        try:
+            return operacion()
+        except Exception as e:
+            self._sumar("errores")
+            logger.warning(f"[LecturasCache] ⚠️ Backend de caché no disponible: {e}")
+            return None
+
+    def _sumar(self, contador: str) -> None:
+        with self._lock:
+            self._contadores[contador] += 1
+
+
+def crear_store() -> Optional[ICacheStore]:
+    if settings.lecturas_cache_backend == "none":
+        return None
+    if settings.lecturas_cache_backend == "redis":
+        return RedisCacheStore(
+            url=settings.lecturas_cache_redis_url, ttl=settings.lecturas_cache_ttl)
+    return MemoryCacheStore(
+        maxsize=settings.lecturas_cache_maxsize, ttl=settings.lecturas_cache_ttl)
+
+
+lecturas_cache = LecturasCache(crear_store())
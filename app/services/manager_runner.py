@@ -0,0 +1,40 @@
+import logging
+from typing import Callable, Generic, TypeVar, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.persistence.unit_of_work import UnitOfWork
+
+M = TypeVar("M")
+R = TypeVar("R")
+
+
+class ManagerRunner(Generic[M]):
+    """
+    Ejecuta operaciones de un manager desde rutas async sin bloquear el event loop.
+    Con DB_MODE=sync el manager corre en el threadpool sobre la sesión síncrona;
+    con DB_MODE=async corre dentro de AsyncSession.run_sync, donde cada consulta
+    se espera de forma asíncrona en el loop sin saltos al threadpool.
+
+    Cada operación corre dentro de una UnitOfWork: los repositorios solo hacen
+    flush y la operación se confirma (o revierte) una sola vez al terminar.
+    """
+
+    def __init__(self,
+                 builder: Callable[[Session, logging.Logger], M],
+                 db: Union[Session, AsyncSession],
+                 logger: logging.Logger):
+        self.builder = builder
+        self.db = db
+        self.logger = logger
+
+    async def run(self, operacion: Callable[[M], R]) -> R:
+        def ejecutar(session: Session) -> R:
+            with UnitOfWork(session):
+                return operacion(self.builder(session, self.logger))
+
+        if isinstance(self.db, AsyncSession):
+            return await self.db.run_sync(ejecutar)
+        return await run_in_threadpool(ejecutar, self.db)
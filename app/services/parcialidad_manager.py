@@ -1,31 +1,43 @@
 
-import io
 import logging
-import pandas as pd
 import numpy as np
 from fastapi import UploadFile
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from app.models.inputs.parcialidad.parcialidad_create import ParcialidadCreate
 from app.models.inputs.persona.persona_carga_masiva import CargaMasivaResponse, ErrorPersonaOut
+from app.models.outputs.paginated_response import PaginatedParcialidad
+from app.models.outputs.parcialidad.parcialidad_output import ParcialidadOut
 from app.models.outputs.response_estado import EstadoResponse
 from app.persistence.model.parcialidad import Parcialidad
 from app.persistence.repository.parcialidad_repository.interface.interface_parcialidad_repository import IParcialiadRepository
+from app.services.estadisticas_cache import EstadisticasCache
+from app.services.lecturas_cache import PARCIALIDAD, LecturasCache
+from app.services.parcialidad_resolver import ParcialidadResolver
 from app.utils.constans import COLUMNS_PARCIALIDAD
+from app.utils.enviroment import settings
 from app.utils.exceptions_handlers.models.error_response import AppException
+from app.utils.file_reader import ProgresoCallback, leer_por_lotes
 
 
 class ParcialidadManager():
 
     def __init__(self,
                  parcialidad_repository: IParcialiadRepository,
+                 estadisticas_cache: EstadisticasCache,
+                 parcialidad_resolver: ParcialidadResolver,
+                 lecturas_cache: LecturasCache,
                  logger: logging.Logger):
         self.parcialidad_repository: IParcialiadRepository = parcialidad_repository
+        self.estadisticas_cache = estadisticas_cache
+        self.parcialidad_resolver = parcialidad_resolver
+        self.lecturas_cache = lecturas_cache
         self.logger: logging.Logger = logger
 
     def create(self, data: ParcialidadCreate):
         self._validar_parcialidad(data)
         self.parcialidad_repository.create(
             Parcialidad(nombre=data.nombre_parcialidad))
+        self._invalidar_caches()
         return EstadoResponse(estado="Exitoso",
                               message="Parcialidad creada exitosamente")
 
@@ -35,15 +47,21 @@ class ParcialidadManager():
             raise AppException(
                 f"No existe una parcialidad con ese id : {parcialidad_id}")
         self.parcialidad_repository.delete(parcialidad.id)
+        self._invalidar_caches()
+        self.lecturas_cache.invalidar_parcialidades()
         return EstadoResponse(estado="Exitoso",
                               message="Parcialidad eliminada exitosamente")
 
-    def get_parcialidades(self, page: int, page_size: int, filters: Dict[str, Any]):
+    def get_parcialidades(self, page: int, page_size: int, filters: Dict[str, Any], cursor: Optional[str] = None):
         parcialidades = self.parcialidad_repository.find_by_params(
-            page, page_size, filters)
-        return parcialidades
+            page, page_size, filters, cursor)
+        return PaginatedParcialidad.model_validate(parcialidades, from_attributes=True)
 
-    def get_parcialidad_by_id(self, id: int):
+    def get_parcialidad_by_id(self, id: int) -> ParcialidadOut:
+        return self.lecturas_cache.obtener(
+            PARCIALIDAD + str(id), ParcialidadOut, lambda: self._buscar_parcialidad(id))
+
+    def _buscar_parcialidad(self, id: int) -> Parcialidad:
         parcialidad = self.parcialidad_repository.get(id)
         if parcialidad is None:
             raise AppException("Parcialidad no Encontrada", 404)
@@ -53,22 +71,27 @@ class ParcialidadManager():
         parcialidad = self.parcialidad_repository.get(id)
         if parcialidad is None:
             raise AppException("Parcialidad a actualizar no existe")
-        parcialidad_name = self.parcialidad_repository.find_by_name(
-            parcialidad_data.nombre_parcialidad)
+        parcialidad_name = self.parcialidad_resolver.resolver(
+            parcialidad_data.nombre_parcialidad, self.parcialidad_repository)
         if parcialidad_name is not None:
             raise AppException("ya existe una parcialidad con ese nombre")
         parcialidad.nombre = parcialidad_data.nombre_parcialidad
         self.parcialidad_repository.update(id, parcialidad)
+        self._invalidar_caches()
+        self.lecturas_cache.invalidar_parcialidades()
         return EstadoResponse(estado="Exitoso", message="Parcialidad actualizada exitosamente")
 
-    async def upload_excel(self, file: UploadFile) -> CargaMasivaResponse:
+    def upload_excel(self, file: UploadFile, progreso: ProgresoCallback = None) -> CargaMasivaResponse:
+        insertados = 0
+        total_procesados = 0
+        errores: List[ErrorPersonaOut] = []
+
         try:
-            content = await file.read()
-            df = pd.read_excel(io.BytesIO(content))
+            columnas, lotes = leer_por_lotes(file, settings.upload_batch_size)
 
             # ✅ Validar columnas requeridas
             missing = [
-                col for col in COLUMNS_PARCIALIDAD if col not in df.columns]
+                col for col in COLUMNS_PARCIALIDAD if col not in columnas]
             if missing:
                 return CargaMasivaResponse(
                     status="error",
@@ -81,48 +104,59 @@ class ParcialidadManager():
                     ],
                 )
 
-            df = df.replace({np.nan: None})  # NaN → None
-
-            parcialidades: List[ParcialidadCreate] = []
-            errores: List[ErrorPersonaOut] = []
-
-            for i, row in df.iterrows():
-                try:
-                    data = ParcialidadCreate(**row.to_dict())
-                    self._validar_parcialidad(data)
-                    parcialidades.append(Parcialidad(
-                        nombre=data.nombre_parcialidad))
-
-                except Exception as e:
-                    errores.append(
-                        ErrorPersonaOut(
-                            fila=i + 2,  # Excel fila
-                            id=None,
-                            mensaje=str(e),
+            # Cada lote se valida e inserta antes de leer el siguiente
+            for df in lotes:
+                df = df.replace({np.nan: None})  # NaN → None
+
+                parcialidades: List[Parcialidad] = []
+
+                for i, row in df.iterrows():
+                    try:
+                        data = ParcialidadCreate(**row.to_dict())
+                        self._validar_parcialidad(data)
+                        parcialidades.append(Parcialidad(
+                            nombre=data.nombre_parcialidad))
+
+                    except Exception as e:
+                        errores.append(
+                            ErrorPersonaOut(
+                                fila=i + 2,  # Excel fila
+                                id=None,
+                                mensaje=str(e),
+                            )
                         )
-                    )
 
-            insertados = 0
-            if parcialidades:
-                insertados = self.parcialidad_repository.bulk_insert(
-                    parcialidades)
+                total_procesados += len(df)
+                if parcialidades:
+                    insertados += self.parcialidad_repository.bulk_insert(
+                        parcialidades)
+                    self._invalidar_caches()
+
+                if progreso:
+                    progreso(total_procesados, insertados, len(errores))
 
             return CargaMasivaResponse(
                 status="ok",
                 insertados=insertados,
-                total_procesados=len(parcialidades) + len(errores),
+                total_procesados=total_procesados,
                 errores=errores,
             )
 
         except Exception as e:
             return CargaMasivaResponse(
                 status="error",
-                errores=[ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
+                insertados=insertados,
+                total_procesados=total_procesados,
+                errores=errores + [ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
             )
 
     def _validar_parcialidad(self, data: ParcialidadCreate) -> None:
-        parcialidad = self.parcialidad_repository.find_by_name(
-            data.nombre_parcialidad)
+        parcialidad = self.parcialidad_resolver.resolver(
+            data.nombre_parcialidad, self.parcialidad_repository)
         if parcialidad is not None:
             raise AppException(
                 f"Ya existe una parcialidad con el nombre '{data.nombre_parcialidad}'")
+
+    def _invalidar_caches(self) -> None:
+        self.parcialidad_resolver.invalidar()
+        self.estadisticas_cache.invalidar()
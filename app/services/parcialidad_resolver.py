@@ -0,0 +1,60 @@
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from app.persistence.repository.parcialidad_repository.interface.interface_parcialidad_repository import IParcialiadRepository
+from app.utils.enviroment import settings
+from app.utils.ttl_cache import ValorEnCache
+from app.utils.util_functions import normalizar_texto
+
+
+class ParcialidadNombre(NamedTuple):
+    id: int
+    nombre: str
+    normalizado: str
+
+
+class ParcialidadResolver:
+    """
+    Resuelve nombres de parcialidad desde memoria. La tabla es pequeña y casi
+    no cambia, así que se carga completa una vez y se responde con la misma
+    semántica de find_by_name (ILIKE '%nombre%' ordenado por posición y
+    largo), comparando sin mayúsculas, tildes ni espacios repetidos.
+    ParcialidadManager la invalida en cada escritura.
+    """
+
+    def __init__(self, ttl: float):
+        self._parcialidades = ValorEnCache(ttl)
+
+    def resolver(self, nombre: Optional[str],
+                 repository: IParcialiadRepository) -> Optional[ParcialidadNombre]:
+        buscado = normalizar_texto(nombre)
+        if not buscado:
+            return None
+
+        mejor, mejor_orden = None, None
+        for parcialidad in self._cargar(repository):
+            posicion = parcialidad.normalizado.find(buscado)
+            if posicion < 0:
+                continue
+            orden = (posicion, len(parcialidad.normalizado), parcialidad.id)
+            if mejor_orden is None or orden < mejor_orden:
+                mejor, mejor_orden = parcialidad, orden
+        return mejor
+
+    def resolver_varios(self, nombres: Iterable[Optional[str]],
+                        repository: IParcialiadRepository) -> Dict[str, Optional[ParcialidadNombre]]:
+        return {
+            nombre: self.resolver(nombre, repository)
+            for nombre in {nombre for nombre in nombres if nombre}
+        }
+
+    def invalidar(self) -> None:
+        self._parcialidades.invalidar()
+
+    def _cargar(self, repository: IParcialiadRepository) -> List[ParcialidadNombre]:
+        return self._parcialidades.obtener(lambda: [
+            ParcialidadNombre(id, nombre, normalizar_texto(nombre))
+            for id, nombre in repository.find_all_nombres()
+        ])
+
+
+parcialidad_resolver = ParcialidadResolver(ttl=settings.parcialidad_resolver_ttl)
@@ -1,8 +1,7 @@
-import io
 import logging
 import pandas as pd
 import numpy as np
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from fastapi import UploadFile
 
 from app.models.inputs.familia.assing_familia_users import AssingFamilia
@@ -13,17 +12,27 @@ from app.models.inputs.persona.persona_update import PersonaDefuncion, PersonaUp
 from app.models.outputs.familia.familia_asignacion_response import AsignacionFamiliaResponse
 from app.models.outputs.familia.familia_output import FamiliaResumenOut
 from app.models.outputs.paginated_response import PaginatedPersonas
+from app.models.outputs.persona.persona_output import PersonaOut
 from app.models.outputs.response_estado import EstadoResponse
 from app.persistence.model.familia import Familia
 from app.persistence.model.miembro_familia import MiembroFamilia
 from app.persistence.model.persona import Persona
 from app.persistence.repository.familia_repository.interface.interface_familia_repository import IFamiliaRepository
+from app.persistence.repository.familia_stats_repository.interface.interface_familia_stats_repository import IFamiliaStatsRepository
 from app.persistence.repository.miembro_familia_repository.interface.inteface_miembro_familia import IMiembroRepository
 from app.persistence.repository.parcialidad_repository.interface.interface_parcialidad_repository import IParcialiadRepository
+from app.persistence.repository.persona_token_repository.interface.interface_persona_token_repository import IPersonaTokenRepository
 from app.persistence.repository.persona_repository.interface.interface_persona_repository import IPersonaRepository
 from app.persistence.repository.user_repository.interface.interface_user_repository import IUsuarioRepository
-from app.utils.constans import COLUMNS_PERSONA
-from app.utils.exceptions_handlers.models.error_response import AppException
+from app.services.estadisticas_cache import EstadisticasCache
+from app.services.lecturas_cache import PERSONA, RESUMEN, LecturasCache
+from app.services.parcialidad_resolver import ParcialidadResolver
+from app.utils.constans import (
+    COLUMNS_PERSONA, MAX_LENGTH_PERSONA, VALID_DOC, VALID_ESCOLARIDAD, VALID_SEXO
+)
+from app.utils.enviroment import settings
+from app.utils.exceptions_handlers.models.error_response import AppException, BulkInsertError
+from app.utils.file_reader import ProgresoCallback, leer_por_lotes, texto_celda
 
 
 class PersonaManager:
@@ -34,6 +43,11 @@ class PersonaManager:
         familia_repository: IFamiliaRepository,
         parcialidad_repository: IParcialiadRepository,
         miembro_repository: IMiembroRepository,
+        familia_stats_repository: IFamiliaStatsRepository,
+        persona_token_repository: IPersonaTokenRepository,
+        estadisticas_cache: EstadisticasCache,
+        parcialidad_resolver: ParcialidadResolver,
+        lecturas_cache: LecturasCache,
         logger: logging.Logger,
     ):
         self.usuario_repository: IUsuarioRepository = usuario_repository
@@ -41,6 +55,11 @@ class PersonaManager:
         self.familia_repository: IFamiliaRepository = familia_repository
         self.parcialidad_repository: IParcialiadRepository = parcialidad_repository
         self.miembro_repository: IMiembroRepository = miembro_repository
+        self.familia_stats_repository: IFamiliaStatsRepository = familia_stats_repository
+        self.persona_token_repository: IPersonaTokenRepository = persona_token_repository
+        self.estadisticas_cache = estadisticas_cache
+        self.parcialidad_resolver = parcialidad_resolver
+        self.lecturas_cache = lecturas_cache
         self.logger = logger
 
     def create_persona(self, data: PersonaCreate) -> EstadoResponse:
@@ -54,6 +73,10 @@ class PersonaManager:
         persona = self.persona_repository.create(Persona(**persona_data))
         self.miembro_repository.create(MiembroFamilia(
             personaId=persona.id, familiaId=data.idFamilia))
+        self.familia_stats_repository.refresh([data.idFamilia])
+        self.persona_token_repository.indexar([persona])
+        self.estadisticas_cache.invalidar()
+        self.lecturas_cache.invalidar_familias([data.idFamilia])
         self.logger.info(f"Persona creada correctamente: {data.id}")
         return EstadoResponse(estado="Exitoso", message="Persona creada exitosamente")
 
@@ -66,18 +89,35 @@ class PersonaManager:
             raise AppException("Esa persona no está registrada")
 
         self.logger.info(f"Actualizando datos de persona con ID: {id_persona}")
-        self.persona_repository.update(id_persona, data)
+        persona = self.persona_repository.update(id_persona, data)
+        if data.nombre is not None or data.apellido is not None:
+            self.persona_token_repository.indexar([persona])
+        self.estadisticas_cache.invalidar()
+        # Sus datos van embebidos en la familia (representante) y el resumen
+        self.lecturas_cache.invalidar_personas([id_persona])
+        if data.idParcialidad is not None:
+            # La parcialidad del líder forma parte de FamiliaStats
+            self._refrescar_familia_de(id_persona)
+        else:
+            self.lecturas_cache.invalidar_familias(
+                [self._familia_actual_de(id_persona)])
         self.logger.info(f"Persona actualizada correctamente: {id_persona}")
         return EstadoResponse(estado="Exitoso", message="Persona actualizada exitosamente")
 
-    def get_personas(self, page: int, page_size: int, filters: Dict[str, Any]) -> PaginatedPersonas:
+    def get_personas(self, page: int, page_size: int, filters: Dict[str, Any],
+                     cursor: Optional[str] = None) -> PaginatedPersonas:
         self.logger.info(
-            f"Obteniendo personas: página {page}, tamaño {page_size}")
+            f"Obteniendo personas: página {page}, tamaño {page_size}, cursor {cursor}")
         paginated = self.persona_repository.find_all_personas(
-            page, page_size, filters)
-        return paginated
+            page, page_size, filters, cursor)
+        # Una sola validación: los atributos se leen directo de las filas ORM
+        return PaginatedPersonas.model_validate(paginated, from_attributes=True)
+
+    def get_persona(self, id: str) -> PersonaOut:
+        return self.lecturas_cache.obtener(
+            PERSONA + id, PersonaOut, lambda: self._buscar_persona(id))
 
-    def get_persona(self, id: str):
+    def _buscar_persona(self, id: str) -> Persona:
         persona = self.persona_repository.find_persona_by_id(id)
         if persona is None:
             raise AppException("Persona no encontrada", 404)
@@ -89,32 +129,45 @@ class PersonaManager:
 
         personas_no_encontradas = []
         personas_asignadas = []
+        familias_afectadas = {data.familia_id}
         familia = self.familia_repository.get(data.familia_id)
         if not familia:
             self.logger.error(f"Familia no encontrada: {data.familia_id}")
             raise AppException("La Familia asignada no existe")
 
+        # Personas y membresías actuales en dos consultas para todo el lote
+        existentes = self.persona_repository.get_existing_ids(data.personas_id)
+        actuales = self.miembro_repository.get_familias_actuales(existentes)
+
+        miembros_a_eliminar: List[int] = []
+        personas_a_crear: List[str] = []
+        procesadas = set()
         for persona_id in data.personas_id:
-            self.logger.info(f"Procesando persona: {persona_id}")
-            persona = self.persona_repository.get(persona_id)
-            if not persona:
+            if persona_id not in existentes:
                 self.logger.warning(f"Persona no encontrada: {persona_id}")
                 personas_no_encontradas.append(persona_id)
                 continue
-            miembro_anterior = self.miembro_repository.get_familia_actual(
-                persona_id)
+            personas_asignadas.append(persona_id)
+            # Un id repetido en la solicitud ya quedó en la familia destino
+            if persona_id in procesadas:
+                continue
+            procesadas.add(persona_id)
+            miembro_anterior = actuales.get(persona_id)
+            if miembro_anterior and miembro_anterior.familiaId == data.familia_id:
+                continue
             if miembro_anterior:
-                if miembro_anterior.familiaId == data.familia_id:
-                    personas_asignadas.append(persona_id)
-                    continue
-                else:
-                    self.miembro_repository.delete(miembro_anterior.id)
-            self.miembro_repository.create(MiembroFamilia(
-                personaId=persona_id, familiaId=data.familia_id))
+                familias_afectadas.add(miembro_anterior.familiaId)
+                miembros_a_eliminar.append(miembro_anterior.id)
+            personas_a_crear.append(persona_id)
 
-            personas_asignadas.append(persona_id)
-            self.logger.info(
-                f"Persona asignada a familia {data.familia_id}: {persona_id}")
+        self.miembro_repository.reasignar(
+            miembros_a_eliminar, personas_a_crear, data.familia_id)
+        self.logger.info(
+            f"Personas movidas a familia {data.familia_id}: {personas_a_crear}")
+
+        self.familia_stats_repository.refresh(familias_afectadas)
+        self.lecturas_cache.invalidar_personas(personas_a_crear)
+        self.lecturas_cache.invalidar_familias(familias_afectadas)
 
         self.logger.info(f"Personas asignadas: {personas_asignadas}")
         self.logger.info(f"Personas no encontradas: {personas_no_encontradas}")
@@ -152,6 +205,9 @@ class PersonaManager:
             )
 
         self.miembro_repository.delete(miembro.id)
+        self.familia_stats_repository.refresh([miembro.familiaId])
+        self.lecturas_cache.invalidar_personas([persona_id])
+        self.lecturas_cache.invalidar_familias([miembro.familiaId])
 
         self.logger.info(
             f"[PersonaManager] Persona {persona_id} desasignada correctamente de su familia")
@@ -161,13 +217,16 @@ class PersonaManager:
             message=f"Persona {persona_id} desasignada exitosamente de su familia"
         )
 
-    async def upload_excel(self, file: UploadFile) -> CargaMasivaResponse:
+    def upload_excel(self, file: UploadFile, progreso: ProgresoCallback = None) -> CargaMasivaResponse:
+        insertados = 0
+        total_procesados = 0
+        errores: List[ErrorPersonaOut] = []
+
         try:
-            content = await file.read()
-            df = pd.read_excel(io.BytesIO(content))
+            columnas, lotes = leer_por_lotes(file, settings.upload_batch_size)
 
             # ✅ Validar columnas
-            missing = [col for col in COLUMNS_PERSONA if col not in df.columns]
+            missing = [col for col in COLUMNS_PERSONA if col not in columnas]
             if missing:
                 return CargaMasivaResponse(
                     status="error",
@@ -180,48 +239,59 @@ class PersonaManager:
                     ],
                 )
 
-            # ✅ Normalizar datos antes de validación
-            df["id"] = df["id"].astype(str)              # siempre string
-            df["telefono"] = df["telefono"].astype(str)  # siempre string
-            df = df.replace({np.nan: None})              # NaN → None
-
-            personas: List[PersonaCreate] = []
-            errores: List[ErrorPersonaOut] = []
-
-            for i, row in df.iterrows():
-                try:
-                    persona = PersonaCreateExcel(**row.to_dict())
-                    parcialidad = self.parcialidad_repository.find_by_name(
-                        persona.parcialidad)
-                    persona_create = PersonaCreate(**persona.model_dump())
-                    if parcialidad is not None:
-                        persona_create.idParcialidad = parcialidad.id
-                    self._validar_persona(persona_create)
-                    personas.append(persona_create)
-                except Exception as e:
-                    errores.append(
-                        ErrorPersonaOut(
-                            fila=i + 2,  # +2 porque Excel empieza en 1 y fila 1 es header
-                            id=str(row.get("id")) if row.get("id") else None,
-                            mensaje=str(e),
-                        )
-                    )
-
-            insertados = 0
-            if personas:
-                insertados = self.persona_repository.bulk_insert(personas)
+            # Cada lote se valida e inserta antes de leer el siguiente
+            for df in lotes:
+                # ✅ Normalizar datos antes de validación
+                # Texto sin convertir las celdas vacías en "None"/"nan"
+                df["id"] = df["id"].map(texto_celda)
+                df["telefono"] = df["telefono"].map(texto_celda)
+                df = df.replace({np.nan: None})              # NaN → None
+
+                personas, errores_lote = self._validar_lote_personas(df)
+                errores.extend(errores_lote)
+                total_procesados += len(personas) + len(errores_lote)
+
+                if personas:
+                    insertados += self.persona_repository.bulk_insert(personas)
+                    self.familia_stats_repository.refresh(
+                        persona.idFamilia for persona in personas)
+                    self.persona_token_repository.indexar(personas)
+                    self.estadisticas_cache.invalidar()
+                    self.lecturas_cache.invalidar_familias(
+                        {persona.idFamilia for persona in personas})
+
+                if progreso:
+                    progreso(total_procesados, insertados, len(errores))
 
             return CargaMasivaResponse(
                 status="ok",
                 insertados=insertados,
-                total_procesados=len(personas) + len(errores),
+                total_procesados=total_procesados,
                 errores=errores,
             )
 
+        except BulkInsertError as e:
+            self.logger.error(f"[PersonaManager] {e.mensaje}")
+            # Los bloques anteriores al fallido quedaron confirmados
+            self.familia_stats_repository.refresh(
+                persona.idFamilia for persona in personas)
+            self.persona_token_repository.indexar(personas[:e.insertados])
+            self.estadisticas_cache.invalidar()
+            self.lecturas_cache.invalidar_familias(
+                {persona.idFamilia for persona in personas})
+            return CargaMasivaResponse(
+                status="error",
+                insertados=insertados + e.insertados,
+                total_procesados=total_procesados,
+                errores=errores + [ErrorPersonaOut(fila=0, id=None, mensaje=e.mensaje)],
+            )
+
         except Exception as e:
             return CargaMasivaResponse(
                 status="error",
-                errores=[ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
+                insertados=insertados,
+                total_procesados=total_procesados,
+                errores=errores + [ErrorPersonaOut(fila=0, id=None, mensaje=str(e))],
             )
 
     def registrar_defuncion(self, data: PersonaDefuncion) -> EstadoResponse:
@@ -246,6 +316,8 @@ class PersonaManager:
 
         persona.fechaDefuncion = data.fechaDefuncion
         self.persona_repository.update(data.id, persona)
+        self._refrescar_familia_de(data.id)
+        self.lecturas_cache.invalidar_personas([data.id])
 
         self.logger.info(
             f"[PersonaManager] Fecha de defunción registrada para persona {data.id}")
@@ -255,13 +327,110 @@ class PersonaManager:
             message=f"Fecha de defunción registrada para la persona {data.id}"
         )
 
+    def _refrescar_familia_de(self, persona_id: str) -> None:
+        familia_id = self._familia_actual_de(persona_id)
+        if familia_id is not None:
+            self.familia_stats_repository.refresh([familia_id])
+            self.lecturas_cache.invalidar_familias([familia_id])
+
+    def _familia_actual_de(self, persona_id: str) -> Optional[int]:
+        miembro = self.miembro_repository.get_familia_actual(persona_id)
+        return miembro.familiaId if miembro is not None else None
+
     def get_familia_resumen(self, id_familia: int) -> FamiliaResumenOut:
         """
         Retorna la información resumen de una familia.
         """
         self.logger.info(
             f"[FamiliaManager] Consultando resumen de familia {id_familia}")
-        return self.familia_repository.get_familia_resumen(id_familia)
+        return self.lecturas_cache.obtener(
+            RESUMEN + str(id_familia), FamiliaResumenOut,
+            lambda: self.familia_repository.get_familia_resumen(id_familia))
+
+    def _validar_lote_personas(
+        self, df: pd.DataFrame
+    ) -> Tuple[List[PersonaCreate], List[ErrorPersonaOut]]:
+        """
+        Valida un bloque de filas del Excel en conjunto: primero con máscaras
+        vectorizadas sobre las columnas y luego contra la base de datos con
+        unas pocas consultas IN (...), en lugar de varias consultas por fila.
+        El índice del DataFrame se usa para reportar la fila del Excel.
+        """
+        errores: Dict[Any, str] = {}
+
+        def marcar(mask: pd.Series, mensaje: str):
+            # Solo se conserva el primer error de cada fila
+            for idx in df.index[mask.to_numpy(dtype=bool)]:
+                errores.setdefault(idx, mensaje)
+
+        # --- Validaciones vectorizadas por columna ---
+        for col in COLUMNS_PERSONA:
+            if col == "profesion":
+                continue
+            vacios = df[col].isna() | df[col].astype(str).str.strip().isin(["", "nan", "None"])
+            marcar(vacios, f"El campo '{col}' es obligatorio")
+
+        for col, validos in (
+            ("tipoDocumento", VALID_DOC),
+            ("sexo", VALID_SEXO),
+            ("escolaridad", VALID_ESCOLARIDAD),
+        ):
+            marcar(df[col].notna() & ~df[col].isin(validos),
+                   f"Valor inválido en '{col}': debe ser uno de {sorted(validos)}")
+
+        for col, maximo in MAX_LENGTH_PERSONA.items():
+            largo = df[col].astype(str).str.len()
+            marcar(df[col].notna() & (largo > maximo),
+                   f"El campo '{col}' supera los {maximo} caracteres")
+
+        marcar(df["id"].duplicated(keep="first"),
+               "Documento duplicado dentro del archivo")
+
+        # --- Conversión a modelos solo de las filas que pasaron las máscaras ---
+        validas = df.loc[~df.index.isin(list(errores))]
+        candidatas: List[Tuple[Any, PersonaCreateExcel, PersonaCreate]] = []
+        for idx, fila in zip(validas.index, validas.to_dict("records")):
+            try:
+                persona = PersonaCreateExcel(**fila)
+                candidatas.append(
+                    (idx, persona, PersonaCreate(**persona.model_dump())))
+            except Exception as e:
+                errores[idx] = str(e)
+
+        # --- Validaciones contra base de datos, en lote ---
+        parcialidades = self.parcialidad_resolver.resolver_varios(
+            (persona.parcialidad for _, persona, _ in candidatas),
+            self.parcialidad_repository)
+        familias_existentes = self.familia_repository.get_existing_ids(
+            create.idFamilia for _, _, create in candidatas)
+        personas_existentes = self.persona_repository.get_existing_ids(
+            create.id for _, _, create in candidatas)
+
+        personas: List[PersonaCreate] = []
+        for idx, persona, persona_create in candidatas:
+            parcialidad = parcialidades.get(persona.parcialidad)
+            if parcialidad is not None:
+                persona_create.idParcialidad = parcialidad.id
+
+            if (persona_create.idFamilia is not None
+                    and persona_create.idFamilia not in familias_existentes):
+                errores[idx] = "La Familia asignada no existe"
+            elif persona_create.id in personas_existentes:
+                errores[idx] = "Ese documento ya se encuentra registrado"
+            else:
+                personas.append(persona_create)
+
+        self.logger.info(
+            f"[PersonaManager] Lote validado | Válidas: {len(personas)}, Errores: {len(errores)}")
+
+        return personas, [
+            ErrorPersonaOut(
+                fila=idx + 2,  # +2 porque Excel empieza en 1 y fila 1 es header
+                id=str(df.at[idx, "id"]) if df.at[idx, "id"] else None,
+                mensaje=mensaje,
+            )
+            for idx, mensaje in sorted(errores.items())
+        ]
 
     def _validar_persona(self, data: PersonaCreate) -> Familia | None:
         """
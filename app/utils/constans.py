@@ -21,4 +21,14 @@ COLUMNS_FAMILIA = ["idFamilia","cedulaRepresentante"]
 VALID_DOC = {e.value for e in EnumDocumento}
 VALID_SEXO = {e.value for e in EnumSexo}
 VALID_PARENTESCO = {e.value for e in EnumParentesco}
-VALID_ESCOLARIDAD = {e.value for e in EnumEscolaridad}
\ No newline at end of file
+VALID_ESCOLARIDAD = {e.value for e in EnumEscolaridad}
+
+# Longitudes máximas de las columnas de la carga masiva de personas
+MAX_LENGTH_PERSONA = {
+    "id": 20,
+    "nombre": 50,
+    "apellido": 50,
+    "profesion": 100,
+    "direccion": 200,
+    "telefono": 20,
+}
@@ -12,3 +12,17 @@ class AppException(Exception):
     def __init__(self, mensaje: str, codigo_http: int = status.HTTP_400_BAD_REQUEST):
         self.mensaje = mensaje
         self.codigo_http = codigo_http
+
+
+class BulkInsertError(AppException):
+    """
+    Error de una carga masiva por bloques: indica qué bloque falló y cuántos
+    registros de los bloques anteriores ya quedaron confirmados.
+    """
+
+    def __init__(self, bloque: int, insertados: int, mensaje: str):
+        super().__init__(
+            f"Error insertando el bloque {bloque} "
+            f"({insertados} registros ya insertados): {mensaje}")
+        self.bloque = bloque
+        self.insertados = insertados
@@ -0,0 +1,81 @@
+from itertools import chain
+from typing import IO, Any, Callable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+from fastapi import UploadFile
+from openpyxl import load_workbook
+
+# Avance de una carga masiva: (filas procesadas, insertados, errores)
+ProgresoCallback = Optional[Callable[[int, int, int], None]]
+
+
+def texto_celda(valor: Any) -> Optional[str]:
+    """
+    Valor de una celda como texto, o None si está vacía. Un número entero que
+    llegó como float (pandas vuelve float la columna si tiene celdas vacías)
+    se escribe sin el ".0": 1030567890.0 -> "1030567890".
+    """
+    if valor is None or pd.isna(valor):
+        return None
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return str(valor)
+
+
+def leer_por_lotes(file: UploadFile, batch_size: int) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+    """
+    Abre un archivo de carga masiva (xlsx o csv) sin cargarlo completo en memoria.
+    Retorna las columnas del encabezado y un iterador de DataFrames de como máximo
+    batch_size filas. El índice de cada DataFrame es la posición de la fila de datos
+    (0 = primera fila después del encabezado), así la fila de Excel es índice + 2.
+    """
+    file.file.seek(0)
+    if _es_csv(file):
+        return _leer_csv(file.file, batch_size)
+    return _leer_xlsx(file.file, batch_size)
+
+
+def _es_csv(file: UploadFile) -> bool:
+    nombre = (file.filename or "").lower()
+    return nombre.endswith(".csv") or file.content_type == "text/csv"
+
+
+def _leer_csv(stream: IO[bytes], batch_size: int) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+    lector = pd.read_csv(stream, chunksize=batch_size)
+    primero = next(lector, None)
+    if primero is None:
+        return [], iter(())
+    return list(primero.columns), chain([primero], lector)
+
+
+def _leer_xlsx(stream: IO[bytes], batch_size: int) -> Tuple[List[str], Iterator[pd.DataFrame]]:
+    # read_only recorre la hoja fila por fila sin construir el libro en memoria
+    libro = load_workbook(stream, read_only=True, data_only=True)
+    filas = libro.active.iter_rows(values_only=True)
+
+    encabezado = next(filas, None) or ()
+    columnas = [
+        str(valor) if valor is not None else f"Unnamed: {i}"
+        for i, valor in enumerate(encabezado)
+    ]
+
+    def lotes() -> Iterator[pd.DataFrame]:
+        try:
+            lote, indices = [], []
+            for posicion, fila in enumerate(filas):
+                if all(valor is None for valor in fila):
+                    continue
+                fila = tuple(fila[:len(columnas)])
+                lote.append(fila + (None,) * (len(columnas) - len(fila)))
+                indices.append(posicion)
+
+                if len(lote) >= batch_size:
+                    yield pd.DataFrame(lote, columns=columnas, index=indices)
+                    lote, indices = [], []
+
+            if lote:
+                yield pd.DataFrame(lote, columns=columnas, index=indices)
+        finally:
+            libro.close()
+
+    return columnas, lotes()
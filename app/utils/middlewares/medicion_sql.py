@@ -0,0 +1,88 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config.sql_metrics import MedicionSql, medicion_actual, metricas_sql, ruta_actual
+from app.utils.enviroment import settings
+
+logger = logging.getLogger(__name__)
+
+# Requests que no coincidieron con ninguna ruta (404) se agrupan aquí
+SIN_RUTA = "<sin ruta>"
+
+
+def cabeceras_debug_activas() -> bool:
+    if settings.sql_debug_headers is not None:
+        return settings.sql_debug_headers
+    return settings.server_mode == "dev"
+
+
+class MedicionSqlMiddleware:
+    """
+    Mide las sentencias SQL de cada request HTTP: cuántas, cuánto tiempo en
+    base y la más lenta. Lo acumula por plantilla de ruta (metricas_sql),
+    deja una línea de log por request y, en modo debug, lo agrega a la
+    respuesta como X-DB-Queries, X-DB-Time-Ms y X-DB-Slowest-Ms.
+
+    Es ASGI puro (no BaseHTTPMiddleware) para no cambiar cómo se ejecutan
+    las rutas ni el streaming de la respuesta.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.cabeceras = cabeceras_debug_activas()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        medicion = MedicionSql()
+        token_medicion = medicion_actual.set(medicion)
+        token_ruta = ruta_actual.set(scope["path"])
+        inicio = time.perf_counter()
+        estado = 500
+
+        async def enviar(mensaje: Message) -> None:
+            nonlocal estado
+            if mensaje["type"] == "http.response.start":
+                estado = mensaje["status"]
+                if self.cabeceras:
+                    # Con la respuesta armada dentro de runner.run ya se
+                    # ejecutaron todas las sentencias del request
+                    cabeceras = MutableHeaders(scope=mensaje)
+                    cabeceras["X-DB-Queries"] = str(medicion.sentencias)
+                    cabeceras["X-DB-Time-Ms"] = f"{medicion.tiempo * 1000:.3f}"
+                    cabeceras["X-DB-Slowest-Ms"] = f"{medicion.mas_lenta * 1000:.3f}"
+            await send(mensaje)
+
+        try:
+            await self.app(scope, receive, enviar)
+        finally:
+            medicion_actual.reset(token_medicion)
+            ruta_actual.reset(token_ruta)
+            # El router deja la ruta que coincidió en el scope; su path es la
+            # plantilla (/personas/{persona_id}), no el path con valores
+            ruta = getattr(scope.get("route"), "path", SIN_RUTA)
+            metricas_sql.registrar_request(scope["method"], ruta, medicion)
+            if settings.sql_log_requests:
+                self._log(scope["method"], ruta, estado, medicion, time.perf_counter() - inicio)
+
+    @staticmethod
+    def _log(metodo: str, ruta: str, estado: int, medicion: MedicionSql, duracion: float) -> None:
+        campos = {
+            "metodo": metodo,
+            "ruta": ruta,
+            "estado": estado,
+            "sentencias": medicion.sentencias,
+            "tiempo_db_ms": round(medicion.tiempo * 1000, 3),
+            "sentencia_mas_lenta_ms": round(medicion.mas_lenta * 1000, 3),
+            "duracion_ms": round(duracion * 1000, 3),
+        }
+        # clave=valor para grep/agregadores; los mismos campos en extra para
+        # un handler JSON
+        logger.info(
+            "[SQL] " + " ".join(f"{clave}={valor}" for clave, valor in campos.items()),
+            extra={"sql": campos})
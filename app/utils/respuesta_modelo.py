@@ -0,0 +1,26 @@
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+class RespuestaModelo(ORJSONResponse):
+    """
+    Respuesta JSON para un modelo Pydantic que ya está validado. Se serializa
+    directo a bytes con pydantic-core, sin el ciclo que hace FastAPI con el
+    valor retornado (volcarlo a dict, validarlo otra vez contra response_model
+    y pasarlo por jsonable_encoder). El response_model de la ruta se conserva
+    para la documentación OpenAPI.
+
+    Si se crea dentro de runner.run, la serialización ocurre con la sesión
+    abierta y, en DB_MODE=sync, en el threadpool en lugar del event loop.
+    """
+
+    def __init__(self, content: Any, status_code: int = 200, exclude_none: bool = False, **kwargs):
+        self.exclude_none = exclude_none
+        super().__init__(content, status_code=status_code, **kwargs)
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(exclude_none=self.exclude_none).encode()
+        return super().render(content)
@@ -0,0 +1,80 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Caché en memoria con expiración por tiempo y tamaño máximo (descarta el
+    más antiguo). Es segura entre hilos porque los managers corren en el
+    threadpool.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._datos: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, clave: Hashable) -> Optional[Any]:
+        with self._lock:
+            entrada = self._datos.get(clave)
+            if entrada is None:
+                return None
+            expira, valor = entrada
+            if expira < time.monotonic():
+                del self._datos[clave]
+                return None
+            self._datos.move_to_end(clave)
+            return valor
+
+    def set(self, clave: Hashable, valor: Any) -> None:
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+
+    def delete(self, clave: Hashable) -> None:
+        with self._lock:
+            self._datos.pop(clave, None)
+
+    def delete_where(self, condicion: Callable[[Hashable], bool]) -> None:
+        with self._lock:
+            for clave in [clave for clave in self._datos if condicion(clave)]:
+                del self._datos[clave]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._datos.clear()
+
+
+class ValorEnCache:
+    """
+    Un único valor calculado bajo demanda, con TTL e invalidación explícita.
+    Un cálculo en curso no guarda su resultado si hubo una invalidación
+    mientras se ejecutaba.
+    """
+
+    def __init__(self, ttl: float):
+        self._cache = TTLCache(maxsize=1, ttl=ttl)
+        self._generacion = 0
+        self._lock = threading.Lock()
+
+    def obtener(self, calcular: Callable[[], Any]) -> Any:
+        valor = self._cache.get(None)
+        if valor is not None:
+            return valor
+
+        generacion = self._generacion
+        valor = calcular()
+        with self._lock:
+            if generacion == self._generacion:
+                self._cache.set(None, valor)
+        return valor
+
+    def invalidar(self) -> None:
+        with self._lock:
+            self._generacion += 1
+            self._cache.clear()
@@ -1,5 +1,11 @@
+import base64
+import json
+import re
 import secrets
 import string
+import unicodedata
+from typing import Any, List, Optional
+
 def generate_recovery_code(length: int = 6) -> str:
     characters = string.ascii_uppercase + string.digits  # A-Z and 0-9
     return ''.join(secrets.choice(characters) for _ in range(length))
@@ -8,4 +14,31 @@ def generate_temporary_password(length: int = 10) -> str:
     """Genera una contraseña provisional segura."""
     characters = string.ascii_letters + string.digits + "!@#$%^&*()-_=+"
     password = ''.join(secrets.choice(characters) for _ in range(length))
-    return password
\ No newline at end of file
+    return password
+
+
+def encode_cursor(key: Any) -> str:
+    """Cursor opaco para paginación por llave: la última llave vista en base64."""
+    raw = json.dumps({"k": key}, default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Any:
+    padding = "=" * (-len(cursor) % 4)
+    return json.loads(base64.urlsafe_b64decode(cursor + padding))["k"]
+
+
+def normalizar_texto(texto: Optional[str]) -> str:
+    """Minúsculas, sin tildes y con espacios colapsados: 'Pérez  Ñame' → 'perez name'."""
+    if not texto:
+        return ""
+    sin_tildes = "".join(
+        c for c in unicodedata.normalize("NFKD", str(texto))
+        if not unicodedata.combining(c)
+    )
+    return " ".join(sin_tildes.lower().split())
+
+
+def tokenizar(texto: Optional[str]) -> List[str]:
+    """Palabras alfanuméricas del texto normalizado, usadas en la búsqueda por prefijo."""
+    return re.findall(r"[a-z0-9]+", normalizar_texto(texto))
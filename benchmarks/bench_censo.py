@@ -0,0 +1,410 @@
+"""
+Suite de regresión de rendimiento sobre un censo sintético.
+
+Para cada escala genera un censo reproducible (mismas personas, familias,
+parcialidades y membresías para la misma semilla) en la base SQLite del
+benchmark y mide:
+  - consultas: find_all_personas, search_by_representante,
+    get_familias_dashboard, get_miembros_familia y get_familia_resumen,
+    llamando al repositorio con una sesión nueva en cada iteración.
+  - cargas: POST /parcialidad, /familias y /personas /upload-excel con CSV
+    del mismo censo, sobre una base vacía en cada repetición.
+
+Por operación reporta percentiles de latencia, sentencias SQL y tiempo en
+base por llamada, y el pico de memoria (tracemalloc, en una pasada aparte
+para no distorsionar las latencias). El resultado es JSON; con --comparar
+se contrasta con una corrida anterior y termina con código 1 si alguna
+operación hace más sentencias o su p95 empeora más que --tolerancia. Uso:
+
+    python -m benchmarks.bench_censo --escalas 1000,10000 --salida base.json
+    python -m benchmarks.bench_censo --escalas 1000,10000 --comparar base.json
+"""
+import os
+
+# Las cargas pasan por HTTP: las sentencias se leen de las cabeceras X-DB-*
+os.environ.setdefault("SQL_DEBUG_HEADERS", "true")
+os.environ.setdefault("SQL_LOG_REQUESTS", "false")
+os.environ.setdefault("SQL_SLOW_QUERY_MS", "0")
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import csv  # noqa: E402
+import io  # noqa: E402
+import json  # noqa: E402
+import logging  # noqa: E402
+import platform  # noqa: E402
+import random  # noqa: E402
+import sys  # noqa: E402
+import time  # noqa: E402
+import tracemalloc  # noqa: E402
+from datetime import date, datetime, timedelta  # noqa: E402
+from typing import Any, Callable, Dict, List, NamedTuple  # noqa: E402
+
+import httpx  # noqa: E402
+
+from benchmarks.common import percentiles, preparar_base, reiniciar_esquema  # noqa: E402
+
+PREFIX = "/ms-gestion-usuarios"
+TAMANO_PAGINA = 20
+TAMANO_LOTE_SEMILLA = 5000
+
+NOMBRES = ("Ana", "Luis", "María", "José", "Carmen", "Jorge", "Lucía", "Andrés",
+           "Sofía", "Miguel", "Valentina", "Julián", "Camila", "Óscar", "Daniela",
+           "Pedro", "Isabel", "Tomás", "Laura", "Ramiro")
+APELLIDOS = ("García", "Rodríguez", "Muñoz", "Gómez", "Pérez", "Tumiñá", "Yalanda",
+             "Calambás", "Morales", "Ulluné", "Hurtado", "Velasco", "Sánchez",
+             "Ramírez", "Quilindo", "Tunubalá", "Castro", "Ordóñez", "Ruiz", "Vargas")
+
+
+class Censo(NamedTuple):
+    personas: int
+    parcialidades: int = 20
+    # Tamaño de cada familia, uniforme entre los límites
+    miembros_min: int = 1
+    miembros_max: int = 8
+    # Fracciones de personas sin familia y con fecha de defunción
+    sin_familia: float = 0.05
+    fallecidos: float = 0.03
+    familias_inactivas: float = 0.1
+    semilla: int = 42
+
+
+def generar(censo: Censo) -> Dict[str, List[Dict[str, Any]]]:
+    """Filas del censo; el primer miembro de cada familia es su representante"""
+    from app.persistence.model.enum import (
+        EnumDocumento, EnumEscolaridad, EnumEstadoFamilia, EnumParentesco, EnumSexo)
+
+    rng = random.Random(censo.semilla)
+    parcialidades = [{"id": i, "nombre": f"Parcialidad {i}"}
+                     for i in range(1, censo.parcialidades + 1)]
+    familias, personas, miembros = [], [], []
+    restantes, parcialidad_familia = 0, None
+
+    for i in range(censo.personas):
+        cedula = str(10_000_000 + i)
+        en_familia = rng.random() >= censo.sin_familia
+        representante = en_familia and restantes == 0
+        if representante:
+            restantes = rng.randint(censo.miembros_min, censo.miembros_max)
+            parcialidad_familia = rng.randint(1, censo.parcialidades)
+            familias.append({
+                "id": len(familias) + 1,
+                "estado": EnumEstadoFamilia.INACTIVA
+                if rng.random() < censo.familias_inactivas else EnumEstadoFamilia.ACTIVA,
+            })
+
+        personas.append({
+            "id": cedula,
+            "tipoDocumento": EnumDocumento.CC,
+            "nombre": rng.choice(NOMBRES),
+            "apellido": f"{rng.choice(APELLIDOS)} {rng.choice(APELLIDOS)}",
+            "fechaNacimiento": date(1940, 1, 1) + timedelta(days=rng.randint(0, 30000)),
+            "parentesco": EnumParentesco.CF if representante else rng.choice(list(EnumParentesco)),
+            "sexo": rng.choice(list(EnumSexo)),
+            "profesion": None,
+            "escolaridad": rng.choice(list(EnumEscolaridad)),
+            "direccion": f"Vereda {rng.randint(1, 200)}",
+            "telefono": f"3{rng.randint(100000000, 199999999)}",
+            "fechaDefuncion": date(2020, 1, 1) + timedelta(days=rng.randint(0, 1500))
+            if rng.random() < censo.fallecidos else None,
+            "idParcialidad": parcialidad_familia if en_familia
+            else rng.randint(1, censo.parcialidades),
+        })
+        if en_familia:
+            miembros.append({"personaId": cedula, "familiaId": len(familias),
+                             "activo": True, "esRepresentante": representante})
+            restantes -= 1
+
+    return {"parcialidades": parcialidades, "familias": familias,
+            "personas": personas, "miembros": miembros}
+
+
+def sembrar(datos: Dict[str, List[Dict[str, Any]]]) -> None:
+    """Inserta el censo en bloque y reconstruye FamiliaStats y PersonaToken"""
+    from sqlalchemy import insert
+
+    from app.config.database import SessionLocal
+    from app.persistence.model.familia import Familia
+    from app.persistence.model.miembro_familia import MiembroFamilia
+    from app.persistence.model.parcialidad import Parcialidad
+    from app.persistence.model.persona import Persona
+    from app.persistence.repository.familia_stats_repository.impl.familia_stats_repository import FamiliaStatsRepository
+    from app.persistence.repository.persona_token_repository.impl.persona_token_repository import PersonaTokenRepository
+
+    db = SessionLocal()
+    try:
+        for modelo, filas in ((Parcialidad, datos["parcialidades"]), (Familia, datos["familias"]),
+                              (Persona, datos["personas"]), (MiembroFamilia, datos["miembros"])):
+            for inicio in range(0, len(filas), TAMANO_LOTE_SEMILLA):
+                db.execute(insert(modelo), filas[inicio:inicio + TAMANO_LOTE_SEMILLA])
+        db.commit()
+        FamiliaStatsRepository(db).rebuild()
+        PersonaTokenRepository(db).rebuild()
+    finally:
+        db.close()
+
+
+def medir(operacion: Callable[[], Any], iteraciones: int) -> Dict[str, Any]:
+    """Latencias, sentencias y tiempo en base por llamada, más el pico de memoria"""
+    from app.config.sql_metrics import MedicionSql, medicion_actual
+
+    latencias, tiempos_db, sentencias = [], [], []
+    for _ in range(iteraciones):
+        medicion = MedicionSql()
+        token = medicion_actual.set(medicion)
+        try:
+            inicio = time.perf_counter()
+            operacion()
+            latencias.append((time.perf_counter() - inicio) * 1000)
+        finally:
+            medicion_actual.reset(token)
+        sentencias.append(medicion.sentencias)
+        tiempos_db.append(medicion.tiempo * 1000)
+
+    tracemalloc.start()
+    try:
+        operacion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "latencia_ms": percentiles(latencias),
+        "tiempo_db_ms": percentiles(tiempos_db),
+        "sentencias": max(sentencias),
+        "memoria_pico_kb": round(pico / 1024, 1),
+    }
+
+
+def consultas(datos: Dict[str, List[Dict[str, Any]]], rng: random.Random
+              ) -> Dict[str, Callable[[Any], Any]]:
+    from app.persistence.repository.familia_repository.impl.familia_repository import FamiliaRepository
+    from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+
+    familias = [familia["id"] for familia in datos["familias"]]
+    parcialidades = len(datos["parcialidades"])
+    pagina_media = max(1, len(datos["personas"]) // TAMANO_PAGINA // 2)
+
+    return {
+        "find_all_personas": lambda db: PersonaRepository(db).find_all_personas(
+            1, TAMANO_PAGINA, {}),
+        "find_all_personas.pagina_media": lambda db: PersonaRepository(db).find_all_personas(
+            pagina_media, TAMANO_PAGINA, {}),
+        "find_all_personas.por_parcialidad": lambda db: PersonaRepository(db).find_all_personas(
+            1, TAMANO_PAGINA, {"idParcialidad": rng.randint(1, parcialidades)}),
+        "search_by_representante": lambda db: FamiliaRepository(db).search_by_representante(
+            1, TAMANO_PAGINA, rng.choice(APELLIDOS)),
+        "search_by_representante.por_parcialidad":
+            lambda db: FamiliaRepository(db).search_by_representante(
+                1, TAMANO_PAGINA, None, parcialidad_id=rng.randint(1, parcialidades)),
+        "get_familias_dashboard": lambda db: FamiliaRepository(db).get_familias_dashboard(
+            1, TAMANO_PAGINA),
+        "get_miembros_familia": lambda db: FamiliaRepository(db).get_miembros_familia(
+            rng.choice(familias), None, 1, TAMANO_PAGINA, False),
+        "get_familia_resumen": lambda db: FamiliaRepository(db).get_familia_resumen(
+            rng.choice(familias)),
+    }
+
+
+def medir_consultas(datos, iteraciones: int, semilla: int) -> Dict[str, Any]:
+    from app.config.database import SessionLocal
+
+    def en_sesion(consulta):
+        # Una sesión por llamada, como en un request
+        def ejecutar():
+            db = SessionLocal()
+            try:
+                return consulta(db)
+            finally:
+                db.close()
+        return ejecutar
+
+    rng = random.Random(semilla)
+    return {nombre: medir(en_sesion(consulta), iteraciones)
+            for nombre, consulta in consultas(datos, rng).items()}
+
+
+def _csv(columnas: List[str], filas) -> bytes:
+    salida = io.StringIO()
+    escritor = csv.writer(salida)
+    escritor.writerow(columnas)
+    escritor.writerows(filas)
+    return salida.getvalue().encode()
+
+
+def archivos_carga(datos) -> List[tuple]:
+    """(nombre, ruta, CSV, filas esperadas) en el orden en que deben cargarse"""
+    from app.utils.constans import COLUMNS_FAMILIA, COLUMNS_PARCIALIDAD, COLUMNS_PERSONA
+
+    nombres = {p["id"]: p["nombre"] for p in datos["parcialidades"]}
+    familia_de = {m["personaId"]: m["familiaId"] for m in datos["miembros"]}
+    personas = [
+        [p["id"], p["tipoDocumento"].value, p["nombre"], p["apellido"],
+         p["fechaNacimiento"].isoformat(), p["sexo"].value, "", p["escolaridad"].value,
+         p["direccion"], p["telefono"], nombres[p["idParcialidad"]], familia_de.get(p["id"], "")]
+        for p in datos["personas"]
+    ]
+    return [
+        ("parcialidades", "/parcialidad/upload-excel",
+         _csv(COLUMNS_PARCIALIDAD, ([p["nombre"]] for p in datos["parcialidades"])),
+         len(datos["parcialidades"])),
+        # Los representantes se asignan al cargar las personas en su familia
+        ("familias", "/familias/upload-excel",
+         _csv(COLUMNS_FAMILIA, ([f["id"], ""] for f in datos["familias"])),
+         len(datos["familias"])),
+        ("personas", "/personas/upload-excel",
+         _csv(COLUMNS_PERSONA + ["idFamilia"], personas), len(personas)),
+    ]
+
+
+async def medir_cargas(datos, repeticiones: int) -> Dict[str, Any]:
+    from app import create_app
+
+    app = create_app()
+    logging.getLogger().setLevel(logging.WARNING)
+    archivos = archivos_carga(datos)
+    medidas = {nombre: {"latencias": [], "sentencias": [], "tiempos_db": [], "errores": 0}
+               for nombre, *_ in archivos}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app),
+                                 base_url="http://bench", timeout=None) as client:
+        async def subir(nombre, ruta, contenido):
+            return await client.post(
+                PREFIX + ruta, files={"file": (f"{nombre}.csv", contenido, "text/csv")})
+
+        # La última repetición solo mide memoria
+        for repeticion in range(repeticiones + 1):
+            reiniciar_esquema()
+            for nombre, ruta, contenido, esperadas in archivos:
+                medida = medidas[nombre]
+                if repeticion == repeticiones:
+                    tracemalloc.start()
+                    try:
+                        await subir(nombre, ruta, contenido)
+                        medida["memoria_pico_kb"] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+                    finally:
+                        tracemalloc.stop()
+                    continue
+
+                inicio = time.perf_counter()
+                respuesta = await subir(nombre, ruta, contenido)
+                medida["latencias"].append((time.perf_counter() - inicio) * 1000)
+                medida["sentencias"].append(int(respuesta.headers["X-DB-Queries"]))
+                medida["tiempos_db"].append(float(respuesta.headers["X-DB-Time-Ms"]))
+                cuerpo = respuesta.json()
+                if cuerpo.get("status") != "ok" or cuerpo.get("insertados") != esperadas:
+                    medida["errores"] += 1
+                    medida["ultimo_error"] = {
+                        "status": cuerpo.get("status"),
+                        "insertados": cuerpo.get("insertados"),
+                        "errores": cuerpo.get("errores", [])[:3],
+                    }
+
+    resultado = {}
+    for nombre, _, _, esperadas in archivos:
+        medida = medidas[nombre]
+        latencia = percentiles(medida["latencias"])
+        resultado[nombre] = {
+            "filas": esperadas,
+            "latencia_ms": latencia,
+            "filas_por_segundo": round(esperadas / (latencia["p50"] / 1000), 1)
+            if latencia["p50"] else None,
+            "tiempo_db_ms": percentiles(medida["tiempos_db"]),
+            "sentencias": max(medida["sentencias"]),
+            "memoria_pico_kb": medida["memoria_pico_kb"],
+            "errores": medida["errores"],
+            **({"ultimo_error": medida["ultimo_error"]} if "ultimo_error" in medida else {}),
+        }
+    return resultado
+
+
+def comparar(anterior: Dict[str, Any], actual: Dict[str, Any], tolerancia: float) -> List[str]:
+    """Regresiones de actual frente a anterior en las escalas que ambas midieron"""
+    regresiones = []
+    for escala, datos in actual["escalas"].items():
+        previo = anterior.get("escalas", {}).get(escala)
+        if previo is None:
+            continue
+        for grupo in ("consultas", "cargas"):
+            for nombre, medida in datos[grupo].items():
+                base = previo.get(grupo, {}).get(nombre)
+                if base is None:
+                    continue
+                if medida["sentencias"] > base["sentencias"]:
+                    regresiones.append(
+                        f"{escala} {nombre}: sentencias {base['sentencias']} -> {medida['sentencias']}")
+                p95, p95_base = medida["latencia_ms"]["p95"], base["latencia_ms"]["p95"]
+                if p95 > p95_base * (1 + tolerancia):
+                    regresiones.append(f"{escala} {nombre}: p95 {p95_base} -> {p95} ms")
+    return regresiones
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", default="1000,10000",
+                        help="Cantidades de personas, separadas por coma")
+    parser.add_argument("--parcialidades", type=int, default=20)
+    parser.add_argument("--miembros-min", type=int, default=1)
+    parser.add_argument("--miembros-max", type=int, default=8)
+    parser.add_argument("--sin-familia", type=float, default=0.05)
+    parser.add_argument("--fallecidos", type=float, default=0.03)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--iteraciones", type=int, default=50,
+                        help="Llamadas por consulta y escala")
+    parser.add_argument("--repeticiones-carga", type=int, default=3,
+                        help="Cargas completas por escala (cada una sobre una base vacía)")
+    parser.add_argument("--latencia-ms", type=float, default=0.0,
+                        help="Round trip simulado por sentencia")
+    parser.add_argument("--salida", help="Archivo donde escribir el JSON")
+    parser.add_argument("--comparar", help="JSON de una corrida anterior")
+    parser.add_argument("--tolerancia", type=float, default=0.25,
+                        help="Aumento de p95 permitido frente a --comparar")
+    args = parser.parse_args()
+
+    preparar_base(args.latencia_ms)
+    resultado: Dict[str, Any] = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "configuracion": {clave: valor for clave, valor in vars(args).items()
+                          if clave not in ("salida", "comparar")},
+        "escalas": {},
+    }
+
+    for personas in (int(escala) for escala in args.escalas.split(",")):
+        censo = Censo(personas, args.parcialidades, args.miembros_min, args.miembros_max,
+                      args.sin_familia, args.fallecidos, semilla=args.semilla)
+        datos = generar(censo)
+
+        reiniciar_esquema()
+        inicio = time.perf_counter()
+        sembrar(datos)
+        resultado["escalas"][str(personas)] = {
+            "censo": {
+                "personas": len(datos["personas"]),
+                "familias": len(datos["familias"]),
+                "miembros": len(datos["miembros"]),
+                "parcialidades": len(datos["parcialidades"]),
+                "siembra_s": round(time.perf_counter() - inicio, 2),
+            },
+            "consultas": medir_consultas(datos, args.iteraciones, args.semilla),
+            "cargas": asyncio.run(medir_cargas(datos, args.repeticiones_carga)),
+        }
+
+    regresiones = []
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            regresiones = comparar(json.load(archivo), resultado, args.tolerancia)
+        resultado["comparacion"] = {"contra": args.comparar, "regresiones": regresiones}
+
+    salida = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            archivo.write(salida)
+    print(salida)
+    if regresiones:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Latencia bajo carga concurrente de rutas que usan managers síncronos.
+
+Lanza en paralelo escrituras (POST /familias/create) y lecturas
+(GET /parcialidad/{id}) contra la app en proceso, simulando latencia de red
+en cada sentencia SQL. Si una ruta async ejecuta el manager en el event loop,
+todas las peticiones concurrentes esperan sus round trips y el p99 se dispara.
+Para comparar, ejecutarlo en la revisión anterior y en la actual:
+
+    python -m benchmarks.bench_event_loop --requests 400 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+
+from benchmarks.common import percentiles, preparar_base
+
+PREFIX = "/ms-gestion-usuarios"
+
+
+async def _medir(client, semaforo, latencias, metodo, url, **kwargs):
+    async with semaforo:
+        inicio = time.perf_counter()
+        await client.request(metodo, url, **kwargs)
+        latencias.append((time.perf_counter() - inicio) * 1000)
+
+
+async def ejecutar(total: int, concurrencia: int):
+    from app import create_app
+    from app.config.database import SessionLocal
+    from app.persistence.model.parcialidad import Parcialidad
+
+    db = SessionLocal()
+    db.add(Parcialidad(id=1, nombre="Parcialidad benchmark"))
+    db.commit()
+    db.close()
+
+    app = create_app()
+    transport = httpx.ASGITransport(app=app)
+    semaforo = asyncio.Semaphore(concurrencia)
+    escrituras, lecturas = [], []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        tareas = []
+        for i in range(total):
+            if i % 2:
+                tareas.append(_medir(client, semaforo, escrituras, "POST",
+                                     f"{PREFIX}/familias/create", json={"idFamilia": i}))
+            else:
+                tareas.append(_medir(client, semaforo, lecturas, "GET",
+                                     f"{PREFIX}/parcialidad/1"))
+        await asyncio.gather(*tareas)
+
+    return {"escrituras": percentiles(escrituras), "lecturas": percentiles(lecturas)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--db-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    preparar_base(latencia_ms=args.db_latency_ms)
+    resultado = asyncio.run(ejecutar(args.requests, args.concurrency))
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Costo de serializar una página de 100 personas (GET /personas?page_size=100).
+
+Sobre la misma página ya cargada desde la base compara:
+  - fastapi: el camino por defecto de FastAPI con response_model (volcar,
+    revalidar contra PaginatedPersonas, jsonable_encoder) y JSONResponse.
+  - modelo: una sola validación de las filas con PaginatedPersonas y
+    serialización directa con RespuestaModelo.
+Además mide la ruta completa en proceso. Uso:
+
+    python -m benchmarks.bench_serializacion --iteraciones 500
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import date
+
+import httpx
+
+from benchmarks.common import percentiles, preparar_base
+
+PREFIX = "/ms-gestion-usuarios"
+TAMANO_PAGINA = 100
+
+
+def sembrar(total: int):
+    from app.config.database import SessionLocal
+    from app.persistence.model.enum import (
+        EnumDocumento, EnumEscolaridad, EnumParentesco, EnumSexo)
+    from app.persistence.model.familia import Familia
+    from app.persistence.model.miembro_familia import MiembroFamilia
+    from app.persistence.model.parcialidad import Parcialidad
+    from app.persistence.model.persona import Persona
+
+    db = SessionLocal()
+    db.add(Parcialidad(id=1, nombre="Parcialidad benchmark"))
+    db.add_all(Familia(id=i) for i in range(1, total // 5 + 2))
+    db.flush()
+    for i in range(total):
+        cedula = f"{i:010d}"
+        db.add(Persona(
+            id=cedula, tipoDocumento=EnumDocumento.CC, nombre=f"Nombre {i}",
+            apellido=f"Apellido {i}", fechaNacimiento=date(1980, 1, 1 + i % 28),
+            parentesco=EnumParentesco.HI, sexo=EnumSexo.F if i % 2 else EnumSexo.M,
+            profesion=None, escolaridad=EnumEscolaridad.SE, direccion="Calle 1",
+            telefono="3000000000", fechaDefuncion=None, idParcialidad=1))
+        db.add(MiembroFamilia(id=i + 1, personaId=cedula, familiaId=i // 5 + 1,
+                              esRepresentante=i % 5 == 0))
+    db.commit()
+    db.close()
+
+
+async def medir_serializacion(iteraciones: int):
+    from fastapi.responses import JSONResponse
+    from fastapi.routing import serialize_response
+
+    from app import create_app
+    from app.config.database import SessionLocal
+    from app.models.outputs.paginated_response import PaginatedPersonas
+    from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+    from app.utils.respuesta_modelo import RespuestaModelo
+
+    app = create_app()
+    ruta = next(r for r in app.routes
+                if getattr(r, "path", None) == f"{PREFIX}/personas" and "GET" in r.methods)
+
+    db = SessionLocal()
+    pagina = PersonaRepository(db).find_all_personas(1, TAMANO_PAGINA, {})
+
+    async def fastapi_por_defecto():
+        contenido = await serialize_response(
+            field=ruta.response_field, response_content=pagina, is_coroutine=True)
+        return JSONResponse(content=contenido).body
+
+    async def respuesta_modelo():
+        return RespuestaModelo(
+            PaginatedPersonas.model_validate(pagina, from_attributes=True)).body
+
+    resultado = {}
+    cuerpos = {}
+    for nombre, camino in (("fastapi", fastapi_por_defecto), ("modelo", respuesta_modelo)):
+        latencias = []
+        for _ in range(iteraciones):
+            inicio = time.perf_counter()
+            cuerpo = await camino()
+            latencias.append((time.perf_counter() - inicio) * 1000)
+        cuerpos[nombre] = cuerpo
+        resultado[nombre] = percentiles(latencias)
+    db.close()
+
+    resultado["bytes"] = len(cuerpos["modelo"])
+    resultado["misma_salida"] = json.loads(cuerpos["fastapi"]) == json.loads(cuerpos["modelo"])
+    return resultado
+
+
+async def medir_ruta(iteraciones: int):
+    from app import create_app
+
+    transport = httpx.ASGITransport(app=create_app())
+    latencias = []
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(iteraciones):
+            inicio = time.perf_counter()
+            respuesta = await client.get(f"{PREFIX}/personas", params={"page_size": TAMANO_PAGINA})
+            latencias.append((time.perf_counter() - inicio) * 1000)
+            respuesta.raise_for_status()
+    return percentiles(latencias)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iteraciones", type=int, default=500)
+    parser.add_argument("--personas", type=int, default=1000)
+    args = parser.parse_args()
+
+    preparar_base()
+    sembrar(args.personas)
+    resultado = {
+        "serializacion_ms": asyncio.run(medir_serializacion(args.iteraciones)),
+        "ruta_ms": asyncio.run(medir_ruta(args.iteraciones)),
+    }
+    print(json.dumps(resultado, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""
+Utilidades compartidas por los benchmarks: configuran la app contra una base
+SQLite local (con las funciones de MySQL que usan los repositorios) y calculan
+percentiles de latencia.
+"""
+import os
+import re
+import tempfile
+import time
+from datetime import date
+
+os.environ.setdefault("PORT", "8081")
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{os.path.join(tempfile.gettempdir(), 'cmi_benchmark.db')}")
+
+from sqlalchemy import BigInteger, create_engine, event  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+
+from app.config import database  # noqa: E402
+from app.config.sql_metrics import instrumentar_sql  # noqa: E402
+
+# timestampdiff(YEAR, ...) llega con la unidad como palabra clave; en SQLite
+# se pasa como texto a la función registrada
+_UNIDAD_TIMESTAMPDIFF = re.compile(r"timestampdiff\((\w+),", re.IGNORECASE)
+
+
+@compiles(BigInteger, "sqlite")
+def _bigint_sqlite(tipo, compilador, **kw):
+    # SQLite solo autoincrementa las llaves INTEGER PRIMARY KEY (MiembroFamilia.id)
+    return "INTEGER"
+
+
+def _timestampdiff(unidad, desde, hasta):
+    if unidad.upper() != "YEAR" or desde is None or hasta is None:
+        return None
+    inicio, fin = date.fromisoformat(desde[:10]), date.fromisoformat(hasta[:10])
+    return fin.year - inicio.year - ((fin.month, fin.day) < (inicio.month, inicio.day))
+
+
+def preparar_base(latencia_ms: float = 0.0):
+    """
+    Recrea el esquema en la base SQLite del benchmark. latencia_ms simula el
+    round trip de red hacia MySQL en cada sentencia (bloquea el hilo igual
+    que un driver síncrono).
+    """
+    # Importa todos los modelos para registrarlos en Base.metadata
+    from app.persistence.model import (  # noqa: F401
+        familia, familia_stats, miembro_familia, parcialidad, persona,
+        persona_token, usuario)
+
+    engine = create_engine(
+        os.environ["DATABASE_URL"],
+        connect_args={"check_same_thread": False},
+        pool_size=20,
+        max_overflow=20,
+    )
+
+    @event.listens_for(engine, "connect")
+    def _funciones_mysql(dbapi_conn, _):
+        dbapi_conn.create_function(
+            "locate", 2, lambda sub, texto: (texto or "").lower().find((sub or "").lower()) + 1)
+        dbapi_conn.create_function(
+            "if", 3, lambda cond, si, no: si if cond else no)
+        dbapi_conn.create_function(
+            "concat", 3, lambda a, b, c: f"{a}{b}{c}")
+        dbapi_conn.create_function("timestampdiff", 3, _timestampdiff)
+
+    @event.listens_for(engine, "before_cursor_execute", retval=True)
+    def _unidad_timestampdiff(conn, cursor, sql, parametros, contexto, executemany):
+        return _UNIDAD_TIMESTAMPDIFF.sub(r"timestampdiff('\1',", sql), parametros
+
+    if latencia_ms:
+        @event.listens_for(engine, "before_cursor_execute")
+        def _latencia(*_):
+            time.sleep(latencia_ms / 1000)
+
+    # Las sentencias cuentan para metricas_sql y las cabeceras X-DB-*
+    instrumentar_sql(engine)
+
+    database.engine = engine
+    database.SessionLocal.configure(bind=engine)
+    reiniciar_esquema()
+    return engine
+
+
+def reiniciar_esquema():
+    """
+    Deja la base del benchmark vacía y limpia las cachés de proceso que
+    guardan datos de la corrida anterior (ids de parcialidades, lecturas).
+    """
+    from app.services.estadisticas_cache import estadisticas_cache
+    from app.services.lecturas_cache import lecturas_cache
+    from app.services.parcialidad_resolver import parcialidad_resolver
+
+    database.Base.metadata.drop_all(database.engine)
+    database.Base.metadata.create_all(database.engine)
+    parcialidad_resolver.invalidar()
+    estadisticas_cache.invalidar()
+    lecturas_cache.limpiar("")
+
+
+def percentiles(latencias_ms):
+    ordenadas = sorted(latencias_ms)
+
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))], 2)
+
+    return {"n": len(ordenadas), "p50": p(0.50), "p95": p(0.95), "p99": p(0.99), "max": round(ordenadas[-1], 2)}
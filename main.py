@@ -1,11 +1,12 @@
 import uvicorn
+from app.config.server import opciones_uvicorn
 from app.utils.enviroment import settings
 
 
 def start_server():
-    port = int(settings.port)
-    uvicorn.run("app:create_app", host="0.0.0.0",
-                port=port, reload=True, factory=True)
+    # SERVER_MODE=dev: un proceso con recarga; prod: workers, uvloop/httptools
+    # y apagado ordenado (ver app.config.server)
+    uvicorn.run("app:create_app", **opciones_uvicorn(settings))
 
 
 if __name__ == "__main__":
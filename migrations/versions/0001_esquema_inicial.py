@@ -0,0 +1,105 @@
+"""Esquema inicial: tablas existentes antes de las migraciones
+
+Revision ID: 0001_esquema_inicial
+Revises:
+Create Date: 2026-10-18 09:00:00
+
+Las bases que ya tienen estas tablas no necesitan `alembic stamp`: cada
+tabla se crea solo si no existe.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_esquema_inicial"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existe(tabla: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(tabla)
+
+
+def upgrade() -> None:
+    if not _existe("Parcialidad"):
+        op.create_table(
+            "Parcialidad",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("nombre", sa.String(100)),
+        )
+
+    if not _existe("Persona"):
+        op.create_table(
+            "Persona",
+            sa.Column("id", sa.String(255), primary_key=True),
+            sa.Column("tipoDocumento", sa.Enum("CC", "TI", "RC", name="enumdocumento")),
+            sa.Column("nombre", sa.String(255)),
+            sa.Column("apellido", sa.String(255)),
+            sa.Column("fechaNacimiento", sa.Date()),
+            sa.Column("parentesco", sa.Enum(
+                "PA", "MA", "HI", "AB", "SO", "CU", "YR", "CF", "HE", name="enumparentesco")),
+            sa.Column("sexo", sa.Enum("M", "F", name="enumsexo")),
+            sa.Column("profesion", sa.String(255), nullable=True),
+            sa.Column("escolaridad", sa.Enum("NI", "PR", "SE", "UN", name="enumescolaridad")),
+            sa.Column("direccion", sa.String(255)),
+            sa.Column("telefono", sa.String(255)),
+            sa.Column("fechaDefuncion", sa.Date(), nullable=True),
+            sa.Column("idParcialidad", sa.Integer(),
+                      sa.ForeignKey("Parcialidad.id"), nullable=True),
+        )
+
+    if not _existe("Familia"):
+        op.create_table(
+            "Familia",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("estado", sa.Enum("ACTIVA", "INACTIVA", name="enumestadofamilia"),
+                      nullable=False),
+            sa.Column("fechaCreacion", sa.TIMESTAMP(), nullable=False,
+                      server_default=sa.func.now()),
+        )
+
+    if not _existe("MiembroFamilia"):
+        op.create_table(
+            "MiembroFamilia",
+            sa.Column("id", sa.BigInteger(), primary_key=True, autoincrement=True),
+            sa.Column("personaId", sa.String(255),
+                      sa.ForeignKey("Persona.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("familiaId", sa.Integer(),
+                      sa.ForeignKey("Familia.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("activo", sa.Boolean(), nullable=False),
+            sa.Column("esRepresentante", sa.Boolean(), nullable=False),
+        )
+
+    if not _existe("Usuario"):
+        op.create_table(
+            "Usuario",
+            sa.Column("email", sa.String(100), primary_key=True),
+            sa.Column("password", sa.String(200)),
+            sa.Column("personaId", sa.String(36), sa.ForeignKey("Persona.id")),
+            sa.Column("rol", sa.Enum("admin", "usuario", name="enumrol")),
+        )
+
+    if not _existe("CodigoRecuperacion"):
+        op.create_table(
+            "CodigoRecuperacion",
+            sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+            sa.Column("codigo", sa.String(20), nullable=False),
+            sa.Column("estado", sa.Boolean(), nullable=False),
+            sa.Column("emailUsuario", sa.String(100),
+                      sa.ForeignKey("Usuario.email"), nullable=False),
+        )
+
+
+def downgrade() -> None:
+    op.drop_table("CodigoRecuperacion")
+    op.drop_table("Usuario")
+    op.drop_table("MiembroFamilia")
+    op.drop_table("Familia")
+    op.drop_table("Persona")
+    op.drop_table("Parcialidad")
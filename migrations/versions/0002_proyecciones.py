@@ -0,0 +1,134 @@
+"""FamiliaStats y PersonaToken
+
+Revision ID: 0002_proyecciones
+Revises: 0001_esquema_inicial
+Create Date: 2026-10-18 09:05:00
+
+Proyecciones que mantienen los managers. Si ya las creó un comando
+rebuild_* se dejan como están; si se crean aquí se llenan con los datos
+existentes (mismo cálculo que rebuild() de cada repositorio), porque el
+listado de líderes, el resumen, el filtro por miembros y las búsquedas por
+nombre hacen join contra ellas. En modo --sql PersonaToken no se puede
+llenar (los tokens se calculan en Python): correr después
+app.commands.rebuild_persona_tokens.
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from app.persistence.repository.persona_token_repository.impl.persona_token_repository import tokens_persona
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_proyecciones"
+down_revision: Union[str, None] = "0001_esquema_inicial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existe(tabla: str) -> bool:
+    if context.is_offline_mode():
+        return False
+    return sa.inspect(op.get_bind()).has_table(tabla)
+
+
+# Tablas como están en esta revisión, independientes de los modelos actuales
+familia = sa.table("Familia", sa.column("id", sa.Integer))
+persona = sa.table(
+    "Persona",
+    sa.column("id", sa.String), sa.column("nombre", sa.String),
+    sa.column("apellido", sa.String), sa.column("fechaDefuncion", sa.Date),
+    sa.column("idParcialidad", sa.Integer))
+miembro = sa.table(
+    "MiembroFamilia",
+    sa.column("personaId", sa.String), sa.column("familiaId", sa.Integer),
+    sa.column("activo", sa.Boolean), sa.column("esRepresentante", sa.Boolean))
+familia_stats = sa.table(
+    "FamiliaStats",
+    sa.column("familiaId", sa.Integer), sa.column("totalMiembros", sa.Integer),
+    sa.column("miembrosActivos", sa.Integer), sa.column("defunciones", sa.Integer),
+    sa.column("liderId", sa.String), sa.column("liderParcialidadId", sa.Integer))
+persona_token = sa.table(
+    "PersonaToken", sa.column("token", sa.String), sa.column("personaId", sa.String))
+
+TAMANO_BLOQUE = 1000
+
+
+def _llenar_familia_stats() -> None:
+    es_lider = miembro.c.esRepresentante == sa.true()
+    vivo = persona.c.id.isnot(None) & persona.c.fechaDefuncion.is_(None)
+    agregado = (
+        sa.select(
+            familia.c.id,
+            sa.func.count(persona.c.id),
+            sa.func.coalesce(sa.func.sum(sa.case((vivo, 1), else_=0)), 0),
+            sa.func.coalesce(sa.func.sum(
+                sa.case((persona.c.fechaDefuncion.isnot(None), 1), else_=0)), 0),
+            sa.func.max(sa.case((es_lider, persona.c.id))),
+            sa.func.max(sa.case((es_lider, persona.c.idParcialidad))),
+        )
+        .select_from(familia)
+        .outerjoin(miembro, (miembro.c.familiaId == familia.c.id) & (miembro.c.activo == sa.true()))
+        .outerjoin(persona, persona.c.id == miembro.c.personaId)
+        .group_by(familia.c.id)
+    )
+    op.execute(familia_stats.insert().from_select(
+        ["familiaId", "totalMiembros", "miembrosActivos", "defunciones",
+         "liderId", "liderParcialidadId"],
+        agregado))
+
+
+def _llenar_persona_token() -> None:
+    if context.is_offline_mode():
+        return
+    conexion = op.get_bind()
+    ultimo_id = None
+    while True:
+        bloque = sa.select(persona.c.id, persona.c.nombre, persona.c.apellido)
+        if ultimo_id is not None:
+            bloque = bloque.where(persona.c.id > ultimo_id)
+        personas = conexion.execute(
+            bloque.order_by(persona.c.id).limit(TAMANO_BLOQUE)).all()
+        if not personas:
+            break
+        filas = [{"token": token, "personaId": p.id}
+                 for p in personas for token in tokens_persona(p)]
+        if filas:
+            conexion.execute(persona_token.insert(), filas)
+        ultimo_id = personas[-1].id
+
+
+def upgrade() -> None:
+    if not _existe("FamiliaStats"):
+        op.create_table(
+            "FamiliaStats",
+            sa.Column("familiaId", sa.Integer(),
+                      sa.ForeignKey("Familia.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("totalMiembros", sa.Integer(), nullable=False),
+            sa.Column("miembrosActivos", sa.Integer(), nullable=False),
+            sa.Column("defunciones", sa.Integer(), nullable=False),
+            sa.Column("liderId", sa.String(255), nullable=True),
+            sa.Column("liderParcialidadId", sa.Integer(), nullable=True),
+            sa.Column("fechaActualizacion", sa.TIMESTAMP(), nullable=False,
+                      server_default=sa.func.now()),
+        )
+        op.create_index("ix_FamiliaStats_totalMiembros", "FamiliaStats", ["totalMiembros"])
+        op.create_index("ix_FamiliaStats_liderParcialidadId", "FamiliaStats",
+                        ["liderParcialidadId"])
+        _llenar_familia_stats()
+
+    if not _existe("PersonaToken"):
+        op.create_table(
+            "PersonaToken",
+            sa.Column("token", sa.String(100), primary_key=True),
+            sa.Column("personaId", sa.String(255),
+                      sa.ForeignKey("Persona.id", ondelete="CASCADE"), primary_key=True),
+        )
+        op.create_index("ix_PersonaToken_personaId", "PersonaToken", ["personaId"])
+        _llenar_persona_token()
+
+
+def downgrade() -> None:
+    op.drop_table("PersonaToken")
+    op.drop_table("FamiliaStats")
@@ -0,0 +1,74 @@
+"""Índices compuestos para los filtros y joins más frecuentes
+
+Revision ID: 0003_indices_consultas
+Revises: 0002_proyecciones
+Create Date: 2026-10-18 09:10:00
+
+- MiembroFamilia (familiaId, activo, esRepresentante): líder y miembros
+  activos de una familia.
+- MiembroFamilia (personaId, activo): familia actual de una persona.
+- MiembroFamilia único sobre personaActivaId: una sola membresía activa por
+  persona. MySQL no tiene índices parciales, así que se indexa una columna
+  generada (virtual) que vale personaId solo si la membresía está activa.
+  Antes de crearlo se desactivan los duplicados, conservando la primera
+  membresía de cada persona (la que ya usa get_familia_actual).
+- Persona (idParcialidad), Parcialidad (nombre), Usuario (personaId).
+
+Verificación: python -m pytest tests/test_indices.py
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_indices_consultas"
+down_revision: Union[str, None] = "0002_proyecciones"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_miembrofamilia_familia_activo_rep", "MiembroFamilia",
+                    ["familiaId", "activo", "esRepresentante"])
+    op.create_index("ix_miembrofamilia_persona_activo", "MiembroFamilia",
+                    ["personaId", "activo"])
+
+    # Desactiva las membresías activas repetidas. El subquery va dentro de una
+    # tabla derivada porque MySQL no deja leer la tabla que se actualiza
+    miembro = sa.table("MiembroFamilia", sa.column("id", sa.BigInteger),
+                       sa.column("personaId", sa.String), sa.column("activo", sa.Boolean))
+    primeras = (
+        sa.select(sa.func.min(miembro.c.id).label("id"))
+        .where(miembro.c.activo == sa.true())
+        .group_by(miembro.c.personaId)
+        .subquery("primeras")
+    )
+    op.execute(
+        miembro.update()
+        .where(miembro.c.activo == sa.true(), miembro.c.id.not_in(sa.select(primeras.c.id)))
+        .values(activo=False)
+    )
+    op.add_column("MiembroFamilia", sa.Column(
+        "personaActivaId", sa.String(255),
+        sa.Computed("CASE WHEN activo THEN personaId END", persisted=False)))
+    op.create_index("ux_miembrofamilia_persona_activa", "MiembroFamilia",
+                    ["personaActivaId"], unique=True)
+
+    op.create_index("ix_persona_parcialidad", "Persona", ["idParcialidad"])
+    op.create_index("ix_parcialidad_nombre", "Parcialidad", ["nombre"])
+    op.create_index("ix_usuario_persona", "Usuario", ["personaId"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_usuario_persona", table_name="Usuario")
+    op.drop_index("ix_parcialidad_nombre", table_name="Parcialidad")
+    op.drop_index("ix_persona_parcialidad", table_name="Persona")
+
+    op.drop_index("ux_miembrofamilia_persona_activa", table_name="MiembroFamilia")
+    with op.batch_alter_table("MiembroFamilia") as batch:
+        batch.drop_column("personaActivaId")
+
+    op.drop_index("ix_miembrofamilia_persona_activo", table_name="MiembroFamilia")
+    op.drop_index("ix_miembrofamilia_familia_activo_rep", table_name="MiembroFamilia")
@@ -0,0 +1,155 @@
+"""
+Base de pruebas: una base SQLite temporal con el esquema de las migraciones
+(alembic upgrade head) y las funciones de MySQL que usan los repositorios.
+Las variables de entorno se fijan antes de importar la app porque los
+engines se crean al importar app.config.database.
+"""
+import os
+import re
+import tempfile
+from datetime import date
+from pathlib import Path
+from typing import Callable, Dict, List
+
+_DIRECTORIO = tempfile.mkdtemp(prefix="cmi-tests-")
+os.environ["PORT"] = "8081"
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DIRECTORIO, 'tests.db')}"
+os.environ["DB_MODE"] = "sync"
+os.environ["LECTURAS_CACHE_BACKEND"] = "none"
+os.environ["IMPORT_JOB_SQLITE_PATH"] = os.path.join(_DIRECTORIO, "import_jobs.db")
+
+import pytest  # noqa: E402
+from alembic import command  # noqa: E402
+from alembic.config import Config  # noqa: E402
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.config import database  # noqa: E402
+from app.persistence.model import (  # noqa: E402,F401
+    codigo_recuperacion, familia, familia_stats, miembro_familia, parcialidad,
+    persona, persona_token, usuario)
+from app.persistence.model.enum import (  # noqa: E402
+    EnumDocumento, EnumEscolaridad, EnumParentesco, EnumSexo)
+from app.persistence.model.familia import Familia  # noqa: E402
+from app.persistence.model.miembro_familia import MiembroFamilia  # noqa: E402
+from app.persistence.model.parcialidad import Parcialidad  # noqa: E402
+from app.persistence.model.persona import Persona  # noqa: E402
+from app.persistence.repository.familia_stats_repository.impl.familia_stats_repository import FamiliaStatsRepository  # noqa: E402
+from app.persistence.repository.persona_token_repository.impl.persona_token_repository import PersonaTokenRepository  # noqa: E402
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# timestampdiff(YEAR, ...) llega con la unidad como palabra clave; en SQLite
+# se pasa como texto a la función registrada
+_UNIDAD_TIMESTAMPDIFF = re.compile(r"timestampdiff\((\w+),", re.IGNORECASE)
+
+
+def _timestampdiff(unidad, desde, hasta):
+    if unidad.upper() != "YEAR" or desde is None or hasta is None:
+        return None
+    inicio, fin = date.fromisoformat(desde[:10]), date.fromisoformat(hasta[:10])
+    return fin.year - inicio.year - ((fin.month, fin.day) < (inicio.month, inicio.day))
+
+
+@event.listens_for(database.engine, "connect")
+def _funciones_mysql(dbapi_conn, _):
+    dbapi_conn.create_function(
+        "locate", 2, lambda sub, texto: (texto or "").lower().find((sub or "").lower()) + 1)
+    dbapi_conn.create_function("if", 3, lambda cond, si, no: si if cond else no)
+    dbapi_conn.create_function("concat", 3, lambda a, b, c: f"{a}{b}{c}")
+    dbapi_conn.create_function("timestampdiff", 3, _timestampdiff)
+
+
+@event.listens_for(database.engine, "before_cursor_execute", retval=True)
+def _unidad_timestampdiff(conn, cursor, sql, parametros, contexto, executemany):
+    return _UNIDAD_TIMESTAMPDIFF.sub(r"timestampdiff('\1',", sql), parametros
+
+
+@pytest.fixture(scope="session")
+def esquema():
+    """Esquema creado por las migraciones, no por Base.metadata.create_all"""
+    # Sin el archivo alembic.ini para que fileConfig no reemplace el logging
+    config = Config()
+    config.set_main_option("script_location", str(RAIZ / "migrations"))
+    command.upgrade(config, "head")
+    return database.engine
+
+
+@pytest.fixture
+def db(esquema):
+    """Sesión de la app; al terminar vacía las tablas y las cachés de proceso"""
+    from app.services.estadisticas_cache import estadisticas_cache
+    from app.services.lecturas_cache import lecturas_cache
+    from app.services.parcialidad_resolver import parcialidad_resolver
+
+    sesion = database.SessionLocal()
+    try:
+        yield sesion
+    finally:
+        sesion.rollback()
+        sesion.close()
+        with esquema.begin() as conexion:
+            for tabla in reversed(database.Base.metadata.sorted_tables):
+                conexion.execute(tabla.delete())
+        estadisticas_cache.invalidar()
+        parcialidad_resolver.invalidar()
+        lecturas_cache.limpiar("")
+
+
+@pytest.fixture
+def sentencias(esquema):
+    """SQL que emite el engine de la app mientras corre el test"""
+    capturadas: List[str] = []
+
+    def _registrar(conn, cursor, sql, parametros, contexto, executemany):
+        capturadas.append(sql)
+
+    event.listen(esquema, "before_cursor_execute", _registrar)
+    yield capturadas
+    event.remove(esquema, "before_cursor_execute", _registrar)
+
+
+def selects(sentencias: List[str]) -> List[str]:
+    return [sql for sql in sentencias if sql.lstrip().upper().startswith("SELECT")]
+
+
+@pytest.fixture
+def censo(db) -> Callable[..., Dict[str, List[int]]]:
+    """
+    Siembra familias con sus miembros (el primero es el representante) y
+    reconstruye FamiliaStats y PersonaToken. Devuelve los ids creados.
+    """
+    def sembrar(familias: int, miembros_por_familia: int = 1) -> Dict[str, List[int]]:
+        filas_familias, personas, miembros = [], [], []
+        for f in range(1, familias + 1):
+            filas_familias.append({"id": f})
+            for m in range(miembros_por_familia):
+                cedula = str(10_000_000 + f * 100 + m)
+                personas.append({
+                    "id": cedula,
+                    "tipoDocumento": EnumDocumento.CC,
+                    "nombre": f"Nombre{f}",
+                    "apellido": f"Apellido{m}",
+                    "fechaNacimiento": date(1980, 1, 1),
+                    "parentesco": EnumParentesco.CF if m == 0 else EnumParentesco.HI,
+                    "sexo": EnumSexo.F,
+                    "escolaridad": EnumEscolaridad.SE,
+                    "direccion": f"Vereda {f}",
+                    "telefono": "3100000000",
+                    "idParcialidad": 1,
+                })
+                # MiembroFamilia.id es BigInteger: SQLite solo autoincrementa
+                # INTEGER PRIMARY KEY, así que el id va explícito
+                miembros.append({"id": len(miembros) + 1, "personaId": cedula, "familiaId": f,
+                                 "activo": True, "esRepresentante": m == 0})
+
+        db.execute(insert(Parcialidad), [{"id": 1, "nombre": "Parcialidad 1"}])
+        db.execute(insert(Familia), filas_familias)
+        db.execute(insert(Persona), personas)
+        db.execute(insert(MiembroFamilia), miembros)
+        db.commit()
+        FamiliaStatsRepository(db).rebuild()
+        PersonaTokenRepository(db).rebuild()
+        return {"familias": [fila["id"] for fila in filas_familias],
+                "personas": [fila["id"] for fila in personas]}
+
+    return sembrar
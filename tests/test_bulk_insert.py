@@ -0,0 +1,41 @@
+from datetime import date
+
+import pytest
+
+from app.models.inputs.persona.persona_create import PersonaCreate
+from app.persistence.model.persona import Persona
+from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+from app.persistence.unit_of_work import UnitOfWork
+from app.utils.exceptions_handlers.models.error_response import BulkInsertError
+
+
+def _personas(cantidad):
+    return [
+        PersonaCreate(id=str(20_000_000 + i), tipoDocumento="CC", nombre="Ana", apellido="Pérez",
+                      fechaNacimiento=date(1990, 5, 1), sexo="F", escolaridad="SE",
+                      direccion="Vereda 1", telefono="3100000000")
+        for i in range(cantidad)
+    ]
+
+
+def test_bulk_insert_confirma_por_bloque(db):
+    personas = _personas(5)
+    personas[3].id = personas[0].id  # el segundo bloque choca con el primero
+
+    with pytest.raises(BulkInsertError) as error:
+        PersonaRepository(db).bulk_insert(personas, chunk_size=2)
+
+    # Fuera de una UnitOfWork el primer bloque queda confirmado
+    assert (error.value.bloque, error.value.insertados) == (2, 2)
+    db.rollback()
+    assert db.query(Persona).count() == 2
+
+
+def test_bulk_insert_respeta_la_unidad_de_trabajo(db):
+    with pytest.raises(RuntimeError):
+        with UnitOfWork(db):
+            PersonaRepository(db).bulk_insert(_personas(5), chunk_size=2)
+            raise RuntimeError("falla después de insertar")
+
+    # Ningún bloque se confirmó por su cuenta
+    assert db.query(Persona).count() == 0
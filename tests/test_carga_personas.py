@@ -0,0 +1,59 @@
+import io
+import logging
+from datetime import date
+
+from fastapi import UploadFile
+from openpyxl import Workbook
+from sqlalchemy import insert
+
+from app.ioc.container import build_persona_manager
+from app.persistence.model.parcialidad import Parcialidad
+from app.persistence.model.persona import Persona
+from app.utils.constans import COLUMNS_PERSONA
+
+logger = logging.getLogger(__name__)
+
+
+def _xlsx(filas) -> UploadFile:
+    libro = Workbook()
+    hoja = libro.active
+    hoja.append(COLUMNS_PERSONA)
+    for fila in filas:
+        hoja.append(fila)
+    contenido = io.BytesIO()
+    libro.save(contenido)
+    contenido.seek(0)
+    return UploadFile(file=contenido, filename="personas.xlsx")
+
+
+def _fila(documento, telefono=3100000000):
+    return [documento, "CC", "Ana", "Pérez", date(1990, 5, 1), "F", None, "SE",
+            "Vereda 1", telefono, "Parcialidad 1"]
+
+
+def test_celdas_vacias_no_se_guardan_como_texto(db):
+    db.execute(insert(Parcialidad), [{"id": 1, "nombre": "Parcialidad 1"}])
+    db.commit()
+
+    # Documentos numéricos con una celda vacía en la columna: pandas la
+    # vuelve float y sin normalizar quedarían "1030567890.0"
+    archivo = _xlsx([
+        _fila(1030567890),
+        _fila(None),
+        _fila(1030567891, telefono=None),
+        _fila(1030567892),
+    ])
+
+    resultado = build_persona_manager(db, logger).upload_excel(archivo)
+
+    assert resultado.status == "ok"
+    assert resultado.insertados == 2
+    assert [(error.fila, error.mensaje) for error in resultado.errores] == [
+        (3, "El campo 'id' es obligatorio"),
+        (4, "El campo 'telefono' es obligatorio"),
+    ]
+    guardadas = db.query(Persona.id, Persona.telefono).order_by(Persona.id).all()
+    assert [tuple(fila) for fila in guardadas] == [
+        ("1030567890", "3100000000"),
+        ("1030567892", "3100000000"),
+    ]
@@ -0,0 +1,34 @@
+import pytest
+
+from app.persistence.model.familia import Familia
+from app.persistence.model.miembro_familia import MiembroFamilia
+from app.persistence.model.persona import Persona
+from app.persistence.repository.base_repository.impl.base_repository import estimable
+from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+
+CONSULTAS = {
+    "tabla_sin_filtros": (lambda db: db.query(Persona).order_by(Persona.id), True),
+    "filtro": (lambda db: db.query(Persona).filter(Persona.idParcialidad == 1), False),
+    "join": (lambda db: db.query(Familia).join(MiembroFamilia), False),
+    "distinct": (lambda db: db.query(Persona.idParcialidad).distinct(), False),
+    "group_by": (lambda db: db.query(Persona.idParcialidad).group_by(Persona.idParcialidad), False),
+}
+
+
+@pytest.mark.parametrize("nombre", sorted(CONSULTAS))
+def test_estimable_solo_listados_simples(db, nombre):
+    consulta, esperado = CONSULTAS[nombre]
+    assert estimable(consulta(db).statement) is esperado
+
+
+def test_estimate_con_filtro_usa_conteo_exacto(db, censo):
+    censo(familias=30, miembros_por_familia=2)
+    repositorio = PersonaRepository(db)
+
+    pagina = repositorio.paginate(
+        1, 10, db.query(Persona).filter(Persona.apellido == "Apellido1").order_by(Persona.id),
+        conteo="estimate")
+
+    # La estimación de la tabla guía serían las 60 personas
+    assert pagina["total_items"] == 30
+    assert pagina["total_items_exact"] is True
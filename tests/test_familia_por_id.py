@@ -0,0 +1,16 @@
+from app.persistence.repository.familia_repository.impl.familia_repository import FamiliaRepository
+from tests.conftest import selects
+
+
+def test_get_familia_by_id_una_sola_consulta(db, censo, sentencias):
+    ids = censo(familias=1, miembros_por_familia=5)
+    sentencias.clear()
+
+    familia = FamiliaRepository(db).get_familia_by_id(ids["familias"][0])
+
+    # Familia, representante y su parcialidad en un SELECT, sin lazy loads
+    # al serializar
+    familia.model_dump()
+    assert len(selects(sentencias)) == 1
+    assert familia.representanteId == ids["personas"][0]
+    assert familia.representante.parcialidad is not None
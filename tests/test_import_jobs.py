@@ -0,0 +1,73 @@
+import io
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+from fastapi import UploadFile
+
+from app.models.outputs.import_job.import_job_output import ImportJobOut
+from app.persistence.job_store.impl.memory_job_store import MemoryJobStore
+from app.persistence.model.enum import EnumEstadoImportacion, EnumTipoImportacion
+from app.services.import_job_manager import ImportJobManager
+
+logger = logging.getLogger(__name__)
+
+
+def _job(job_id: str) -> ImportJobOut:
+    return ImportJobOut(job_id=job_id, tipo=EnumTipoImportacion.PERSONAS,
+                        estado=EnumEstadoImportacion.PENDIENTE, fechaCreacion=datetime.utcnow())
+
+
+def _terminar(store: MemoryJobStore, job_id: str) -> None:
+    store.update(job_id, estado=EnumEstadoImportacion.COMPLETADO, fechaFin=datetime.utcnow())
+
+
+def test_memory_job_store_acota_los_terminados():
+    store = MemoryJobStore(ttl=3600, maxsize=2)
+    for i in range(5):
+        store.create(_job(f"activo-{i}"))
+        store.create(_job(f"terminado-{i}"))
+        _terminar(store, f"terminado-{i}")
+
+    # Solo los dos últimos terminados; los trabajos en curso no se descartan
+    assert [store.get(f"terminado-{i}") is not None for i in range(5)] == [
+        False, False, False, True, True]
+    assert all(store.get(f"activo-{i}") is not None for i in range(5))
+
+
+def test_memory_job_store_expira_los_terminados(monkeypatch):
+    store = MemoryJobStore(ttl=60, maxsize=10)
+    store.create(_job("activo"))
+    store.create(_job("terminado"))
+    _terminar(store, "terminado")
+
+    ahora = time.monotonic()
+    monkeypatch.setattr("app.utils.ttl_cache.time.monotonic", lambda: ahora + 61)
+
+    assert store.get("terminado") is None
+    assert store.get("activo") is not None
+
+
+class _ExecutorCerrado:
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+
+def test_submit_fallido_borra_el_temporal(monkeypatch, tmp_path):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    monkeypatch.setattr("app.services.import_job_manager.uuid.uuid4",
+                        lambda: SimpleNamespace(hex="job-1"))
+    store = MemoryJobStore()
+    manager = ImportJobManager(job_store=store, executor=_ExecutorCerrado(),
+                               session_factory=lambda: None, constructores={}, logger=logger)
+
+    with pytest.raises(RuntimeError):
+        manager.submit(EnumTipoImportacion.PERSONAS,
+                       UploadFile(file=io.BytesIO(b"id\n1\n"), filename="personas.csv"))
+
+    assert os.listdir(tmp_path) == []
+    assert store.get("job-1").estado == EnumEstadoImportacion.FALLIDO
@@ -0,0 +1,133 @@
+"""
+Las consultas de los repositorios deben usar índices. Cada caso se ejecuta
+sobre el esquema de las migraciones, se capturan los SELECT que emite y se
+corre EXPLAIN QUERY PLAN sobre cada uno; un paso "SCAN <tabla>" sin índice
+que el caso no permite hace fallar el test, igual que un EXPLAIN que no se
+puede ejecutar o un caso que no emitió ningún SELECT.
+"""
+import re
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.config.database import Base
+from app.persistence.repository.familia_repository.impl.familia_repository import FamiliaRepository
+from app.persistence.repository.miembro_familia_repository.impl.miembro_familia_repository import MiembroRepository
+from app.persistence.repository.parcialidad_repository.impl.parcialidad_repository import ParcialidadRepository
+from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+from app.utils.exceptions_handlers.models.error_response import AppException
+
+
+class Caso(NamedTuple):
+    nombre: str
+    ejecutar: Callable[[Session], Any]
+    # Tablas que el caso recorre completas a propósito (listados sin filtro
+    # que avanzan por la llave primaria, búsquedas con LIKE '%x%')
+    recorridos_permitidos: Tuple[str, ...] = ()
+
+
+CASOS: List[Caso] = [
+    Caso("personas.listado", lambda db: PersonaRepository(db).find_all_personas(1, 10, {}),
+         ("Persona",)),
+    Caso("personas.por_parcialidad",
+         lambda db: PersonaRepository(db).find_all_personas(1, 10, {"idParcialidad": 1})),
+    Caso("personas.por_familia",
+         lambda db: PersonaRepository(db).find_all_personas(1, 10, {"idFamilia": 1})),
+    Caso("personas.por_id", lambda db: PersonaRepository(db).find_persona_by_id("10000100")),
+    Caso("familias.por_id", lambda db: FamiliaRepository(db).get_familia_by_id(1)),
+    Caso("familias.con_lider", lambda db: FamiliaRepository(db).get_familias_con_lider(1, 10),
+         ("Familia",)),
+    Caso("familias.busqueda",
+         lambda db: FamiliaRepository(db).search_by_representante(1, 10, "nombre"),
+         ("Familia",)),
+    Caso("familias.busqueda_por_parcialidad",
+         lambda db: FamiliaRepository(db).search_by_representante(1, 10, None, parcialidad_id=1),
+         ("Familia",)),
+    Caso("familias.dashboard", lambda db: FamiliaRepository(db).get_familias_dashboard(1, 10),
+         ("Familia",)),
+    Caso("familias.miembros",
+         lambda db: FamiliaRepository(db).get_miembros_familia(1, None, 1, 10, False)),
+    Caso("familias.resumen", lambda db: FamiliaRepository(db).get_familia_resumen(1)),
+    Caso("miembros.familia_actual",
+         lambda db: MiembroRepository(db).get_familia_actual("10000100")),
+    Caso("miembros.familias_actuales",
+         lambda db: MiembroRepository(db).get_familias_actuales(["10000100", "10000200"])),
+    Caso("miembros.lider", lambda db: MiembroRepository(db).get_lider_familia(1)),
+    Caso("miembros.lider_persona", lambda db: MiembroRepository(db).get_lider_familia_persona(1)),
+    Caso("parcialidades.listado", lambda db: ParcialidadRepository(db).find_by_params(1, 10, {}),
+         ("Parcialidad",)),
+    Caso("parcialidades.por_nombres",
+         lambda db: ParcialidadRepository(db).find_by_names(["Parcialidad 1"])),
+    Caso("parcialidades.por_nombre_parcial",
+         lambda db: ParcialidadRepository(db).find_by_name("Parcialidad"), ("Parcialidad",)),
+]
+
+_SCAN_SQLITE = re.compile(r"^SCAN (\S+)$")
+_SUFIJO_ALIAS = re.compile(r"_\d+$")
+
+
+def capturar_selects(db: Session, ejecutar: Callable[[Session], Any]) -> List[Tuple[str, Any]]:
+    """Ejecuta la operación y devuelve los SELECT (sql, parámetros) que emitió"""
+    conexion = db.connection()
+    sentencias: List[Tuple[str, Any]] = []
+
+    def _registrar(conn, cursor, sql, parametros, contexto, executemany):
+        if not executemany and sql.lstrip().upper().startswith("SELECT"):
+            sentencias.append((sql, parametros))
+
+    event.listen(conexion, "before_cursor_execute", _registrar)
+    try:
+        ejecutar(db)
+    except AppException:
+        # Un error de negocio (p. ej. 404) no invalida las sentencias que
+        # alcanzó a emitir; cualquier otro error hace fallar el caso
+        pass
+    finally:
+        event.remove(conexion, "before_cursor_execute", _registrar)
+    return sentencias
+
+
+def recorridos_completos(db: Session, sql: str, parametros: Any) -> List[str]:
+    """Pasos SCAN sin índice del plan de SQLite, como 'Tabla: detalle'"""
+    conexion = db.connection()
+    tablas = {nombre.lower(): nombre for nombre in Base.metadata.tables}
+
+    def tabla_real(nombre: str) -> Optional[str]:
+        # Los alias de SQLAlchemy son nombre_N (persona_1); los derivados
+        # (anon_1) no son tablas
+        return tablas.get(_SUFIJO_ALIAS.sub("", nombre.strip("`\"")).lower())
+
+    # Los tokens ya están en minúsculas: con LIKE sensible a mayúsculas
+    # SQLite aplica a "token LIKE 'abc%'" el rango sobre el índice, como MySQL
+    conexion.exec_driver_sql("PRAGMA case_sensitive_like = ON")
+    try:
+        plan = conexion.exec_driver_sql("EXPLAIN QUERY PLAN " + sql, parametros).all()
+    finally:
+        conexion.exec_driver_sql("PRAGMA case_sensitive_like = OFF")
+
+    recorridos = []
+    for fila in plan:
+        detalle = fila[-1]
+        coincidencia = _SCAN_SQLITE.match(detalle)
+        tabla = tabla_real(coincidencia.group(1)) if coincidencia else None
+        if tabla:
+            recorridos.append((tabla, detalle))
+    return recorridos
+
+
+@pytest.mark.parametrize("caso", CASOS, ids=[caso.nombre for caso in CASOS])
+def test_consulta_usa_indices(db, censo, caso):
+    censo(familias=3, miembros_por_familia=3)
+
+    sentencias = capturar_selects(db, caso.ejecutar)
+    assert sentencias, f"{caso.nombre} no emitió ningún SELECT"
+
+    fallas = [
+        f"{tabla}: {detalle}\n    {sql}"
+        for sql, parametros in sentencias
+        for tabla, detalle in recorridos_completos(db, sql, parametros)
+        if tabla not in caso.recorridos_permitidos
+    ]
+    assert not fallas, "Recorridos completos sin índice:\n" + "\n".join(fallas)
@@ -0,0 +1,31 @@
+import pytest
+
+from app.persistence.repository.familia_repository.impl.familia_repository import FamiliaRepository
+from app.persistence.repository.persona_repository.impl.persona_repository import PersonaRepository
+from tests.conftest import selects
+
+# Conteo + página, sin importar cuántas filas traiga la página
+LISTADOS = {
+    "get_familias_con_lider": lambda db: FamiliaRepository(db).get_familias_con_lider(1, 100),
+    "search_by_representante": lambda db: FamiliaRepository(db).search_by_representante(1, 100, None),
+    "search_by_representante.texto":
+        lambda db: FamiliaRepository(db).search_by_representante(1, 100, "nombre"),
+    "find_all_personas": lambda db: PersonaRepository(db).find_all_personas(1, 100, {}),
+}
+SENTENCIAS_POR_LISTADO = 2
+
+
+@pytest.mark.parametrize("familias", [1, 100])
+@pytest.mark.parametrize("listado", sorted(LISTADOS))
+def test_listados_sentencias_constantes(db, censo, sentencias, listado, familias):
+    censo(familias=familias, miembros_por_familia=1)
+    db.expunge_all()
+    sentencias.clear()
+
+    resultado = LISTADOS[listado](db)
+
+    # Serializar la página no debe disparar lazy loads por fila
+    for item in resultado["items"]:
+        item.model_dump()
+    assert len(resultado["items"]) == familias
+    assert len(selects(sentencias)) == SENTENCIAS_POR_LISTADO
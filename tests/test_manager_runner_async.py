@@ -0,0 +1,46 @@
+import asyncio
+import logging
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config.database import async_database_url
+from app.ioc.container import build_parcialidad_manager
+from app.models.inputs.parcialidad.parcialidad_create import ParcialidadCreate
+from app.persistence.model.parcialidad import Parcialidad
+from app.services.manager_runner import ManagerRunner
+from app.utils.enviroment import settings
+from app.utils.exceptions_handlers.models.error_response import AppException
+
+logger = logging.getLogger(__name__)
+
+
+def test_manager_runner_sobre_aiosqlite(db):
+    """DB_MODE=async: el manager corre en AsyncSession.run_sync sobre aiosqlite"""
+
+    async def correr():
+        engine = create_async_engine(async_database_url(settings.database_url))
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as sesion:
+                runner = ManagerRunner(build_parcialidad_manager, sesion, logger)
+                await runner.run(lambda manager: manager.create(
+                    ParcialidadCreate(nombre_parcialidad="Parcialidad async")))
+
+            async with AsyncSession(engine, expire_on_commit=False) as sesion:
+                runner = ManagerRunner(build_parcialidad_manager, sesion, logger)
+                pagina = await runner.run(
+                    lambda manager: manager.get_parcialidades(1, 10, {}))
+                leida = await runner.run(
+                    lambda manager: manager.get_parcialidad_by_id(pagina.items[0].id))
+                with pytest.raises(AppException):
+                    await runner.run(lambda manager: manager.get_parcialidad_by_id(-1))
+            return leida
+        finally:
+            # Sin dispose el hilo de la conexión aiosqlite retiene el proceso
+            await engine.dispose()
+
+    leida = asyncio.run(correr())
+
+    assert leida.nombre == "Parcialidad async"
+    # La UnitOfWork confirmó la escritura: se ve desde la sesión síncrona
+    assert db.query(Parcialidad).filter(Parcialidad.id == leida.id).count() == 1